@@ -0,0 +1,295 @@
+"""
+Throughput benchmarks for ingestion, training and evaluation in train_models.py.
+
+The checked-in cleaned datasets (models/*/cleaned/*.csv) are replicated to each
+requested size; every case reports rows/sec and peak traced memory, and the run
+is compared against a stored baseline. Exits with status 1 on a regression.
+
+    python -m training.benchmark --sizes 10k,100k --save-baseline
+    python -m training.benchmark --sizes 10k,100k --threshold 0.2
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from training import train_models
+
+ROOT = Path(__file__).resolve().parents[1]
+MODELS_DIR = ROOT / "training" / "models"
+RESULTS_PATH = ROOT / "training" / "reports" / "benchmark.json"
+BASELINE_PATH = ROOT / "training" / "benchmark_baseline.json"
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+# Fractional slowdown (rows/sec) or growth (peak MB) against the baseline that counts as a regression
+DEFAULT_THRESHOLD = 0.2
+# predict_category scores one row at a time in Python, so it runs on at most this many rows per size
+PREDICT_SAMPLE_ROWS = 20_000
+
+
+@dataclass
+class BenchmarkData:
+    """Replicated cleaned datasets for one size, plus a categorizer fitted on the checked-in rows."""
+
+    rows: int
+    transactions: pd.DataFrame
+    transactions_csv: Path
+    spending: pd.DataFrame
+    budget: pd.DataFrame
+    goals: pd.DataFrame
+    categorizer: tuple
+    compiled: train_models.CompiledCategorizer
+
+
+def parse_sizes(text: str) -> List[int]:
+    """``--sizes`` as row counts; empty entries are skipped."""
+    sizes = [train_models.parse_row_count(size) for size in text.split(",") if size.strip()]
+    if not sizes:
+        raise argparse.ArgumentTypeError("no row counts given")
+    return sizes
+
+
+def replicate(df: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """``df`` tiled (and truncated) to exactly ``rows`` rows."""
+    if df.empty:
+        return df
+    return df.iloc[np.resize(np.arange(len(df)), rows)].reset_index(drop=True)
+
+
+def load_cleaned(model: str, name: str, **kwargs) -> pd.DataFrame:
+    path = MODELS_DIR / model / "cleaned" / name
+    if not path.exists():
+        return pd.DataFrame()
+    return pd.read_csv(path, **kwargs)
+
+
+def load_base_data() -> Dict[str, pd.DataFrame]:
+    transactions = load_cleaned("transaction_categorizer", "transactions_clean.csv")
+    transactions["date"] = pd.to_datetime(transactions["date"], errors="coerce")
+    spending = load_cleaned("spending_forecaster", "spending_clean.csv")
+    spending["date"] = pd.to_datetime(spending["date"], errors="coerce", utc=True).dt.tz_localize(None)
+    goals = load_cleaned("goal_predictor", "goal_savings_clean.csv")
+    # No cleaned budget export is checked in; use the raw share matrix when its sources are available
+    budget = train_models.budget_share_frame()
+    return {"transactions": transactions, "spending": spending, "goals": goals, "budget": budget}
+
+
+def prepare(base: Dict[str, pd.DataFrame], rows: int, workdir: Path) -> BenchmarkData:
+    transactions = replicate(base["transactions"], rows)
+    transactions_csv = workdir / f"transactions-{rows}.csv"
+    transactions.to_csv(transactions_csv, index=False)
+    goals = replicate(base["goals"], rows)
+    categorizer = train_models.build_categorizer_model(base["transactions"])
+    return BenchmarkData(
+        rows=rows,
+        transactions=transactions,
+        transactions_csv=transactions_csv,
+        spending=replicate(base["spending"], rows),
+        budget=replicate(base["budget"], rows),
+        goals=train_models.with_income_brackets(goals) if not goals.empty else goals,
+        categorizer=categorizer,
+        compiled=train_models.compile_categorizer(*categorizer),
+    )
+
+
+def bench_build_transaction_dataset(data: BenchmarkData) -> int:
+    # The read/clean/balance path of build_transaction_dataset, without the Parquet cache
+    mapping = {key: key for key in ["date", "description", "amount", "category", "type"]}
+    train_models.clean_transaction_sources([{"path": data.transactions_csv, "map": mapping}])
+    return data.rows
+
+
+def bench_predict_category(data: BenchmarkData) -> int:
+    sample = data.transactions.head(PREDICT_SAMPLE_ROWS)
+    for description, amount in zip(sample["description"].astype(str), sample["amount"]):
+        train_models.predict_category(description, amount, *data.categorizer)
+    return len(sample)
+
+
+def bench_score_batch(data: BenchmarkData) -> int:
+    train_models.score_batch(data.transactions["description"].astype(str), data.transactions["amount"], data.compiled)
+    return data.rows
+
+
+def bench_evaluate_budget_allocator(data: BenchmarkData) -> int:
+    train_df, test_df = train_models.random_split(data.budget, test_frac=0.2, seed=42)
+    train_models.budget_holdout_metrics(train_df, test_df)
+    return len(data.budget)
+
+
+def bench_evaluate_goal_predictor(data: BenchmarkData) -> int:
+    train_df, test_df = train_models.random_split(data.goals, test_frac=0.2, seed=42)
+    train_models.goal_holdout_metrics(train_df, test_df)
+    return len(data.goals)
+
+
+def frame_case(function: Callable[[pd.DataFrame], object], frame: str) -> Callable[[BenchmarkData], int]:
+    def run(data: BenchmarkData) -> int:
+        df = getattr(data, frame)
+        function(df)
+        return len(df)
+
+    return run
+
+
+CASES: Dict[str, Callable[[BenchmarkData], int]] = {
+    "build_transaction_dataset": bench_build_transaction_dataset,
+    "train_transaction_categorizer": frame_case(train_models.train_transaction_categorizer, "transactions"),
+    "predict_category": bench_predict_category,
+    "score_batch": bench_score_batch,
+    "train_anomaly_detector": frame_case(train_models.train_anomaly_detector, "transactions"),
+    "train_spending_forecaster": frame_case(train_models.train_spending_forecaster, "spending"),
+    "evaluate_transaction_categorizer": frame_case(train_models.evaluate_transaction_categorizer, "transactions"),
+    "evaluate_spending_forecaster": frame_case(train_models.evaluate_spending_forecaster, "spending"),
+    "evaluate_anomaly_detector": frame_case(train_models.evaluate_anomaly_detector, "transactions"),
+    "evaluate_budget_allocator": bench_evaluate_budget_allocator,
+    "evaluate_goal_predictor": bench_evaluate_goal_predictor,
+}
+# Cases whose input is empty when the matching dataset is unavailable
+CASE_FRAMES = {"evaluate_budget_allocator": "budget", "evaluate_goal_predictor": "goals"}
+
+
+def run_case(case: str, data: BenchmarkData, repeat: int, memory: bool) -> Optional[Dict]:
+    """Best-of-``repeat`` untraced timing, then one tracemalloc run for the peak."""
+    frame = CASE_FRAMES.get(case)
+    if frame is not None and getattr(data, frame).empty:
+        return None
+    function = CASES[case]
+    best = float("inf")
+    rows = 0
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        rows = function(data)
+        best = min(best, time.perf_counter() - started)
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        try:
+            function(data)
+            peak_mb = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+        finally:
+            tracemalloc.stop()
+    return {
+        "case": case,
+        "size": data.rows,
+        "rows": rows,
+        "seconds": round(best, 4),
+        "rows_per_sec": round(rows / best, 1) if best > 0 else None,
+        "peak_mb": peak_mb,
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Describe every result that is slower or larger than its baseline by more than ``threshold``."""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if previous.get("rows_per_sec") and result["rows_per_sec"] is not None:
+            if result["rows_per_sec"] < previous["rows_per_sec"] * (1 - threshold):
+                regressions.append(
+                    f"{key}: {result['rows_per_sec']:.0f} rows/s vs baseline {previous['rows_per_sec']:.0f}"
+                )
+        if previous.get("peak_mb") and result["peak_mb"] is not None:
+            if result["peak_mb"] > previous["peak_mb"] * (1 + threshold):
+                regressions.append(f"{key}: {result['peak_mb']} MB peak vs baseline {previous['peak_mb']}")
+    return regressions
+
+
+def print_results(results: Dict[str, Dict], baseline: Dict[str, Dict]) -> None:
+    print(f"{'case':34} {'size':>10} {'rows/s':>14} {'peak MB':>10} {'vs base':>8}")
+    for key, result in results.items():
+        previous = baseline.get(key, {}).get("rows_per_sec")
+        change = f"{result['rows_per_sec'] / previous - 1:+.0%}" if previous and result["rows_per_sec"] else ""
+        peak = result["peak_mb"] if result["peak_mb"] is not None else "-"
+        print(f"{result['case']:34} {result['size']:>10} {result['rows_per_sec'] or 0:>14,.0f} {peak:>10} {change:>8}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark train_models ingestion, training and evaluation.")
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated row counts, e.g. 10k,100k,1m,10m.",
+    )
+    parser.add_argument("--cases", help=f"Comma-separated subset of: {', '.join(CASES)}.")
+    parser.add_argument("--repeat", type=int, default=1, help="Timed runs per case; the fastest is reported.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed fractional drop in rows/sec (or growth in peak MB) before a case counts as a regression.",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run's results as the new baseline.")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc run for peak memory.")
+    args = parser.parse_args()
+
+    sizes = args.sizes
+    cases = [case.strip() for case in args.cases.split(",")] if args.cases else list(CASES)
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        raise SystemExit(f"Unknown benchmark cases: {', '.join(unknown)}")
+
+    # Benchmarks measure the trainers, not the caches and pools around them
+    train_models.DATASET_CACHE_ENABLED = False
+    train_models.INGEST_WORKERS = 1
+    base = load_base_data()
+    if base["transactions"].empty or base["spending"].empty:
+        raise SystemExit(f"Cleaned datasets not found under {MODELS_DIR}; run pipeline.py clean first.")
+
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="uniguard-bench-") as workdir:
+        for size in sizes:
+            data = prepare(base, size, Path(workdir))
+            for case in cases:
+                result = run_case(case, data, args.repeat, not args.no_memory)
+                if result is None:
+                    print(f"{case} @ {size}: skipped (no input data)")
+                    continue
+                results[f"{case}@{size}"] = result
+            data.transactions_csv.unlink(missing_ok=True)
+
+    try:
+        baseline = json.loads(args.baseline.read_text()).get("results", {})
+    except (OSError, json.JSONDecodeError):
+        baseline = {}
+    print_results(results, baseline)
+
+    payload = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+    RESULTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    train_models.write_json(RESULTS_PATH, payload)
+    print("Results written to:", RESULTS_PATH)
+    if args.save_baseline:
+        train_models.write_json(args.baseline, payload)
+        print("Baseline written to:", args.baseline)
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print("REGRESSION", regression)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
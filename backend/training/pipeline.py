@@ -1,14 +1,24 @@
 import argparse
 import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 
-from training import train_models
+import numpy as np
+import pandas as pd
+
+from training import serve, train_models
 
 ROOT = Path(__file__).resolve().parents[1]
 MODELS_DIR = ROOT / "training" / "models"
 DATA_DIR = ROOT / "training" / "data"
 MANIFEST_PATH = DATA_DIR / "datasets_manifest.json"
+SCORE_CHUNK_ROWS = 100_000
+SCORE_TOP_K = 3
+# Artifacts loaded once per scoring process by init_scoring_worker
+SCORING_MODELS: Optional[serve.ServingModels] = None
 
 
 def load_model_datasets(model: str) -> List[str]:
@@ -28,7 +38,7 @@ def load_all_datasets() -> List[str]:
     return sorted(set(datasets))
 
 
-def download_datasets(datasets: List[str]) -> Dict[str, str]:
+def download_datasets(datasets: List[str], manifest_path: Path = MANIFEST_PATH) -> Dict[str, str]:
     try:
         import kagglehub  # type: ignore
     except Exception as exc:  # pragma: no cover - import guard
@@ -37,13 +47,13 @@ def download_datasets(datasets: List[str]) -> Dict[str, str]:
             "python3 -m pip install kagglehub"
         ) from exc
 
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
     manifest: Dict[str, str] = {}
     for dataset in datasets:
         path = kagglehub.dataset_download(dataset)
         manifest[dataset] = str(path)
         print(f"Downloaded {dataset} -> {path}")
-    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+    manifest_path.write_text(json.dumps(manifest, indent=2))
     return manifest
 
 
@@ -53,9 +63,178 @@ def export_clean(model: str) -> None:
     train_models.export_clean_datasets(model, export_dir)
     print("Cleaned data written to:", export_dir)
 
+
+def train_parallel(models: List[str], jobs: int) -> None:
+    """Train models in a process pool from one shared load of the cleaned datasets.
+
+    Artifacts, metadata and the merged report are written only after every
+    trainer has finished, so a failed model leaves the previous outputs untouched.
+    Models whose build cache entry is current are not retrained.
+    """
+    paths = train_models.resolve_dataset_paths()
+    train_models.DATASET_PATHS = paths
+    full_run = set(models) == set(train_models.MODEL_ARTIFACTS)
+    train_models.STAGE_TIMINGS.clear()
+    cache, keys, stale = train_models.stale_models(models, full_run)
+    if not stale:
+        print("Artifacts up to date in:", train_models.ARTIFACTS_DIR)
+        return
+    empty = pd.DataFrame()
+    needs_transactions = any(model in train_models.TRANSACTION_MODELS for model in stale)
+    needs_spending = any(model in train_models.SPENDING_MODELS for model in stale)
+    transactions = train_models.build_transaction_dataset() if needs_transactions else empty
+    spending = train_models.build_spending_dataset() if needs_spending else empty
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=train_models.set_dataset_paths,
+        initargs=(paths, train_models.worker_settings()),
+    ) as pool:
+        futures = {
+            model: pool.submit(
+                train_models.train_and_evaluate,
+                model,
+                transactions if model in train_models.TRANSACTION_MODELS else empty,
+                spending if model in train_models.SPENDING_MODELS else empty,
+                full_run,
+            )
+            for model in stale
+        }
+        results = {model: future.result() for model, future in futures.items()}
+
+    train_models.ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+    for model in stale:
+        content, metrics, timings, stats = results[model]
+        train_models.merge_stage_timings(timings)
+        train_models.write_model_artifact(model, content)
+        rows = train_models.model_rows(model, transactions, spending)
+        train_models.record_build(cache, model, keys[model], content, rows, metrics)
+        if stats is not None:
+            train_models.save_categorizer_state(stats)
+    train_models.save_build_cache(cache)
+    if full_run:
+        train_models.REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        train_models.write_training_metadata()
+        metrics = {model: results[model][1] if model in results else cache[model]["metrics"] for model in models}
+        train_models.write_training_report(
+            train_models.report_rows(cache, stale, train_models.TRANSACTION_MODELS, transactions),
+            train_models.report_rows(cache, stale, train_models.SPENDING_MODELS, spending),
+            metrics,
+        )
+    print("Artifacts written to:", train_models.ARTIFACTS_DIR)
+
+
+def scoring_columns(header: List[str]) -> Dict[str, str]:
+    """Input column holding each of ``description`` and ``amount``, matched case-insensitively."""
+    by_name = {col.strip().lower(): col for col in header}
+    missing = [key for key in ("description", "amount") if key not in by_name]
+    if missing:
+        raise SystemExit(f"Input is missing column(s): {', '.join(missing)} (found: {', '.join(header)}).")
+    return {key: by_name[key] for key in ("description", "amount")}
+
+
+def init_scoring_worker(artifacts_dir: Path) -> None:
+    global SCORING_MODELS
+    SCORING_MODELS = serve.load_serving_models(artifacts_dir)
+
+
+def score_chunk(chunk: pd.DataFrame, columns: Dict[str, str]) -> pd.DataFrame:
+    """Input rows plus their top-3 categories and the anomaly flag for the top category."""
+    models = SCORING_MODELS
+    amounts = pd.to_numeric(chunk[columns["amount"]], errors="coerce").to_numpy(dtype=np.float64)
+    descriptions = chunk[columns["description"]].fillna("").astype(str).tolist()
+    # Rows without a numeric amount are categorized from the description alone and never flagged
+    _, top = train_models.score_batch(descriptions, np.nan_to_num(amounts), models.categorizer, k=SCORE_TOP_K)
+    scored = chunk.copy()
+    for rank in range(SCORE_TOP_K):
+        scored[f"top{rank + 1}_category"] = top[:, rank] if rank < top.shape[1] else None
+    flagged, scores, _ = serve.anomaly_scores(models.anomaly, scored["top1_category"].tolist(), amounts)
+    scored["is_anomaly"] = flagged
+    scored["anomaly_score"] = np.round(scores, 4)
+    return scored
+
+
+def scored_chunks(
+    chunks: Iterator[pd.DataFrame],
+    columns: Dict[str, str],
+    jobs: int,
+    artifacts_dir: Path,
+) -> Iterator[pd.DataFrame]:
+    """Score chunks in input order, keeping at most two chunks per worker in flight."""
+    if jobs <= 1:
+        init_scoring_worker(artifacts_dir)
+        for chunk in chunks:
+            yield score_chunk(chunk, columns)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_scoring_worker, initargs=(artifacts_dir,)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(score_chunk, chunk, columns))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def write_scored_parquet(path: Path, chunks: Iterator[pd.DataFrame], columns: List[str]) -> int:
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except Exception as exc:  # pragma: no cover - import guard
+        raise SystemExit("Missing pyarrow. Install it with: python3 -m pip install pyarrow (or write a .csv output).") from exc
+
+    # Fixed schema, so a chunk whose text column is all empty cannot change a column's type
+    fields = [pa.field(col, pa.string()) for col in columns]
+    fields += [pa.field(f"top{rank + 1}_category", pa.string()) for rank in range(SCORE_TOP_K)]
+    fields += [pa.field("is_anomaly", pa.bool_()), pa.field("anomaly_score", pa.float64())]
+    schema = pa.schema(fields)
+    rows = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for chunk in chunks:
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+    return rows
+
+
+def write_scored_csv(path: Path, chunks: Iterator[pd.DataFrame]) -> int:
+    rows = 0
+    for idx, chunk in enumerate(chunks):
+        chunk.to_csv(path, mode="w" if idx == 0 else "a", header=idx == 0, index=False)
+        rows += len(chunk)
+    return rows
+
+
+def score_file(input_path: Path, output_path: Path, jobs: int, chunk_rows: int, artifacts_dir: Path) -> int:
+    """Stream ``input_path`` through the categorizer and anomaly detector into ``output_path``.
+
+    Memory is bounded by ``chunk_rows`` times the chunks in flight. Output goes to a
+    temporary file that replaces ``output_path`` only once every chunk is written.
+    """
+    try:
+        _, header = train_models.sniff_csv_header(input_path)
+    except OSError as exc:
+        raise SystemExit(f"Cannot read {input_path}: {exc}") from exc
+    columns = scoring_columns(header)
+    # Pass-through columns stay text, so every chunk has the same types
+    chunks = train_models.iter_csv_chunks(input_path, chunk_rows, dtype={col: str for col in header})
+    scored = scored_chunks(chunks, columns, jobs, artifacts_dir)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        if output_path.suffix.lower() == ".parquet":
+            rows = write_scored_parquet(tmp_path, scored, header)
+        else:
+            rows = write_scored_csv(tmp_path, scored)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(output_path)
+    return rows
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Per-model training pipeline.")
-    parser.add_argument("step", choices=["download", "clean", "train"])
+    parser.add_argument("step", choices=["download", "clean", "train", "score"])
     parser.add_argument(
         "--model",
         default="all",
@@ -68,13 +247,37 @@ def main() -> None:
             "anomaly_detector",
         ],
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the train and score steps.",
+    )
+    train_models.add_training_arguments(parser)
+    parser.add_argument("--input", type=Path, help="Transaction CSV with description and amount columns (score step).")
+    parser.add_argument("--output", type=Path, help="Scored output, .parquet or .csv (score step).")
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=SCORE_CHUNK_ROWS,
+        help="Rows read, scored and written per chunk (score step).",
+    )
     args = parser.parse_args()
+    train_models.apply_training_arguments(args)
 
     if args.step == "download":
         datasets = load_all_datasets() if args.model == "all" else load_model_datasets(args.model)
         if not datasets:
             raise SystemExit(f"No datasets configured for model '{args.model}'.")
-        download_datasets(datasets)
+        download_datasets(datasets, args.manifest)
+        return
+
+    if args.step == "score":
+        if args.input is None or args.output is None:
+            parser.error("score needs --input and --output")
+        started = time.perf_counter()
+        rows = score_file(args.input, args.output, args.jobs, max(1, args.chunk_rows), train_models.ARTIFACTS_DIR)
+        print(f"Scored {rows:,} rows in {time.perf_counter() - started:.1f}s ->", args.output)
         return
 
     if args.model == "all":
@@ -94,6 +297,12 @@ def main() -> None:
         return
 
     if args.step == "train":
+        if args.incremental is not None:
+            train_models.run_incremental_training(args.incremental)
+            return
+        if args.jobs > 1:
+            train_parallel(models, args.jobs)
+            return
         for model in models:
             train_models.DATASET_PATHS = train_models.resolve_dataset_paths()
             train_models.run_training(model)
@@ -58,7 +58,12 @@ def build_html(report: dict) -> str:
             else:
                 ok = _metric_ok(key, val, target, lower_is_better=False) if target is not None else True
             target_str = f" (target: {target})" if target is not None else ""
-            rows.append(f"<tr><td>{key}</td><td>{val}</td><td>{target_str}</td><td>{'✓' if ok else '—'}</td></tr>")
+            ci = m.get("ci95", {}).get(key)
+            ci_str = f' <span class="ci">[{ci[0]}, {ci[1]}]</span>' if ci else ""
+            cv = m.get("cv", {}).get("metrics", {}).get(key)
+            if cv:
+                ci_str += f' <span class="ci">cv {cv["mean"]} ± {cv["std"]}</span>'
+            rows.append(f"<tr><td>{key}</td><td>{val}{ci_str}</td><td>{target_str}</td><td>{'✓' if ok else '—'}</td></tr>")
         if not rows:
             rows.append("<tr><td colspan='4'>No metrics</td></tr>")
         cards.append(
@@ -71,6 +76,19 @@ def build_html(report: dict) -> str:
             """
         )
 
+    bootstrap = report.get("bootstrap")
+    ci_note = (
+        f'<p class="meta">Bracketed ranges are 95% bootstrap intervals over {bootstrap.get("resamples")} resamples of each holdout.</p>'
+        if bootstrap
+        else ""
+    )
+    cross_validation = report.get("cross_validation")
+    if cross_validation:
+        ci_note += (
+            f'<p class="meta">cv values are mean ± std over {cross_validation.get("folds")} folds '
+            "(rolling-origin for time-ordered models, k-fold for budget and goal).</p>"
+        )
+
     # Confusion matrix (transaction_categorizer)
     cm = metrics.get("transaction_categorizer", {}).get("confusion_matrix", {})
     cm_rows = []
@@ -98,6 +116,84 @@ def build_html(report: dict) -> str:
         </div>
         """
 
+    # Threshold sweep (anomaly_detector)
+    anomaly = metrics.get("anomaly_detector", {})
+    curve = anomaly.get("pr_curve", [])
+    sweep_table = ""
+    if curve:
+        best = anomaly.get("best_threshold")
+        sweep_rows = []
+        for point in curve:
+            cls = "diag" if point["threshold"] == best else ""
+            sweep_rows.append(
+                f'<tr><th>{point["threshold"]}</th><td class="{cls}">{point["precision"]}</td>'
+                f'<td class="{cls}">{point["recall"]}</td><td class="{cls}">{point["alert_rate"]}</td>'
+                f'<td class="{cls}">{point["f1"]}</td></tr>'
+            )
+        sweep_table = f"""
+        <div class="card wide">
+            <h3>Anomaly Detector — Threshold Sweep (best F1: {best})</h3>
+            <div class="table-wrap">
+                <table class="confusion">
+                    <thead><tr><th>Threshold</th><th>Precision</th><th>Recall</th><th>Alert rate</th><th>F1</th></tr></thead>
+                    <tbody>{''.join(sweep_rows)}</tbody>
+                </table>
+            </div>
+        </div>
+        """
+
+    # Rolling-origin backtest (spending_forecaster)
+    backtest = metrics.get("spending_forecaster", {}).get("backtest", {})
+    backtest_table = ""
+    if backtest.get("by_horizon"):
+        horizon_rows = "".join(
+            f'<tr><th>{row["horizon"]}</th><td>{row["samples"]}</td><td>{row["mae"]}</td>'
+            f'<td>{row["mape"]}</td><td>{row["directional_accuracy"]}</td></tr>'
+            for row in backtest["by_horizon"]
+        )
+        backtest_table = f"""
+        <div class="card wide">
+            <h3>Spending Forecaster — Backtest by Horizon ({backtest.get("origins")} origins)</h3>
+            <div class="table-wrap">
+                <table class="confusion">
+                    <thead><tr><th>Horizon (months)</th><th>Samples</th><th>MAE</th><th>MAPE</th><th>Directional</th></tr></thead>
+                    <tbody>{horizon_rows}</tbody>
+                </table>
+            </div>
+        </div>
+        """
+
+    # Per-stage timings (wall/CPU seconds, peak traced memory, rows)
+    timings = report.get("timings", [])
+    timings_section = ""
+    if timings:
+        max_seconds = max(record["seconds"] for record in timings) or 1
+        stage_rows = []
+        for record in timings:
+            name = record["stage"]
+            indent = 1.25 * record.get("depth", 0)
+            peak = record["peak_mb"] if record.get("peak_mb") is not None else "—"
+            rows_in = record["rows_in"] if record.get("rows_in") is not None else "—"
+            rows_out = record["rows_out"] if record.get("rows_out") is not None else "—"
+            stage_rows.append(
+                f'<tr><th style="text-align: left; padding-left: {indent + 0.35}rem;">{name}</th>'
+                f'<td>{record["calls"]}</td><td>{record["seconds"]:.3f}</td><td>{record["cpu_seconds"]:.3f}</td>'
+                f"<td>{peak}</td><td>{rows_in}</td><td>{rows_out}</td>"
+                f'<td class="timing-bar"><div class="bar"><div class="bar-fill" '
+                f'style="width: {_bar_width(record["seconds"], max_seconds)};"></div></div></td></tr>'
+            )
+        timings_section = f"""
+    <h2 style="font-size: 1.1rem; margin-bottom: 0.5rem;">Stage timings</h2>
+    <div class="card wide">
+        <div class="table-wrap">
+            <table class="confusion">
+                <thead><tr><th>Stage</th><th>Calls</th><th>Wall s</th><th>CPU s</th><th>Peak MB</th><th>Rows in</th><th>Rows out</th><th>Wall time</th></tr></thead>
+                <tbody>{''.join(stage_rows)}</tbody>
+            </table>
+        </div>
+    </div>
+    """
+
     # Dataset size bars (visual)
     tx_rows = ds.get("transactions_rows", 0)
     sp_rows = ds.get("spending_rows", 0)
@@ -128,6 +224,7 @@ def build_html(report: dict) -> str:
         .samples {{ font-size: 0.8rem; color: var(--muted); margin-bottom: 0.5rem; }}
         table.metrics {{ width: 100%; font-size: 0.85rem; border-collapse: collapse; }}
         table.metrics td, table.metrics th {{ padding: 0.25rem 0.5rem; text-align: left; }}
+        .ci {{ color: var(--muted); font-size: 0.75rem; }}
         table.confusion {{ font-size: 0.75rem; border-collapse: collapse; }}
         table.confusion th, table.confusion td {{ padding: 0.35rem; text-align: center; border: 1px solid #27272a; min-width: 2.5rem; }}
         table.confusion td.diag {{ background: rgba(34, 197, 94, 0.2); }}
@@ -137,6 +234,7 @@ def build_html(report: dict) -> str:
         .bar {{ height: 1.25rem; background: #27272a; border-radius: 4px; overflow: hidden; margin: 0.25rem 0; }}
         .bar-fill {{ height: 100%; background: var(--accent); }}
         .bar-label {{ font-size: 0.8rem; display: flex; justify-content: space-between; margin-bottom: 0.15rem; }}
+        td.timing-bar {{ min-width: 10rem; }}
     </style>
 </head>
 <body>
@@ -154,10 +252,14 @@ def build_html(report: dict) -> str:
     </section>
 
     <h2 style="font-size: 1.1rem; margin-bottom: 0.5rem;">Model metrics</h2>
+    {ci_note}
     <div class="cards">
         {''.join(cards)}
     </div>
     {confusion_table}
+    {sweep_table}
+    {backtest_table}
+    {timings_section}
 </body>
 </html>
 """
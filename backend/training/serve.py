@@ -0,0 +1,508 @@
+"""
+Local HTTP inference service for the trained model artifacts.
+
+The artifacts under frontend/src/lib/ai/models/artifacts (and the compact
+categorizer file, when the build emitted one) are loaded once at startup.
+Every endpoint takes a batch of items as JSON. Items from concurrent requests
+are coalesced into one vectorized call per endpoint: a batch closes when
+``--max-batch`` items are waiting or ``--max-wait-ms`` has passed.
+
+    python -m training.serve --port 8765
+    curl -s localhost:8765/v1/categorize \\
+        -d '{"transactions": [{"description": "Shell Gas Station", "amount": 42.5}]}'
+
+Endpoints (POST unless noted):
+    /v1/categorize     {"transactions": [{"description", "amount"}]} -> {"categories": [...]}
+    /v1/top-k          {"transactions": [...], "k": 3}               -> {"categories": [[...]]}
+    /v1/anomaly-score  {"transactions": [{"category", "amount"}]}    -> {"results": [{"isAnomaly", "anomalyScore", "severity"}]}
+    /v1/forecast       {"forecasts": [{"category", "month"}]}        -> {"results": [{"predictedAmount", "seasonalFactor"}]}
+    /v1/savings-rate   {"incomes": [...]}                            -> {"rates": [...]}
+    /health            (GET) loaded models and artifact paths
+"""
+import argparse
+import ast
+import asyncio
+import base64
+import json
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from training import train_models
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 4096
+DEFAULT_MAX_WAIT_MS = 2.0
+MAX_TOP_K = 10
+MAX_BODY_BYTES = 16 * 2**20
+MAX_ITEMS_PER_REQUEST = 100_000
+
+# Mirrors the trained-norms branch of frontend/src/lib/ai/models/anomaly-detector.ts
+ANOMALY_THRESHOLD_SCALE = 1.0
+ANOMALY_THRESHOLD_KEYS = ("p98", "p97", "p95", "p90")
+# Income bracket upper bounds and labels used by goal-predictor.ts
+SAVINGS_BRACKETS = (20_000, 50_000, 100_000, 200_000, 500_000)
+SAVINGS_BRACKET_LABELS = ("<20k", "20-50k", "50-100k", "100-200k", "200-500k", "500k+")
+
+TS_EXPORT_PATTERN = re.compile(r"^export const (\w+)(?::[^=]+)? = (.*?)(?: as const)?;$", re.MULTILINE)
+
+
+class RequestError(ValueError):
+    """A client error, answered with ``status`` and the message as JSON."""
+
+    def __init__(self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+def read_ts_exports(path: Path) -> Dict[str, object]:
+    """Values of the ``export const`` lines in an artifact module written by train_models."""
+    if not path.exists():
+        return {}
+    exports = {}
+    for name, value in TS_EXPORT_PATTERN.findall(path.read_text()):
+        exports[name] = None if value == "null" else ast.literal_eval(value)
+    return exports
+
+
+def decode_uint16(encoded: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(encoded), dtype="<u2")
+
+
+def compact_categorizer_weights(payload: Dict) -> tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, float]], Dict[str, float]]:
+    """Token weights, amount weights and priors from ``compact_categorizer_payload`` output."""
+    vocabulary = payload["vocabulary"]
+    token_ids = decode_uint16(payload["tokenIds"])
+    token_values = decode_uint16(payload["tokenWeights"])
+    offsets = payload["tokenOffsets"]
+    token_weights: Dict[str, Dict[str, float]] = {}
+    for idx, category in enumerate(payload["categories"]):
+        start, stop = offsets[idx], offsets[idx + 1]
+        if stop > start:
+            scale = payload["tokenScales"][idx]
+            token_weights[category] = {
+                vocabulary[token]: float(value) * scale
+                for token, value in zip(token_ids[start:stop], token_values[start:stop])
+            }
+    weights = {category: w for category, w in zip(payload["categories"], payload["weights"]) if w}
+    priors = {category: p for category, p in zip(payload["categories"], payload["priors"]) if p is not None}
+    return token_weights, weights, priors
+
+
+@dataclass
+class AnomalyTable:
+    """Per-category anomaly statistics as arrays indexed by ``categories``."""
+
+    categories: Dict[str, int]
+    median: np.ndarray
+    mad: np.ndarray
+    threshold: np.ndarray
+
+
+@dataclass
+class ServingModels:
+    categorizer: train_models.CompiledCategorizer
+    anomaly: AnomalyTable
+    averages: Dict[str, float]
+    seasonality: Dict[str, Dict[int, float]]
+    savings_rates: np.ndarray
+    sources: Dict[str, str]
+
+
+def anomaly_table(stats: Dict[str, Dict]) -> AnomalyTable:
+    categories = sorted(stats)
+    threshold = [
+        next((stats[cat][key] for key in ANOMALY_THRESHOLD_KEYS if stats[cat].get(key) is not None), np.nan)
+        for cat in categories
+    ]
+    return AnomalyTable(
+        categories={cat: idx for idx, cat in enumerate(categories)},
+        median=np.array([stats[cat]["median"] for cat in categories], dtype=np.float64),
+        mad=np.array([stats[cat]["mad"] for cat in categories], dtype=np.float64),
+        threshold=np.array(threshold, dtype=np.float64),
+    )
+
+
+def load_serving_models(artifacts_dir: Path = train_models.ARTIFACTS_DIR) -> ServingModels:
+    """Read every artifact once; missing artifacts load as empty models."""
+    paths = {model: artifacts_dir / name for model, name in train_models.MODEL_ARTIFACTS.items()}
+    categorizer = read_ts_exports(paths["transaction_categorizer"])
+    compact_file = categorizer.get("trainedCategoryCompactArtifact")
+    if compact_file:
+        paths["transaction_categorizer"] = train_models.COMPACT_ARTIFACTS_DIR / str(compact_file)
+        weights = compact_categorizer_weights(json.loads(paths["transaction_categorizer"].read_text()))
+    else:
+        weights = (
+            categorizer.get("trainedCategoryTokenWeights", {}),
+            categorizer.get("trainedCategoryWeights", {}),
+            categorizer.get("trainedCategoryPriors", {}),
+        )
+    forecaster = read_ts_exports(paths["spending_forecaster"])
+    rates = read_ts_exports(paths["goal_predictor"]).get("trainedSavingsRates", {})
+    return ServingModels(
+        categorizer=train_models.compile_categorizer(*weights),
+        anomaly=anomaly_table(read_ts_exports(paths["anomaly_detector"]).get("trainedCategoryStats", {})),
+        averages=forecaster.get("trainedAverages", {}),
+        seasonality=forecaster.get("trainedSeasonality", {}),
+        savings_rates=np.array([rates.get(label, 0.0) for label in SAVINGS_BRACKET_LABELS], dtype=np.float64),
+        sources={model: str(path) for model, path in paths.items() if model != "budget_allocator"},
+    )
+
+
+def categorize_batch(models: ServingModels, items: Sequence[Tuple[str, float]]) -> List[Tuple[str, List[str]]]:
+    """Best category and the top ``MAX_TOP_K`` categories for each (description, amount)."""
+    descriptions = [description for description, _ in items]
+    amounts = np.array([amount for _, amount in items], dtype=np.float64)
+    best, top = train_models.score_batch(descriptions, amounts, models.categorizer, k=MAX_TOP_K)
+    return list(zip(best.tolist(), top.tolist()))
+
+
+def anomaly_scores(table: AnomalyTable, categories: Sequence[str], amounts: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flag, score and severity arrays from the trained-norms rule of anomaly-detector.ts.
+
+    Amounts are scored by absolute value, like ``amount = Math.abs(transaction.amount)``
+    in anomaly-detector.ts, so a refund scores as the same-sized expense. Unknown
+    categories are never flagged; a non-numeric amount gets a NaN score.
+    """
+    amount = np.abs(np.asarray(amounts, dtype=np.float64))
+    if not table.categories:
+        return np.zeros(len(amount), dtype=bool), np.zeros(len(amount)), np.full(len(amount), "low", dtype=object)
+    index = np.array([table.categories.get(category, -1) for category in categories], dtype=np.int64)
+    known = index >= 0
+    safe = np.where(known, index, 0)
+    median, mad, threshold = table.median[safe], table.mad[safe], table.threshold[safe]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_score = np.where(
+            mad > 0,
+            np.abs(train_models.ROBUST_Z_SCALE * (amount - median) / mad),
+            np.where(median == 0, 0.0, np.abs((amount - median) / median)),
+        )
+    above = (threshold > 0) & (amount >= threshold * ANOMALY_THRESHOLD_SCALE)
+    conditions = [~known, above, z_score > 3, z_score > 2]
+    scores = np.select(
+        conditions,
+        [0.0, 0.7, np.minimum(z_score / 5, 1), np.minimum(z_score / 4, 1)],
+        np.minimum(z_score / 3, 1),
+    )
+    severity = np.select(conditions, ["low", "medium", "high", "medium"], "low").astype(object)
+    return known & (above | (z_score > 2)), scores, severity
+
+
+def anomaly_batch(models: ServingModels, items: Sequence[Tuple[str, float]]) -> List[Dict]:
+    """Score each (category, amount) against its trained norms, as anomaly-detector.ts does without history."""
+    flagged, scores, severity = anomaly_scores(
+        models.anomaly,
+        [category for category, _ in items],
+        np.array([amount for _, amount in items], dtype=np.float64),
+    )
+    return [
+        {"isAnomaly": bool(flag), "anomalyScore": round(float(score), 4), "severity": str(level)}
+        for flag, score, level in zip(flagged, scores, severity)
+    ]
+
+
+def forecast_batch(models: ServingModels, items: Sequence[Tuple[str, int]]) -> List[Dict]:
+    """``trainedAverages[category] * trainedSeasonality[category][month]`` per item."""
+    results = []
+    for category, month in items:
+        factor = models.seasonality.get(category, {}).get(month, 1.0)
+        average = models.averages.get(category)
+        predicted = round(average * factor, 2) if average is not None else None
+        results.append({"predictedAmount": predicted, "seasonalFactor": factor})
+    return results
+
+
+def savings_rate_batch(models: ServingModels, incomes: Sequence[float]) -> List[float]:
+    income = np.array(incomes, dtype=np.float64)
+    brackets = np.searchsorted(np.array(SAVINGS_BRACKETS, dtype=np.float64), income, side="right")
+    rates = models.savings_rates[brackets]
+    return np.where(np.isfinite(income) & (income > 0), rates, 0.0).tolist()
+
+
+class MicroBatcher:
+    """Coalesces items from concurrent requests into one call of ``score``.
+
+    The first queued request opens a batch. After ``max_wait`` seconds every
+    request waiting by then joins it, up to ``max_batch`` items, and the batch
+    is scored in ``executor``. Requests that arrive while a batch is being
+    scored form the next one, so batches grow with load.
+    """
+
+    def __init__(self, score: Callable[[List], List], max_batch: int, max_wait: float, executor: ThreadPoolExecutor):
+        self.score = score
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self.executor = executor
+        self.queue: "asyncio.Queue[tuple[list, asyncio.Future]]" = asyncio.Queue()
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, items: list) -> list:
+        if not items:
+            return []
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((items, future))
+        return await future
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self.queue.get()]
+            if self.max_wait:
+                await asyncio.sleep(self.max_wait)
+            size = len(pending[0][0])
+            while size < self.max_batch and not self.queue.empty():
+                entry = self.queue.get_nowait()
+                pending.append(entry)
+                size += len(entry[0])
+            batch = [item for items, _ in pending for item in items]
+            try:
+                results = await loop.run_in_executor(self.executor, self.score, batch)
+            except Exception as exc:  # pragma: no cover - surfaced to every waiting request
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            self.batches += 1
+            self.items += len(batch)
+            offset = 0
+            for items, future in pending:
+                if not future.done():
+                    future.set_result(results[offset:offset + len(items)])
+                offset += len(items)
+
+
+def item_list(payload: Dict, key: str) -> list:
+    items = payload.get(key)
+    if not isinstance(items, list):
+        raise RequestError(f"Expected a JSON list in '{key}'.")
+    if len(items) > MAX_ITEMS_PER_REQUEST:
+        raise RequestError(f"At most {MAX_ITEMS_PER_REQUEST} items per request.", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    return items
+
+
+def number(value: object, field: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        raise RequestError(f"'{field}' must be a finite number.")
+    return float(value)
+
+
+def text(value: object, field: str) -> str:
+    if not isinstance(value, str):
+        raise RequestError(f"'{field}' must be a string.")
+    return value
+
+
+def field(item: object, name: str) -> object:
+    if not isinstance(item, dict) or name not in item:
+        raise RequestError(f"Every item needs '{name}'.")
+    return item[name]
+
+
+class InferenceService:
+    """Routes parsed requests to one MicroBatcher per model."""
+
+    def __init__(self, models: ServingModels, max_batch: int, max_wait: float):
+        self.models = models
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="uniguard-score")
+
+        def batcher(score: Callable[[ServingModels, List], List]) -> MicroBatcher:
+            return MicroBatcher(lambda batch: score(models, batch), max_batch, max_wait, self.executor)
+
+        self.batchers = {
+            "categorizer": batcher(categorize_batch),
+            "anomaly": batcher(anomaly_batch),
+            "forecast": batcher(forecast_batch),
+            "savings": batcher(savings_rate_batch),
+        }
+        self.routes: Dict[str, Callable[[Dict], object]] = {
+            "/v1/categorize": self.categorize,
+            "/v1/top-k": self.top_k,
+            "/v1/anomaly-score": self.anomaly_score,
+            "/v1/forecast": self.forecast,
+            "/v1/savings-rate": self.savings_rate,
+        }
+
+    def start(self) -> List[asyncio.Task]:
+        return [asyncio.create_task(batcher.run()) for batcher in self.batchers.values()]
+
+    async def categorize(self, payload: Dict) -> Dict:
+        items = [
+            (text(field(item, "description"), "description"), number(field(item, "amount"), "amount"))
+            for item in item_list(payload, "transactions")
+        ]
+        results = await self.batchers["categorizer"].submit(items)
+        return {"categories": [best for best, _ in results]}
+
+    async def top_k(self, payload: Dict) -> Dict:
+        k = payload.get("k", 3)
+        if isinstance(k, bool) or not isinstance(k, int) or not 1 <= k <= MAX_TOP_K:
+            raise RequestError(f"'k' must be an integer from 1 to {MAX_TOP_K}.")
+        items = [
+            (text(field(item, "description"), "description"), number(field(item, "amount"), "amount"))
+            for item in item_list(payload, "transactions")
+        ]
+        results = await self.batchers["categorizer"].submit(items)
+        return {"categories": [top[:k] for _, top in results]}
+
+    async def anomaly_score(self, payload: Dict) -> Dict:
+        items = [
+            (text(field(item, "category"), "category"), number(field(item, "amount"), "amount"))
+            for item in item_list(payload, "transactions")
+        ]
+        return {"results": await self.batchers["anomaly"].submit(items)}
+
+    async def forecast(self, payload: Dict) -> Dict:
+        items = []
+        for item in item_list(payload, "forecasts"):
+            month = field(item, "month")
+            if isinstance(month, bool) or not isinstance(month, int) or not 1 <= month <= 12:
+                raise RequestError("'month' must be an integer from 1 to 12.")
+            items.append((text(field(item, "category"), "category"), month))
+        return {"results": await self.batchers["forecast"].submit(items)}
+
+    async def savings_rate(self, payload: Dict) -> Dict:
+        incomes = [number(income, "incomes") for income in item_list(payload, "incomes")]
+        return {"rates": await self.batchers["savings"].submit(incomes)}
+
+    def health(self) -> Dict:
+        return {
+            "status": "ok",
+            "categories": len(self.models.categorizer.categories),
+            "anomalyCategories": len(self.models.anomaly.categories),
+            "forecastCategories": len(self.models.averages),
+            "artifacts": self.models.sources,
+            "batches": {name: {"batches": b.batches, "items": b.items} for name, b in self.batchers.items()},
+        }
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> tuple[HTTPStatus, Dict]:
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise RequestError("Use GET.", HTTPStatus.METHOD_NOT_ALLOWED)
+            return HTTPStatus.OK, self.health()
+        route = self.routes.get(path)
+        if route is None:
+            raise RequestError(f"Unknown endpoint: {path}", HTTPStatus.NOT_FOUND)
+        if method != "POST":
+            raise RequestError("Use POST.", HTTPStatus.METHOD_NOT_ALLOWED)
+        try:
+            payload = json.loads(body or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise RequestError(f"Invalid JSON: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise RequestError("The request body must be a JSON object.")
+        return HTTPStatus.OK, await route(payload)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve HTTP/1.1 requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                keep_alive = True
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                    headers = await read_headers(reader)
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+                    length = int(headers.get("content-length", "0"))
+                    if length > MAX_BODY_BYTES:
+                        keep_alive = False
+                        raise RequestError("Request body too large.", HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+                    body = await reader.readexactly(length) if length > 0 else b""
+                    status, payload = await self.dispatch(method, path, body)
+                except RequestError as exc:
+                    status, payload = exc.status, {"error": str(exc)}
+                except ValueError:
+                    status, payload, keep_alive = HTTPStatus.BAD_REQUEST, {"error": "Malformed request."}, False
+                except Exception as exc:  # pragma: no cover - a scoring failure must not hang the client
+                    status, payload, keep_alive = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": repr(exc)}, False
+                writer.write(http_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+def http_response(status: HTTPStatus, payload: Dict, keep_alive: bool) -> bytes:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def serve(host: str, port: int, max_batch: int, max_wait: float, artifacts_dir: Path) -> None:
+    models = load_serving_models(artifacts_dir)
+    service = InferenceService(models, max_batch, max_wait)
+    tasks = service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(
+        f"Serving {len(models.categorizer.categories)} categories on http://{host}:{port} "
+        f"(max batch {max_batch}, max wait {max_wait * 1000:g} ms)"
+    )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for task in tasks:
+            task.cancel()
+        service.executor.shutdown(wait=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the trained UniGuard models over a local HTTP API.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind (default: loopback only).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=DEFAULT_MAX_BATCH,
+        help="Most items coalesced into one vectorized call per endpoint.",
+    )
+    parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=DEFAULT_MAX_WAIT_MS,
+        help="How long a batch waits for more concurrent requests before it is scored (0 = no wait).",
+    )
+    parser.add_argument(
+        "--artifacts-dir",
+        type=Path,
+        default=train_models.ARTIFACTS_DIR,
+        help="Directory with the trained TypeScript artifacts.",
+    )
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch, args.max_wait_ms / 1000, args.artifacts_dir))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+Offline synthetic versions of the Kaggle sources read by train_models.py.
+
+Every source file is written at ``--rows`` rows under
+``<output>/<owner>/<dataset>/versions/<N>/`` with the filenames, column names
+and file types (including the xlsx transaction export) that
+build_transaction_dataset, build_spending_dataset, train_budget_allocator and
+train_goal_predictor read. Category labels mix canonical names with the messy
+spellings CATEGORY_ALIASES normalizes, and a small share of rows fails the
+schema filters, as in the real exports. A datasets_manifest.json mapping each
+dataset key to its generated directory is written alongside.
+
+    python -m training.synthetic_data --output /tmp/uniguard-data --rows 200k
+    python -m training.pipeline train --manifest /tmp/uniguard-data/datasets_manifest.json
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from training import train_models
+
+DEFAULT_ROWS = 10_000
+# Rows generated and written per batch, so memory stays flat at any --rows
+CHUNK_ROWS = 250_000
+# Excel's sheet limit, minus the header row
+EXCEL_MAX_ROWS = 1_048_575
+DEFAULT_START = "2018-01-01"
+DEFAULT_YEARS = 4
+# Share of category labels written with an alias spelling and/or odd casing
+MESSY_SHARE = 0.3
+# Share of rows with a missing amount or an unknown category, dropped by the cleaning filters
+INVALID_SHARE = 0.01
+
+# category -> (row share, merchants, median amount, lognormal sigma)
+TRANSACTION_PROFILES: Dict[str, tuple] = {
+    "Food": (0.14, ["Grocery Store", "Blue Sky Market", "Whole Foods", "Trader Joe's", "Farmers Market", "Costco"], 45.0, 0.6),
+    "Eating Out": (0.14, ["Starbucks", "Italian Restaurant", "Brewing Company", "Chipotle", "Sushi Bar", "Pizza Hut"], 22.0, 0.5),
+    "Shopping": (0.10, ["Amazon", "Hardware Store", "Target", "Best Buy", "Walmart", "Home Depot"], 60.0, 0.8),
+    "Transport": (0.10, ["Shell", "Gas Station", "BP", "Chevron", "QuikTrip", "Uber Trip", "Lyft Ride"], 35.0, 0.4),
+    "Debt Payments": (0.08, ["Credit Card Payment", "Student Loan Payment"], 450.0, 0.8),
+    "Income": (0.08, ["Biweekly Paycheck", "Direct Deposit Payroll"], 2100.0, 0.1),
+    "Utilities": (0.07, ["Gas Company", "City Water Charges", "Power Company"], 80.0, 0.3),
+    "Communication": (0.06, ["Phone Company", "Internet Service Provider"], 80.0, 0.15),
+    "Entertainment": (0.06, ["Netflix", "Spotify", "Amazon Video", "Movie Theater"], 12.0, 0.4),
+    "Rent": (0.05, ["Mortgage Payment", "Apartment Rent"], 1250.0, 0.05),
+    "Health": (0.04, ["Pharmacy", "Dental Clinic", "Family Doctor"], 40.0, 0.7),
+    "Travel": (0.04, ["Delta Airlines", "Marriott Hotel", "Airbnb Stay"], 300.0, 0.7),
+    "Insurance": (0.04, ["State Farm Auto Insurance", "Health Insurance Premium"], 150.0, 0.2),
+}
+ACCOUNT_NAMES = ["Platinum Card", "Silver Card", "Checking", "Savings Account"]
+
+# category -> (row share, median amount, lognormal sigma)
+SPENDING_PROFILES: Dict[str, tuple] = {
+    "Food": (0.22, 18.0, 0.7),
+    "Eating Out": (0.18, 9.0, 0.6),
+    "Transport": (0.14, 6.0, 0.6),
+    "Shopping": (0.10, 35.0, 0.9),
+    "Utilities": (0.08, 60.0, 0.4),
+    "Communication": (0.06, 25.0, 0.3),
+    "Entertainment": (0.07, 15.0, 0.6),
+    "Health": (0.05, 30.0, 0.8),
+    "Education": (0.04, 120.0, 0.7),
+    "Coffee": (0.06, 4.0, 0.3),
+}
+PAYMENT_MODES = ["Cash", "Card", "UPI", "Bank Transfer"]
+LOCATIONS = ["Delhi", "Mumbai", "Bengaluru", "Chennai", "Kolkata", "Pune"]
+
+# Expense types as spelled in the Indian credit card export -> (row share, median amount, sigma)
+CARD_EXPENSE_TYPES: Dict[str, tuple] = {
+    "Food": (0.22, 1800.0, 0.9),
+    "Fuel": (0.20, 1500.0, 0.8),
+    "Bills": (0.20, 2500.0, 0.9),
+    "Entertainment": (0.15, 1200.0, 0.8),
+    "Grocery": (0.15, 1600.0, 0.8),
+    "Travel": (0.08, 4000.0, 1.0),
+}
+CARD_TYPES = ["Gold", "Platinum", "Silver", "Signature"]
+
+# Budget column -> Dirichlet concentration for (rural, urban) households
+BUDGET_COLUMNS: Dict[str, tuple] = {
+    "FoodBudget": (9.0, 6.0),
+    "HousingBudget": (6.0, 9.0),
+    "TransportBudget": (3.0, 4.0),
+    "UtilitiesBudget": (3.0, 3.0),
+    "HealthcareBudget": (2.0, 2.0),
+    "EducationBudget": (2.0, 3.0),
+    "EntertainmentBudget": (1.0, 2.0),
+    "SavingsBudget": (3.0, 4.0),
+    "MiscellaneousBudget": (1.0, 1.0),
+}
+# HABITS_SPEND_COLUMNS in order -> Dirichlet concentration
+HABITS_CONCENTRATION = [9.0, 3.0, 2.0, 6.0, 3.0, 2.0, 2.0, 3.0, 2.0, 2.0, 1.0]
+OCCUPATIONS = ["Professional", "Self_Employed", "Student", "Retired"]
+CITY_TIERS = ["Tier_1", "Tier_2", "Tier_3"]
+
+LABEL_STYLES: List[Callable[[str], str]] = [
+    lambda label: label,
+    str.upper,
+    str.title,
+    lambda label: f" {label} ",
+]
+
+
+def dataset_dirs(output: Path) -> Dict[str, Path]:
+    """kagglehub-style ``<owner>/<dataset>/versions/<N>`` directory for every dataset key."""
+    return {
+        key: output / key / "versions" / default.name
+        for key, default in train_models.DEFAULT_DATASET_PATHS.items()
+    }
+
+
+def category_spellings(category: str) -> List[str]:
+    """The canonical name plus every CATEGORY_ALIASES key that normalizes to it."""
+    return [category] + sorted(alias for alias, target in train_models.CATEGORY_ALIASES.items() if target == category)
+
+
+def messy_labels(rng: np.random.Generator, categories: np.ndarray) -> np.ndarray:
+    labels = categories.astype(object)
+    messy = rng.random(len(labels)) < MESSY_SHARE
+    for category in np.unique(categories[messy]):
+        rows = np.flatnonzero(messy & (categories == category))
+        spellings = np.array(category_spellings(category), dtype=object)
+        picked = spellings[rng.integers(len(spellings), size=len(rows))]
+        styles = rng.integers(len(LABEL_STYLES), size=len(rows))
+        labels[rows] = [LABEL_STYLES[style](label) for style, label in zip(styles, picked)]
+    return labels
+
+
+def pick(rng: np.random.Generator, profiles: Dict[str, tuple], rows: int) -> np.ndarray:
+    names = list(profiles)
+    shares = np.array([profiles[name][0] for name in names])
+    return np.array(names, dtype=object)[rng.choice(len(names), size=rows, p=shares / shares.sum())]
+
+
+def seasonal_amounts(
+    rng: np.random.Generator,
+    categories: np.ndarray,
+    months: np.ndarray,
+    profiles: Dict[str, tuple],
+) -> np.ndarray:
+    """Lognormal amounts per category, scaled by a yearly cycle with a per-category phase."""
+    amounts = np.empty(len(categories))
+    for idx, name in enumerate(profiles):
+        rows = categories == name
+        median, sigma = profiles[name][-2:]
+        season = 1 + 0.2 * np.sin(2 * np.pi * (months[rows] + 3 * idx) / 12)
+        amounts[rows] = median * season * rng.lognormal(0.0, sigma, size=int(rows.sum()))
+    return np.round(np.maximum(amounts, train_models.MIN_AMOUNT), 2)
+
+
+def chunk_dates(rng: np.random.Generator, start: pd.Timestamp, days: int, chunk: slice, rows: int) -> pd.DatetimeIndex:
+    """Sorted timestamps for rows ``chunk`` of ``rows``, so each file is in date order."""
+    first = days * chunk.start // rows
+    last = max(first + 1, days * chunk.stop // rows)
+    offsets = np.sort(rng.integers(first * 86_400, last * 86_400, size=chunk.stop - chunk.start))
+    return start + pd.to_timedelta(offsets, unit="s")
+
+
+def corrupt(rng: np.random.Generator, frame: pd.DataFrame, amount: str, category: str) -> pd.DataFrame:
+    """Blank the amount or write an unknown category on about INVALID_SHARE of the rows."""
+    broken = rng.random(len(frame)) < INVALID_SHARE
+    missing_amount = broken & (rng.random(len(frame)) < 0.5)
+    frame.loc[missing_amount, amount] = np.nan
+    frame.loc[broken & ~missing_amount, category] = "Uncategorized"
+    return frame
+
+
+def transaction_chunk(rng: np.random.Generator, dates: pd.DatetimeIndex, mapping: Dict[str, str]) -> pd.DataFrame:
+    rows = len(dates)
+    categories = pick(rng, TRANSACTION_PROFILES, rows)
+    descriptions = np.empty(rows, dtype=object)
+    for name, (_, merchants, _, _) in TRANSACTION_PROFILES.items():
+        mask = categories == name
+        descriptions[mask] = np.array(merchants, dtype=object)[rng.integers(len(merchants), size=int(mask.sum()))]
+    # Store numbers on some card descriptions, as in bank exports
+    numbered = rng.random(rows) < 0.2
+    store_numbers = rng.integers(100, 9999, size=int(numbered.sum()))
+    descriptions[numbered] = [f"{text} #{number}" for text, number in zip(descriptions[numbered], store_numbers)]
+    frame = pd.DataFrame({
+        mapping["date"]: dates,
+        mapping["description"]: descriptions,
+        mapping["amount"]: seasonal_amounts(rng, categories, dates.month.to_numpy(), TRANSACTION_PROFILES),
+        mapping["type"]: np.where(categories == "Income", "credit", "debit"),
+        mapping["category"]: messy_labels(rng, categories),
+        "Account Name": np.array(ACCOUNT_NAMES, dtype=object)[rng.integers(len(ACCOUNT_NAMES), size=rows)],
+    })
+    return corrupt(rng, frame, mapping["amount"], mapping["category"])
+
+
+def spending_chunk(rng: np.random.Generator, dates: pd.DatetimeIndex, mapping: Dict[str, str]) -> pd.DataFrame:
+    rows = len(dates)
+    categories = pick(rng, SPENDING_PROFILES, rows)
+    frame = pd.DataFrame({
+        "transaction_id": rng.integers(10**8, 10**9, size=rows),
+        "user_id": rng.integers(1, 500, size=rows),
+        mapping["date"]: dates,
+        "transaction_type": "Expense",
+        mapping["category"]: messy_labels(rng, categories),
+        mapping["amount"]: seasonal_amounts(rng, categories, dates.month.to_numpy(), SPENDING_PROFILES),
+        "payment_mode": np.array(PAYMENT_MODES, dtype=object)[rng.integers(len(PAYMENT_MODES), size=rows)],
+        "location": np.array(LOCATIONS, dtype=object)[rng.integers(len(LOCATIONS), size=rows)],
+    })
+    return corrupt(rng, frame, mapping["amount"], mapping["category"])
+
+
+def card_spending_chunk(rng: np.random.Generator, dates: pd.DatetimeIndex, mapping: Dict[str, str]) -> pd.DataFrame:
+    rows = len(dates)
+    expense_types = pick(rng, CARD_EXPENSE_TYPES, rows)
+    frame = pd.DataFrame({
+        "City": np.array([f"{city}, India" for city in LOCATIONS], dtype=object)[rng.integers(len(LOCATIONS), size=rows)],
+        mapping["date"]: dates,
+        "Card Type": np.array(CARD_TYPES, dtype=object)[rng.integers(len(CARD_TYPES), size=rows)],
+        mapping["category"]: expense_types,
+        "Gender": np.where(rng.random(rows) < 0.5, "F", "M"),
+        mapping["amount"]: np.round(seasonal_amounts(rng, expense_types, dates.month.to_numpy(), CARD_EXPENSE_TYPES)),
+    })
+    return corrupt(rng, frame, mapping["amount"], mapping["category"])
+
+
+def budget_chunk(rng: np.random.Generator, rows: int, urban: bool) -> pd.DataFrame:
+    income = np.round(rng.lognormal(np.log(60_000 if urban else 30_000), 0.5, size=rows), -2)
+    concentration = [weights[int(urban)] for weights in BUDGET_COLUMNS.values()]
+    shares = rng.dirichlet(concentration, size=rows)
+    frame = pd.DataFrame({
+        "Income": income,
+        "Family_Size": rng.integers(1, 8, size=rows),
+        "Region": "Urban" if urban else "Rural",
+    })
+    for idx, column in enumerate(BUDGET_COLUMNS):
+        frame[column] = np.round(income * 0.9 * shares[:, idx], 2)
+    return frame
+
+
+def habits_chunk(rng: np.random.Generator, rows: int) -> pd.DataFrame:
+    income = rng.lognormal(np.log(40_000), 0.6, size=rows)
+    savings_pct = np.clip(rng.normal(5 + 2.5 * np.log(income / 20_000), 3), 1, 40)
+    spend = income * (1 - savings_pct / 100) * rng.uniform(0.7, 1.0, size=rows)
+    shares = rng.dirichlet(HABITS_CONCENTRATION, size=rows)
+    frame = pd.DataFrame({
+        "Income": income,
+        "Age": rng.integers(18, 65, size=rows),
+        "Dependents": rng.integers(0, 5, size=rows),
+        "Occupation": np.array(OCCUPATIONS, dtype=object)[rng.integers(len(OCCUPATIONS), size=rows)],
+        "City_Tier": np.array(CITY_TIERS, dtype=object)[rng.integers(len(CITY_TIERS), size=rows)],
+    })
+    for idx, column in enumerate(train_models.HABITS_SPEND_COLUMNS):
+        frame[column] = spend * shares[:, idx]
+    frame["Desired_Savings_Percentage"] = savings_pct
+    frame["Desired_Savings"] = income * savings_pct / 100
+    frame["Disposable_Income"] = income - spend
+    return frame.round(2)
+
+
+def chunk_slices(rows: int) -> Iterator[slice]:
+    for start in range(0, rows, CHUNK_ROWS):
+        yield slice(start, min(rows, start + CHUNK_ROWS))
+
+
+def dated_chunks(
+    build: Callable[[np.random.Generator, pd.DatetimeIndex, Dict[str, str]], pd.DataFrame],
+    mapping: Dict[str, str],
+    rows: int,
+    seed: List[int],
+    start: pd.Timestamp,
+    days: int,
+    date_format: Optional[str] = None,
+) -> Iterator[pd.DataFrame]:
+    """``build`` over consecutive date ranges; dates are written as ``date_format`` strings when given."""
+    rng = np.random.default_rng(seed)
+    for chunk in chunk_slices(rows):
+        frame = build(rng, chunk_dates(rng, start, days, chunk, rows), mapping)
+        if date_format is not None:
+            frame[mapping["date"]] = frame[mapping["date"]].dt.strftime(date_format)
+        yield frame
+
+
+def sized_chunks(build: Callable[..., pd.DataFrame], rows: int, seed: List[int], **kwargs) -> Iterator[pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    for chunk in chunk_slices(rows):
+        yield build(rng, chunk.stop - chunk.start, **kwargs)
+
+
+def write_csv(path: Path, chunks: Iterator[pd.DataFrame]) -> int:
+    written = 0
+    for idx, frame in enumerate(chunks):
+        frame.to_csv(path, mode="w" if idx == 0 else "a", header=idx == 0, index=False)
+        written += len(frame)
+    return written
+
+
+def write_xlsx(path: Path, chunks: Iterator[pd.DataFrame]) -> int:
+    """Stream chunks into a write-only workbook so memory stays bounded."""
+    try:
+        from openpyxl import Workbook  # type: ignore
+    except Exception as exc:  # pragma: no cover - import guard
+        raise SystemExit("Missing openpyxl. Install it with: python3 -m pip install openpyxl") from exc
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    written = 0
+    for idx, frame in enumerate(chunks):
+        if idx == 0:
+            sheet.append(list(frame.columns))
+        for row in frame.astype(object).where(frame.notna(), None).itertuples(index=False):
+            sheet.append([value.to_pydatetime() if isinstance(value, pd.Timestamp) else value for value in row])
+        written += len(frame)
+    workbook.save(path)
+    return written
+
+
+def generate(output: Path, rows: int, seed: int, start: pd.Timestamp, years: int) -> Dict[str, Path]:
+    """Write every source file under ``output``; returns the dataset directories that were written."""
+    dirs = dataset_dirs(output)
+    days = max(1, (start + pd.DateOffset(years=years) - start).days)
+    previous_paths = train_models.DATASET_PATHS
+    # Resolve filenames and column maps through train_models so they always match what it reads
+    train_models.DATASET_PATHS = dirs
+    try:
+        transaction_sources = train_models.transaction_source_files()
+        spending_sources = train_models.spending_source_files()
+        *budget_paths, habits_path = train_models.budget_share_paths()
+    finally:
+        train_models.DATASET_PATHS = previous_paths
+
+    outputs: List[tuple[Path, Iterator[pd.DataFrame]]] = []
+    for idx, source in enumerate(transaction_sources):
+        if source["path"].suffix.lower() in {".xlsx", ".xls"}:
+            chunks = dated_chunks(transaction_chunk, source["map"], min(rows, EXCEL_MAX_ROWS), [seed, 0, idx], start, days)
+        else:
+            chunks = dated_chunks(transaction_chunk, source["map"], rows, [seed, 0, idx], start, days, "%m/%d/%Y")
+        outputs.append((source["path"], chunks))
+    for idx, source in enumerate(spending_sources):
+        if source["map"]["category"] == "Exp Type":
+            chunks = dated_chunks(card_spending_chunk, source["map"], rows, [seed, 1, idx], start, days, "%d-%b-%y")
+        else:
+            chunks = dated_chunks(spending_chunk, source["map"], rows, [seed, 1, idx], start, days, "%Y-%m-%d %H:%M:%S")
+        outputs.append((source["path"], chunks))
+    for idx, path in enumerate(budget_paths):
+        outputs.append((path, sized_chunks(budget_chunk, rows, [seed, 2, idx], urban="urban" in path.name)))
+    outputs.append((habits_path, sized_chunks(habits_chunk, rows, [seed, 3])))
+
+    for path, chunks in outputs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = write_xlsx(path, chunks) if path.suffix.lower() in {".xlsx", ".xls"} else write_csv(path, chunks)
+        print(f"Wrote {written:,} rows -> {path}")
+    written_dirs = {path.parent for path, _ in outputs}
+    return {key: path for key, path in dirs.items() if path in written_dirs}
+
+
+def write_manifest(path: Path, dirs: Dict[str, Path]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({key: str(dirs[key]) for key in sorted(dirs)}, indent=2))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate synthetic Kaggle-layout datasets for offline training runs.")
+    parser.add_argument("--output", type=Path, required=True, help="Directory to write the dataset tree into.")
+    parser.add_argument(
+        "--rows",
+        type=train_models.parse_row_count,
+        default=str(DEFAULT_ROWS),
+        help=f"Rows per source file, e.g. 50k or 2m (the xlsx source is capped at {EXCEL_MAX_ROWS:,}).",
+    )
+    parser.add_argument("--seed", type=int, default=train_models.RANDOM_SEED, help="Random seed; equal seeds give identical files.")
+    parser.add_argument("--start", default=DEFAULT_START, help="First transaction date (YYYY-MM-DD).")
+    parser.add_argument("--years", type=int, default=DEFAULT_YEARS, help="Years of history to spread the rows over.")
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Where to write the dataset manifest (default: <output>/datasets_manifest.json).",
+    )
+    args = parser.parse_args(argv)
+
+    output = args.output.resolve()
+    rows = args.rows
+    started = time.perf_counter()
+    dirs = generate(output, rows, args.seed, pd.Timestamp(args.start), max(1, args.years))
+    manifest = args.manifest or output / "datasets_manifest.json"
+    write_manifest(manifest, dirs)
+    print(f"Manifest written to: {manifest} ({time.perf_counter() - started:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,24 @@
 import argparse
 import argparse
+import base64
+import cProfile
+import csv
+import hashlib
+import importlib.util
+import itertools
 import json
 import math
+import multiprocessing
+import os
 import re
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
@@ -14,8 +27,66 @@ import pandas as pd
 ROOT = Path(__file__).resolve().parents[2]  # Go up 2 levels: backend/training -> backend -> root
 ARTIFACTS_DIR = ROOT / "frontend" / "src" / "lib" / "ai" / "models" / "artifacts"
 REPORTS_DIR = ROOT / "backend" / "training" / "reports"
+# "ts" inlines artifacts into the bundle; "compact" writes quantized JSON the frontend fetches lazily
+ARTIFACT_FORMAT = "ts"
+COMPACT_ARTIFACTS_DIR = ROOT / "frontend" / "public" / "models"
+COMPACT_ARTIFACT_FILES = {"transaction_categorizer": "transaction-categorizer.json"}
+COMPACT_ARTIFACT_VERSION = 1
 
 DATASET_MANIFEST = ROOT / "backend" / "training" / "data" / "datasets_manifest.json"
+DATASET_CACHE_DIR = ROOT / "backend" / "training" / "data" / "cache"
+DATASET_CACHE_ENABLED = True
+# Sources are read and cleaned on this many threads; 1 keeps ingestion sequential
+INGEST_WORKERS = min(8, os.cpu_count() or 1)
+# Bump when cleaning logic changes in a way the filter constants below do not capture
+CLEANING_RULES_VERSION = 2
+# "c" (pandas default) or "pyarrow" (multithreaded parser; empty text cells read as "" not NaN)
+CSV_ENGINE = "c"
+CSV_DELIMITERS = (",", "\t", ";", "|")
+# Read spending sources in chunks of this many rows with approximate clipping (None = load whole files)
+STREAM_CHUNK_ROWS: Optional[int] = None
+# Path -> bytes/rows/columns/seconds/engine for the most recent read of each source
+SOURCE_READ_STATS: Dict[str, Dict] = {}
+# Stage name -> calls, wall/CPU seconds, peak traced MB and rows in/out for the current training run
+STAGE_TIMINGS: Dict[str, Dict] = {}
+# Per-stage peak memory via tracemalloc (slows allocation-heavy stages several-fold, so opt-in)
+STAGE_TRACE_MEMORY = False
+# Write one cProfile dump per outermost stage into this directory (None = off)
+PROFILE_DIR: Optional[Path] = None
+STAGE_STACK: List[Dict] = []
+# Mergeable categorizer statistics written by full training and extended by --incremental
+CATEGORIZER_STATE_PATH = ROOT / "backend" / "training" / "models" / "transaction_categorizer" / "state.npz"
+CATEGORIZER_STATE_VERSION = 1
+# Per-model build keys and artifact hashes; models whose key and output are unchanged are skipped
+MODEL_CACHE_PATH = ROOT / "backend" / "training" / "models" / "build_cache.json"
+MODEL_CACHE_ENABLED = True
+# Bump when trainer output changes in a way this file's source hash would not capture
+TRAINER_VERSION = 1
+# Build anomaly-detector statistics from KLL sketches with this normalized rank error (None = exact)
+ANOMALY_SKETCH_ERROR: Optional[float] = None
+ANOMALY_SKETCH_SHARD_ROWS = 1_000_000
+ANOMALY_PERCENTILES = {"p90": 90, "p95": 95, "p97": 97, "p98": 98, "p99": 99, "p995": 99.5}
+# Robust z-score cutoffs swept by the anomaly evaluator; z = 0.6745 * (amount - median) / mad
+ANOMALY_MAD_MULTIPLES = (2.0, 2.5, 3.0, 3.5, 4.0, 5.0)
+ROBUST_Z_SCALE = 0.6745
+# Bootstrap resamples of each holdout for 95% intervals (0 = point estimates only)
+BOOTSTRAP_RESAMPLES = 0
+BOOTSTRAP_WORKERS = os.cpu_count() or 1
+BOOTSTRAP_CHUNK_RESAMPLES = 100
+# Upper bound on resamples x holdout rows held in one index matrix
+BOOTSTRAP_BLOCK_CELLS = 4_000_000
+# Spending-forecaster seasonality: "month", or "week"/"day" to add week-of-year/day-of-week factors
+SEASONAL_GRANULARITY = "month"
+# Spending-forecaster backtest: forecast horizons in months and months fitted before the first origin
+BACKTEST_HORIZONS = 3
+BACKTEST_MIN_TRAIN_MONTHS = 6
+# Cross-validation folds per model (0 = single holdout split only)
+CV_FOLDS = 0
+CV_WORKERS = os.cpu_count() or 1
+ROLLING_ORIGIN_MODELS = ("transaction_categorizer", "spending_forecaster", "anomaly_detector")
+# Model -> per-sample holdout outcomes recorded by the most recent evaluation
+EVALUATION_SAMPLES: Dict[str, Dict[str, np.ndarray]] = {}
+
 
 DEFAULT_DATASET_PATHS = {
     # Curated clean sources for transaction categorization/spending series
@@ -345,36 +416,179 @@ def clip_outliers(series: pd.Series, lower_q: float = 0.01, upper_q: float = 0.9
     return series.clip(lower=lower, upper=upper)
 
 
+class QuantileSketch:
+    """Mergeable KLL quantile sketch with bounded memory.
+
+    Keeps roughly ``3 * k`` values whatever the stream length. Normalized rank
+    error is about ``1.7 / k``. While nothing has been compacted, answers equal
+    ``np.quantile``. Compaction uses a seeded RNG, so a fixed input order gives
+    reproducible results.
+    """
+
+    def __init__(self, k: int = 2000, seed: int = RANDOM_SEED):
+        self.k = max(int(k), 8)
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def for_error(cls, rank_error: float, seed: int = RANDOM_SEED) -> "QuantileSketch":
+        return cls(k=math.ceil(1.7 / max(rank_error, 1e-6)), seed=seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(items)
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[: len(items) - len(keep)]
+                promoted = paired[int(self._rng.integers(2))::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                # Capacities shrink as levels are added, so recheck from the bottom
+                level = 0
+                continue
+            level += 1
+
+    def update(self, values: Sequence[float]) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0, dtype=np.float64))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def _weights(self) -> np.ndarray:
+        return np.concatenate([np.full(len(items), 2 ** level, dtype=np.float64) for level, items in enumerate(self.levels)])
+
+    @staticmethod
+    def _weighted_quantile(values: np.ndarray, weights: np.ndarray, q: float) -> float:
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        position = min(int(np.searchsorted(cumulative, q * cumulative[-1], side="left")), len(values) - 1)
+        return float(values[order][position])
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return float("nan")
+        if len(self.levels) == 1:
+            return float(np.quantile(self.levels[0], q))
+        return self._weighted_quantile(np.concatenate(self.levels), self._weights(), q)
+
+    def percentile(self, p: float) -> float:
+        return self.quantile(p / 100.0)
+
+    def median_absolute_deviation(self) -> float:
+        """MAD from the retained items: exact until the first compaction, approximate after."""
+        if not self.count:
+            return float("nan")
+        median = self.quantile(0.5)
+        if len(self.levels) == 1:
+            return float(np.median(np.abs(self.levels[0] - median)))
+        return self._weighted_quantile(np.abs(np.concatenate(self.levels) - median), self._weights(), 0.5)
+
+
+@dataclass
+class CategorizerStats:
+    """Sufficient statistics for the transaction categorizer.
+
+    Token counts are stored as (category, term, count) triples in first-seen order,
+    which is the insertion order of the old ``token_counts`` dict-of-dicts.
+    """
+
+    category_counts: Dict[str, int]
+    categories: List[str]
+    terms: np.ndarray
+    pair_category: np.ndarray
+    pair_term: np.ndarray
+    pair_count: np.ndarray
+    amount_sums: np.ndarray
+    amount_counts: np.ndarray
+
+    @classmethod
+    def from_token_counts(cls, token_counts: Dict[str, Dict[str, int]]) -> "CategorizerStats":
+        categories = list(token_counts.keys())
+        pairs = [(cat_idx, token, count) for cat_idx, tokens in enumerate(token_counts.values()) for token, count in tokens.items()]
+        term_ids, terms = pd.factorize(pd.Series([token for _, token, _ in pairs], dtype=object))
+        return cls(
+            category_counts={},
+            categories=categories,
+            terms=np.asarray(terms, dtype=object),
+            pair_category=np.asarray([cat_idx for cat_idx, _, _ in pairs], dtype=np.int64),
+            pair_term=np.asarray(term_ids, dtype=np.int64),
+            pair_count=np.asarray([count for _, _, count in pairs], dtype=np.int64),
+            amount_sums=np.zeros(len(categories)),
+            amount_counts=np.zeros(len(categories), dtype=np.int64),
+        )
+
+
+    def subset(self, keep: Sequence[bool]) -> "CategorizerStats":
+        """Statistics restricted to the categories flagged in ``keep``, order preserved."""
+        keep = np.asarray(keep, dtype=bool)
+        if keep.all():
+            return self
+        remap = np.cumsum(keep) - 1
+        pairs = keep[self.pair_category] if len(self.pair_category) else np.zeros(0, dtype=bool)
+        return CategorizerStats(
+            category_counts=self.category_counts,
+            categories=[cat for cat, kept in zip(self.categories, keep) if kept],
+            terms=self.terms,
+            pair_category=remap[self.pair_category[pairs]],
+            pair_term=self.pair_term[pairs],
+            pair_count=self.pair_count[pairs],
+            amount_sums=self.amount_sums[keep],
+            amount_counts=self.amount_counts[keep],
+        )
+
+
 def build_token_weights(
-    token_counts: Dict[str, Dict[str, int]],
+    token_counts: Union[Dict[str, Dict[str, int]], CategorizerStats],
     min_count: int = 2,
     top_n: int = 60,
 ) -> Dict[str, Dict[str, float]]:
-    if not token_counts:
+    stats = token_counts if isinstance(token_counts, CategorizerStats) else CategorizerStats.from_token_counts(token_counts)
+    if not stats.categories:
         return {}
-    categories = list(token_counts.keys())
-    num_categories = len(categories)
-    token_df: Dict[str, int] = {}
-    category_totals: Dict[str, int] = {}
-    for category, tokens in token_counts.items():
-        category_totals[category] = sum(tokens.values()) or 1
-        for token in tokens.keys():
-            token_df[token] = token_df.get(token, 0) + 1
-
-    weights: Dict[str, Dict[str, float]] = {}
-    for category, tokens in token_counts.items():
-        scored = []
-        for token, count in tokens.items():
-            if count < min_count or token in GENERIC_TOKENS:
-                continue
-            if token_df.get(token, 0) >= 3 and token not in STRONG_TOKENS:
-                continue
-            tf = count / category_totals[category]
-            df = token_df.get(token, 1)
-            idf = math.log((1 + num_categories) / (1 + df)) + 1
-            scored.append((token, tf * idf))
-        scored.sort(key=lambda item: item[1], reverse=True)
-        weights[category] = {token: round(score, 4) for token, score in scored[:top_n]}
+    num_categories = len(stats.categories)
+    token_df = np.bincount(stats.pair_term, minlength=len(stats.terms))
+    category_totals = np.bincount(stats.pair_category, weights=stats.pair_count, minlength=num_categories)
+    category_totals[category_totals == 0] = 1
+    terms = pd.Series(stats.terms, dtype=object)
+    generic = terms.isin(GENERIC_TOKENS).to_numpy(dtype=bool)[stats.pair_term]
+    strong = terms.isin(STRONG_TOKENS).to_numpy(dtype=bool)[stats.pair_term]
+    pair_df = token_df[stats.pair_term]
+    keep = (stats.pair_count >= min_count) & ~generic & ~((pair_df >= 3) & ~strong)
+
+    # math.log over the few distinct df values keeps scores identical to the scalar formula
+    idf = np.array([math.log((1 + num_categories) / (1 + df)) + 1 for df in range(int(token_df.max(initial=0)) + 1)])
+    positions = np.flatnonzero(keep)
+    pair_category = stats.pair_category[positions]
+    scores = stats.pair_count[positions] / category_totals[pair_category] * idf[pair_df[positions]]
+    order = np.lexsort((positions, -scores, pair_category))
+    pair_category = pair_category[order]
+    group_starts = np.searchsorted(pair_category, pair_category, side="left")
+    selected = order[np.arange(len(order)) - group_starts < top_n]
+
+    weights: Dict[str, Dict[str, float]] = {category: {} for category in stats.categories}
+    for idx in selected:
+        category = stats.categories[stats.pair_category[positions[idx]]]
+        weights[category][stats.terms[stats.pair_term[positions[idx]]]] = round(float(scores[idx]), 4)
     return weights
 
 
@@ -386,18 +600,59 @@ def select_top_tokens(token_weights: Dict[str, Dict[str, float]], top_n: int = 2
     return keywords
 
 
+def build_alias_trie(aliases: Dict[str, str]) -> Dict:
+    """Character trie over alias keys; terminals hold (alias order, target)."""
+    trie: Dict = {}
+    for order, (alias, target) in enumerate(aliases.items()):
+        node = trie
+        for ch in alias:
+            node = node.setdefault(ch, {})
+        node[""] = (order, target)
+    return trie
+
+
+CATEGORY_ALIAS_TRIE = build_alias_trie(CATEGORY_ALIASES)
+
+# Raw category value -> normalized category, shared by every source in a run
+NORMALIZED_CATEGORY_CACHE: Dict[str, str] = {}
+
+
+def match_alias_prefix(key: str) -> Optional[str]:
+    """Target of the first alias (in CATEGORY_ALIASES order) that ``key`` starts with."""
+    best: Optional[tuple] = None
+    node = CATEGORY_ALIAS_TRIE
+    for ch in key:
+        node = node.get(ch)
+        if node is None:
+            break
+        terminal = node.get("")
+        if terminal is not None and (best is None or terminal[0] < best[0]):
+            best = terminal
+    return best[1] if best is not None else None
+
+
 def normalize_category(raw: str) -> str:
     if not raw:
         return "Miscellaneous"
+    cached = NORMALIZED_CATEGORY_CACHE.get(raw) if isinstance(raw, str) else None
+    if cached is not None:
+        return cached
     key = re.sub(r"[^a-z0-9\s_&/-]", "", str(raw).lower()).strip()
     key = key.replace("_", " ").replace("-", " ")
     key = re.sub(r"\s+", " ", key)
     if key in CATEGORY_ALIASES:
-        return CATEGORY_ALIASES[key]
-    for alias, target in CATEGORY_ALIASES.items():
-        if key.startswith(alias):
-            return target
-    return str(raw).strip().title()
+        normalized = CATEGORY_ALIASES[key]
+    else:
+        normalized = match_alias_prefix(key) or str(raw).strip().title()
+    if isinstance(raw, str):
+        NORMALIZED_CATEGORY_CACHE[raw] = normalized
+    return normalized
+
+
+def normalize_category_column(categories: pd.Series) -> pd.Series:
+    """``normalize_category`` evaluated once per distinct raw value and mapped back."""
+    mapping = {raw: normalize_category(raw) for raw in categories.unique()}
+    return categories.map(mapping)
 
 
 def tokenize(text: str) -> List[str]:
@@ -417,33 +672,395 @@ def add_ngrams(tokens: List[str], n: int = 2) -> List[str]:
     return ["_".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
 
 
-def safe_read_csv(path: Path) -> Optional[pd.DataFrame]:
+def term_codes(descriptions: pd.Series, ngrams: bool = True) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Integer-coded ``tokenize`` (+ ``add_ngrams``) output for a whole column.
+
+    Returns ``(rows, codes, terms)``: ``rows`` are row positions in ascending order,
+    ``terms[codes]`` are the terms in ``tokens + add_ngrams(tokens)`` order within each
+    row. Each distinct description, token and bigram is processed only once.
+    """
+    text_codes, unique_text = pd.factorize(descriptions.astype(str).to_numpy(dtype=object))
+    text = pd.Series(unique_text, dtype=object).str.lower().str.replace(r"[^a-z0-9\s]", " ", regex=True)
+    split = text.str.split()
+    lengths = split.str.len().fillna(0).to_numpy(dtype=np.int64)
+    text_rows = np.repeat(np.arange(len(split), dtype=np.int64), lengths)
+    raw_tokens = np.fromiter(itertools.chain.from_iterable(split), dtype=object, count=int(lengths.sum()))
+    token_codes, unique_tokens = pd.factorize(raw_tokens)
+    unique_tokens = np.asarray(unique_tokens, dtype=object)
+    token_series = pd.Series(unique_tokens, dtype=object)
+    valid = (
+        (token_series.str.len() > 2)
+        & ~token_series.isin(STOPWORDS)
+        & ~token_series.str.contains(r"[0-9]", regex=True)
+    ).to_numpy(dtype=bool)
+    keep = valid[token_codes]
+    text_rows, token_codes = text_rows[keep], token_codes[keep]
+    terms = unique_tokens
+
+    if ngrams:
+        same_row = text_rows[1:] == text_rows[:-1]
+        num_tokens = len(unique_tokens)
+        pair_keys = token_codes[:-1][same_row] * num_tokens + token_codes[1:][same_row]
+        pair_codes, unique_pairs = pd.factorize(pair_keys)
+        first, second = np.divmod(np.asarray(unique_pairs, dtype=np.int64), max(num_tokens, 1))
+        terms = np.concatenate([unique_tokens, unique_tokens[first] + "_" + unique_tokens[second]])
+        text_rows = np.concatenate([text_rows, text_rows[:-1][same_row]])
+        token_codes = np.concatenate([token_codes, pair_codes + num_tokens])
+        order = np.argsort(text_rows, kind="stable")
+        text_rows, token_codes = text_rows[order], token_codes[order]
+
+    per_text = np.bincount(text_rows, minlength=len(unique_text))
+    text_starts = np.cumsum(per_text) - per_text
+    per_row = per_text[text_codes]
+    rows = np.repeat(np.arange(len(text_codes), dtype=np.int64), per_row)
+    offsets = np.arange(len(rows), dtype=np.int64) - np.repeat(np.cumsum(per_row) - per_row, per_row)
+    codes = token_codes[np.repeat(text_starts[text_codes], per_row) + offsets]
+    return rows, codes.astype(np.int64), terms
+
+
+TermCodes = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def slice_term_codes(tokens: TermCodes, start: int, stop: int) -> TermCodes:
+    """``term_codes`` output for rows ``start:stop``, renumbered from zero."""
+    rows, codes, terms = tokens
+    lo, hi = np.searchsorted(rows, [start, stop])
+    return rows[lo:hi] - start, codes[lo:hi], terms
+
+
+def take_term_rows(tokens: TermCodes, mask: np.ndarray) -> TermCodes:
+    """``term_codes`` output for the rows selected by a boolean mask, renumbered."""
+    rows, codes, terms = tokens
+    keep = mask[rows]
+    return (np.cumsum(mask) - 1)[rows[keep]], codes[keep], terms
+
+
+def encode_terms(descriptions: pd.Series, vocabulary: Dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    """Map ``term_codes`` output onto ``vocabulary`` ids; unknown terms are dropped."""
+    return vocabulary_ids(term_codes(descriptions), vocabulary)
+
+
+def vocabulary_ids(tokens: TermCodes, vocabulary: Dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    rows, codes, terms = tokens
+    if not vocabulary:
+        return rows[:0], codes[:0]
+    positions = pd.Index(list(vocabulary.keys())).get_indexer(terms)
+    ids = np.asarray(list(vocabulary.values()), dtype=np.int64)
+    term_ids = np.where(positions >= 0, ids[positions], -1)[codes]
+    known = term_ids >= 0
+    return rows[known], term_ids[known]
+
+
+def sniff_csv_header(path: Path) -> tuple[str, List[str]]:
+    """Pick the delimiter from the header line alone and return it with the column names."""
+    with path.open("r", encoding="utf-8", errors="replace", newline="") as handle:
+        header = handle.readline()
+    delimiter = max(CSV_DELIMITERS, key=header.count) if header else ","
+    names = next(csv.reader([header], delimiter=delimiter), [])
+    if names:
+        names[0] = names[0].lstrip("\ufeff")
+    return delimiter, names
+
+
+def record_source_read(path: Path, rows: int, columns: int, started: float, engine: str) -> None:
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = 0
+    SOURCE_READ_STATS[str(path)] = {
+        "bytes": int(size),
+        "rows": int(rows),
+        "columns": int(columns),
+        "seconds": round(time.perf_counter() - started, 4),
+        "engine": engine,
+    }
+
+
+@contextmanager
+def stage(name: str, rows_in: Optional[int] = None) -> Iterator[Dict]:
+    """Record wall/CPU time, peak traced memory and rows for one training stage.
+
+    Repeated stages accumulate into a single ``STAGE_TIMINGS`` entry. Stages
+    nest; a stage's peak includes its children. Set ``rows_out`` (or
+    ``rows_in``) on the yielded dict.
+    """
+    if STAGE_TRACE_MEMORY and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracing = tracemalloc.is_tracing()
+    frame = {"base": 0, "peak": 0}
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if STAGE_STACK:
+            STAGE_STACK[-1]["peak"] = max(STAGE_STACK[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+        frame = {"base": current, "peak": current}
+    record = STAGE_TIMINGS.setdefault(
+        name,
+        {"depth": len(STAGE_STACK), "calls": 0, "seconds": 0.0, "cpu_seconds": 0.0, "peak_mb": None, "rows_in": None, "rows_out": None},
+    )
+    profiler = cProfile.Profile() if PROFILE_DIR is not None and not STAGE_STACK else None
+    STAGE_STACK.append(frame)
+    rows = {"rows_in": rows_in, "rows_out": None}
+    wall, cpu = time.perf_counter(), time.process_time()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield rows
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        record["calls"] += 1
+        record["seconds"] = round(record["seconds"] + time.perf_counter() - wall, 4)
+        record["cpu_seconds"] = round(record["cpu_seconds"] + time.process_time() - cpu, 4)
+        STAGE_STACK.pop()
+        if tracing:
+            frame["peak"] = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            if STAGE_STACK:
+                STAGE_STACK[-1]["peak"] = max(STAGE_STACK[-1]["peak"], frame["peak"])
+            tracemalloc.reset_peak()
+            record["peak_mb"] = round(max(record["peak_mb"] or 0.0, (frame["peak"] - frame["base"]) / 2**20), 2)
+        for key in ("rows_in", "rows_out"):
+            if rows[key] is not None:
+                record[key] = (record[key] or 0) + int(rows[key])
+        if profiler is not None:
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(PROFILE_DIR / f"{name}.prof")
+
+
+def merge_stage_timings(timings: Dict[str, Dict]) -> None:
+    """Fold stage records from a worker process into ``STAGE_TIMINGS``."""
+    for name, other in timings.items():
+        record = STAGE_TIMINGS.get(name)
+        if record is None:
+            STAGE_TIMINGS[name] = dict(other)
+            continue
+        record["calls"] += other["calls"]
+        record["seconds"] = round(record["seconds"] + other["seconds"], 4)
+        record["cpu_seconds"] = round(record["cpu_seconds"] + other["cpu_seconds"], 4)
+        if other["peak_mb"] is not None:
+            record["peak_mb"] = max(record["peak_mb"] or 0.0, other["peak_mb"])
+        for key in ("rows_in", "rows_out"):
+            if other[key] is not None:
+                record[key] = (record[key] or 0) + other[key]
+
+
+def source_rows_read(sources: List[Dict]) -> int:
+    return sum(SOURCE_READ_STATS.get(str(source["path"]), {}).get("rows", 0) for source in sources)
+
+
+def safe_read_csv(
+    path: Path,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, object]] = None,
+) -> Optional[pd.DataFrame]:
+    """Read a CSV, parsing only ``usecols`` (those present in the header) with ``dtype``."""
+    started = time.perf_counter()
     try:
-        return pd.read_csv(path)
-    except Exception:
+        delimiter, header = sniff_csv_header(path)
+    except OSError:
+        return None
+    kwargs: Dict[str, object] = {"sep": delimiter}
+    columns = header
+    if usecols is not None:
+        columns = [col for col in dict.fromkeys(usecols) if col in header]
+        kwargs["usecols"] = columns
+    if dtype:
+        kwargs["dtype"] = {col: kind for col, kind in dtype.items() if col in columns}
+    engines = [CSV_ENGINE] if CSV_ENGINE == "c" else [CSV_ENGINE, "c"]
+    for engine in engines:
         try:
-            return pd.read_csv(path, sep="\t")
+            df = pd.read_csv(path, engine=engine, **kwargs)
         except Exception:
-            return None
+            continue
+        record_source_read(path, len(df), df.shape[1], started, engine)
+        return df
+    return None
 
 
-def safe_read_table(path: Path) -> Optional[pd.DataFrame]:
+def safe_read_table(
+    path: Path,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, object]] = None,
+) -> Optional[pd.DataFrame]:
     if path.suffix.lower() in {".xlsx", ".xls"}:
+        started = time.perf_counter()
+        wanted = set(usecols) if usecols is not None else None
         try:
-            return pd.read_excel(path)
+            df = pd.read_excel(path, usecols=(lambda col: col in wanted) if wanted is not None else None, dtype=dtype)
         except Exception:
             return None
-    return safe_read_csv(path)
+        record_source_read(path, len(df), df.shape[1], started, "excel")
+        return df
+    return safe_read_csv(path, usecols=usecols, dtype=dtype)
 
 
-def write_ts_module(path: Path, content: str) -> None:
+def iter_csv_chunks(
+    path: Path,
+    chunk_rows: int,
+    usecols: Optional[List[str]] = None,
+    dtype: Optional[Dict[str, object]] = None,
+) -> Iterator[pd.DataFrame]:
+    """``safe_read_csv`` in fixed-size chunks.
+
+    A file that cannot be opened yields nothing. A parse error partway through
+    is raised, and the read is recorded only once the whole file has been read.
+    """
+    started = time.perf_counter()
+    try:
+        delimiter, header = sniff_csv_header(path)
+    except OSError:
+        return
+    columns = header if usecols is None else [col for col in dict.fromkeys(usecols) if col in header]
+    kwargs: Dict[str, object] = {"sep": delimiter, "chunksize": chunk_rows}
+    if usecols is not None:
+        kwargs["usecols"] = columns
+    if dtype:
+        kwargs["dtype"] = {col: kind for col, kind in dtype.items() if col in columns}
+    rows = 0
+    with pd.read_csv(path, **kwargs) as reader:
+        for chunk in reader:
+            rows += len(chunk)
+            yield chunk
+    record_source_read(path, rows, len(columns), started, "c-chunked")
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` unless the file already holds it, so unchanged outputs keep their mtime."""
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
     path.write_text(content, encoding="utf-8")
+    return True
+
+
+def write_ts_module(path: Path, content: str) -> None:
+    write_text_if_changed(path, content)
+
+
+def write_model_artifact(model: str, content: str) -> None:
+    """Write a model's artifact; in compact format the payload goes to the public models dir behind a stub module."""
+    with stage(f"{model}.write"):
+        if ARTIFACT_FORMAT == "compact" and model in COMPACT_ARTIFACT_FILES:
+            write_compact_artifact(model, content)
+            content = compact_stub_module(model)
+        write_ts_module(ARTIFACTS_DIR / MODEL_ARTIFACTS[model], content)
+
+
+def write_compact_artifact(model: str, content: str) -> None:
+    """Write a compact payload and record its size and hash in the models manifest."""
+    COMPACT_ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
+    name = COMPACT_ARTIFACT_FILES[model]
+    data = content.encode("utf-8")
+    write_text_if_changed(COMPACT_ARTIFACTS_DIR / name, content)
+    manifest_path = COMPACT_ARTIFACTS_DIR / "manifest.json"
+    manifest = {"version": COMPACT_ARTIFACT_VERSION, "models": {}}
+    if manifest_path.exists():
+        try:
+            manifest["models"] = json.loads(manifest_path.read_text(encoding="utf-8")).get("models", {})
+        except (OSError, ValueError):
+            pass
+    manifest["models"][model] = {
+        "file": name,
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+    write_text_if_changed(manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
 
 
 def write_json(path: Path, payload: Dict) -> None:
     path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
 
 
+def parquet_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None or importlib.util.find_spec("fastparquet") is not None
+
+
+def cleaning_rules_fingerprint() -> Dict:
+    return {
+        "version": CLEANING_RULES_VERSION,
+        "allowed_categories": sorted(ALLOWED_CATEGORIES),
+        "category_aliases": CATEGORY_ALIASES,
+        "min_amount": MIN_AMOUNT,
+        "max_amount": MAX_AMOUNT,
+        "min_description_tokens": MIN_DESC_TOKENS,
+        "min_category_count": MIN_CATEGORY_COUNT,
+        "max_category_count": MAX_CATEGORY_COUNT,
+        "min_spending_category_count": MIN_SPENDING_CATEGORY_COUNT,
+        "min_spending_months": MIN_SPENDING_MONTHS,
+        "random_seed": RANDOM_SEED,
+        "csv_engine": CSV_ENGINE,
+        "stream_chunk_rows": STREAM_CHUNK_ROWS,
+    }
+
+
+def file_fingerprint(path: Path, known: Dict[str, Dict]) -> Dict:
+    """Size, mtime and SHA-256 of ``path``; the hash is reused while size and mtime match."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return {"path": str(path), "missing": True}
+    previous = known.get(str(path), {})
+    if previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+        digest = previous["sha256"]
+    else:
+        hasher = hashlib.sha256()
+        with path.open("rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+    return {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+
+
+def source_fingerprints(paths: List[Path]) -> List[Dict]:
+    index_path = DATASET_CACHE_DIR / "fingerprints.json"
+    try:
+        known = json.loads(index_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        known = {}
+    fingerprints = [file_fingerprint(Path(path), known) for path in paths]
+    for fingerprint in fingerprints:
+        if not fingerprint.get("missing"):
+            known[fingerprint["path"]] = fingerprint
+    try:
+        DATASET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_json(index_path, known)
+    except OSError:
+        pass
+    return fingerprints
+
+
+def load_cached_dataset(name: str, sources: List[Dict], build: Callable[[List[Dict]], pd.DataFrame]) -> pd.DataFrame:
+    """Return ``build(sources)``, reusing a Parquet copy keyed by source fingerprints and cleaning rules."""
+    if not parquet_available():
+        return build(sources)
+    payload = {
+        "sources": source_fingerprints([source["path"] for source in sources]),
+        "rules": cleaning_rules_fingerprint(),
+    }
+    key = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:20]
+    cache_path = DATASET_CACHE_DIR / f"{name}-{key}.parquet"
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            cache_path.unlink(missing_ok=True)
+
+    df = build(sources)
+    try:
+        DATASET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        df.to_parquet(tmp_path)
+        tmp_path.replace(cache_path)
+        for stale in DATASET_CACHE_DIR.glob(f"{name}-*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except Exception as exc:
+        print(f"Dataset cache skipped for {name}:", exc)
+    return df
+
+
 def write_training_metadata() -> None:
     payload = (
         "export const trainedDatasetSources = "
@@ -504,48 +1121,88 @@ def safe_div(numerator: float, denominator: float) -> float:
     return numerator / denominator if denominator else 0.0
 
 
+def encode_labels(y_true: Sequence[str], y_pred: Sequence[str]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Label-encode both sequences against their sorted union of labels."""
+    y_true = np.asarray(y_true, dtype=object)
+    y_pred = np.asarray(y_pred, dtype=object)
+    codes, uniques = pd.factorize(np.concatenate([y_true, y_pred]).astype(str))
+    order = np.argsort(np.asarray(uniques, dtype=object), kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    codes = rank[codes]
+    return np.asarray(uniques, dtype=object)[order], codes[: len(y_true)], codes[len(y_true):]
+
+
+def confusion_counts(true_codes: np.ndarray, pred_codes: np.ndarray, num_labels: int) -> np.ndarray:
+    """Dense (true, predicted) count matrix from one ``np.bincount``."""
+    flat = np.bincount(true_codes * num_labels + pred_codes, minlength=num_labels * num_labels)
+    return flat.reshape(num_labels, num_labels)
+
+
+def classification_metrics(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-class precision, recall, F1 and support derived from a confusion matrix."""
+    tp = np.diag(matrix).astype(np.float64)
+    predicted = matrix.sum(axis=0)
+    support = matrix.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(predicted > 0, tp / predicted, 0.0)
+        recall = np.where(support > 0, tp / support, 0.0)
+        f1 = np.where(precision + recall > 0, 2 * precision * recall / (precision + recall), 0.0)
+    return {"precision": precision, "recall": recall, "f1": f1, "support": support}
+
+
 def f1_metrics(y_true: List[str], y_pred: List[str]) -> Dict[str, float]:
-    labels = sorted(set(y_true) | set(y_pred))
-    if not labels:
+    labels, true_codes, pred_codes = encode_labels(y_true, y_pred)
+    if not len(labels):
         return {"macro_f1": 0.0, "weighted_f1": 0.0}
-    f1_scores = []
-    weighted_scores = []
-    total = len(y_true)
-    for label in labels:
-        tp = sum(1 for yt, yp in zip(y_true, y_pred) if yt == label and yp == label)
-        fp = sum(1 for yt, yp in zip(y_true, y_pred) if yt != label and yp == label)
-        fn = sum(1 for yt, yp in zip(y_true, y_pred) if yt == label and yp != label)
-        precision = safe_div(tp, tp + fp)
-        recall = safe_div(tp, tp + fn)
-        f1 = safe_div(2 * precision * recall, precision + recall)
-        support = sum(1 for yt in y_true if yt == label)
-        f1_scores.append(f1)
-        weighted_scores.append(f1 * support)
-    macro_f1 = sum(f1_scores) / len(f1_scores)
-    weighted_f1 = safe_div(sum(weighted_scores), total)
+    per_class = classification_metrics(confusion_counts(true_codes, pred_codes, len(labels)))
+    macro_f1 = float(per_class["f1"].mean())
+    weighted_f1 = safe_div(float((per_class["f1"] * per_class["support"]).sum()), len(y_true))
     return {"macro_f1": round(macro_f1, 4), "weighted_f1": round(weighted_f1, 4)}
 
 
+def top_k_hits(y_true: Sequence[str], top_k: np.ndarray) -> np.ndarray:
+    """Per row, whether the true label is among that row's top-k predictions."""
+    return (np.asarray(top_k, dtype=object) == np.asarray(y_true, dtype=object)[:, None]).any(axis=1)
+
+
+def top_k_accuracy(y_true: Sequence[str], top_k: np.ndarray) -> float:
+    """Share of rows whose true label is among that row's top-k predictions."""
+    if not len(y_true):
+        return 0.0
+    return float(top_k_hits(y_true, top_k).mean())
+
+
 def build_confusion_matrix(y_true: List[str], y_pred: List[str], top_n: int = 10) -> Dict[str, Dict[str, int]]:
-    labels = sorted(set(y_true) | set(y_pred))
-    counts = {label: 0 for label in labels}
-    for label in y_true:
-        counts[label] = counts.get(label, 0) + 1
-    top_labels = {label for label, _ in sorted(counts.items(), key=lambda item: item[1], reverse=True)[:top_n]}
+    labels, true_codes, pred_codes = encode_labels(y_true, y_pred)
+    if not len(labels):
+        return {}
+    support = np.bincount(true_codes, minlength=len(labels))
+    top_labels = np.argsort(-support, kind="stable")[:top_n]
+    # Collapse every label outside the top_n into the "Other" bucket
+    group_names = [str(labels[idx]) for idx in top_labels]
+    if "Other" not in group_names:
+        group_names.append("Other")
+    group = np.full(len(labels), group_names.index("Other"), dtype=np.int64)
+    group[top_labels] = np.arange(len(top_labels))
+    collapsed = confusion_counts(group[true_codes], group[pred_codes], len(group_names))
     matrix: Dict[str, Dict[str, int]] = {}
-    for yt, yp in zip(y_true, y_pred):
-        if yt not in top_labels:
-            yt = "Other"
-        if yp not in top_labels:
-            yp = "Other"
-        matrix.setdefault(yt, {})
-        matrix[yt][yp] = matrix[yt].get(yp, 0) + 1
+    for row, col in zip(*np.nonzero(collapsed)):
+        matrix.setdefault(group_names[row], {})[group_names[col]] = int(collapsed[row, col])
     return matrix
 
 
-def build_transaction_dataset() -> pd.DataFrame:
-    records = []
-    sources = [
+def map_sources(clean: Callable[[Dict], Optional[pd.DataFrame]], sources: List[Dict]) -> List[Optional[pd.DataFrame]]:
+    """Run ``clean`` over every source concurrently; results keep the order of ``sources``."""
+    workers = min(INGEST_WORKERS, len(sources))
+    if workers <= 1:
+        return [clean(source) for source in sources]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(clean, sources))
+
+
+def transaction_source_files() -> List[Dict]:
+    return [
         {
             "path": DATASET_PATHS["entrepreneurlife/personal-finance"] / "personal_transactions_dashboard_ready (2).xlsx",
             "map": {"date": "Date", "description": "Description", "amount": "Amount", "category": "Category", "type": "Transaction Type"},
@@ -560,83 +1217,229 @@ def build_transaction_dataset() -> pd.DataFrame:
         },
     ]
 
-    for source in sources:
-        df = safe_read_table(source["path"])
-        if df is None:
-            continue
-        mapping = source["map"]
-        required = ["date", "description", "amount", "category"]
-        cols = {key: mapping.get(key) for key in ["date", "description", "amount", "category", "type"] if mapping.get(key) in df.columns}
-        if not all(c in cols for c in required):
-            continue
-        subset = df[[cols[c] for c in cols]].rename(columns={v: k for k, v in cols.items()})
-        subset = subset.loc[:, ~subset.columns.duplicated()]
-        # Normalize: no coercing missing to defaults — reject invalid rows
-        subset["description"] = subset["description"].astype(str).map(normalize_description)
-        subset["category"] = subset["category"].astype(str).str.strip()
-        subset = subset.loc[subset["category"].str.len() > 0]
-        subset["category"] = subset["category"].apply(normalize_category)
-        subset["amount"] = pd.to_numeric(subset["amount"], errors="coerce")
-        subset["date"] = pd.to_datetime(subset["date"], errors="coerce")
-        if "type" in subset.columns:
-            subset["type"] = subset["type"].fillna("expense").astype(str)
+
+def build_transaction_dataset() -> pd.DataFrame:
+    sources = transaction_source_files()
+    with stage("transactions.load") as rows:
+        if DATASET_CACHE_ENABLED:
+            df = load_cached_dataset("transactions", sources, clean_transaction_sources)
         else:
-            subset["type"] = "expense"
-        # Reject rows that fail required schema (do not coerce)
-        subset = subset.dropna(subset=["date", "amount"])
-        subset = subset.loc[subset["amount"].abs().map(is_valid_amount)]
-        subset = subset.loc[subset["category"].isin(ALLOWED_CATEGORIES)]
-        subset = subset.loc[subset["description"].map(is_english_like)]
-        subset = subset.loc[subset["description"].str.split().str.len() >= MIN_DESC_TOKENS]
-        records.append(subset)
+            df = clean_transaction_sources(sources)
+        rows["rows_out"] = len(df)
+    return df
+
+
+def clean_transaction_source(source: Dict) -> Optional[pd.DataFrame]:
+    """Read one transaction source and keep only rows that pass the schema filters."""
+    mapping = source["map"]
+    text_columns = {mapping[key]: str for key in ("date", "description", "category", "type") if key in mapping}
+    df = safe_read_table(source["path"], usecols=list(mapping.values()), dtype=text_columns)
+    if df is None:
+        return None
+    return clean_transaction_frame(df, mapping)
+
+
+def clean_transaction_frame(df: pd.DataFrame, mapping: Dict[str, str]) -> Optional[pd.DataFrame]:
+    required = ["date", "description", "amount", "category"]
+    cols = {key: mapping.get(key) for key in ["date", "description", "amount", "category", "type"] if mapping.get(key) in df.columns}
+    if not all(c in cols for c in required):
+        return None
+    subset = df[[cols[c] for c in cols]].rename(columns={v: k for k, v in cols.items()})
+    subset = subset.loc[:, ~subset.columns.duplicated()]
+    # Normalize: no coercing missing to defaults — reject invalid rows
+    subset["description"] = subset["description"].astype(str).map(normalize_description)
+    subset["category"] = subset["category"].astype(str).str.strip()
+    subset = subset.loc[subset["category"].str.len() > 0]
+    subset["category"] = normalize_category_column(subset["category"])
+    subset["amount"] = pd.to_numeric(subset["amount"], errors="coerce")
+    subset["date"] = pd.to_datetime(subset["date"], errors="coerce")
+    if "type" in subset.columns:
+        subset["type"] = subset["type"].fillna("expense").astype(str)
+    else:
+        subset["type"] = "expense"
+    # Reject rows that fail required schema (do not coerce)
+    subset = subset.dropna(subset=["date", "amount"])
+    subset = subset.loc[subset["amount"].abs().map(is_valid_amount)]
+    subset = subset.loc[subset["category"].isin(ALLOWED_CATEGORIES)]
+    subset = subset.loc[subset["description"].map(is_english_like)]
+    subset = subset.loc[subset["description"].str.split().str.len() >= MIN_DESC_TOKENS]
+    return subset
+
+
+def clean_transaction_sources(sources: List[Dict]) -> pd.DataFrame:
+    with stage("transactions.read_clean") as rows:
+        records = [subset for subset in map_sources(clean_transaction_source, sources) if subset is not None]
+        rows["rows_in"] = source_rows_read(sources)
+        rows["rows_out"] = sum(len(subset) for subset in records)
 
     if not records:
         return pd.DataFrame(columns=["date", "description", "amount", "category", "type"])
-    combined = pd.concat(records, ignore_index=True)
-    combined = balance_categories(combined)
+    with stage("transactions.balance") as rows:
+        combined = pd.concat(records, ignore_index=True)
+        rows["rows_in"] = len(combined)
+        combined = balance_categories(combined)
+        rows["rows_out"] = len(combined)
     return combined
 
 
-def train_transaction_categorizer(df: pd.DataFrame) -> str:
-    if df.empty:
-        return (
-            "export const trainedCategoryKeywords = {} as const;\\n"
-            "export const trainedCategoryTokenWeights = {} as const;\\n"
-            "export const trainedCategoryWeights = {} as const;\\n"
-            "export const trainedCategoryPriors = {} as const;\\n"
+def fit_categorizer_stats(df: pd.DataFrame, tokens: Optional[TermCodes] = None) -> CategorizerStats:
+    """Count tokens, bigrams and amounts per category in one vectorized pass.
+
+    Every labelled category is counted, including ones below the training
+    threshold, so the statistics stay mergeable across batches of rows.
+    ``tokens`` is optional precomputed ``term_codes`` output for ``df``'s rows.
+    """
+    category = df["category"].str.strip().str.title()
+    category_counts = {str(cat): int(count) for cat, count in category.value_counts().to_dict().items()}
+    labelled = category.notna().to_numpy(dtype=bool)
+    cat_codes, categories = pd.factorize(category[labelled])
+    num_categories = len(categories)
+
+    with stage("categorizer.tokenize", rows_in=int(labelled.sum())) as timing:
+        if tokens is None:
+            rows, codes, terms = term_codes(df.loc[labelled, "description"].fillna("").astype(str))
+        else:
+            rows, codes, terms = take_term_rows(tokens, labelled)
+        timing["rows_out"] = len(rows)
+    with stage("categorizer.count", rows_in=len(rows)):
+        num_terms = max(len(terms), 1)
+        pair_codes, pair_keys = pd.factorize(cat_codes[rows] * num_terms + codes)
+        pair_category, pair_term = np.divmod(np.asarray(pair_keys, dtype=np.int64), num_terms)
+
+        # Per-category np.sum over rows in original order, so sum / count equals np.mean
+        amounts = df.loc[labelled, "amount"].abs().astype(float).to_numpy()
+        by_category = np.argsort(cat_codes, kind="stable")
+        amount_counts = np.bincount(cat_codes, minlength=num_categories)
+        groups = np.split(amounts[by_category], np.cumsum(amount_counts)[:-1]) if num_categories else []
+        stats = CategorizerStats(
+            category_counts=category_counts,
+            categories=[str(cat) for cat in categories],
+            terms=terms,
+            pair_category=pair_category,
+            pair_term=pair_term,
+            pair_count=np.bincount(pair_codes, minlength=len(pair_keys)).astype(np.int64),
+            amount_sums=np.array([np.sum(group) for group in groups], dtype=np.float64),
+            amount_counts=amount_counts.astype(np.int64),
         )
+    return stats
+
+
+def merge_categorizer_stats(base: CategorizerStats, delta: CategorizerStats) -> CategorizerStats:
+    """Fold the statistics of a new batch of rows into an existing state.
+
+    Categories, terms and (category, term) pairs keep their first-seen order,
+    with the new batch treated as later rows than everything in ``base``.
+    """
+    categories = list(base.categories)
+    category_index = {cat: idx for idx, cat in enumerate(categories)}
+    for cat in delta.categories:
+        if cat not in category_index:
+            category_index[cat] = len(categories)
+            categories.append(cat)
+    category_map = np.array([category_index[cat] for cat in delta.categories], dtype=np.int64)
+
+    term_map = pd.Index(base.terms).get_indexer(delta.terms)
+    new_terms = term_map < 0
+    term_map[new_terms] = len(base.terms) + np.arange(int(new_terms.sum()))
+    terms = np.concatenate([np.asarray(base.terms, dtype=object), np.asarray(delta.terms, dtype=object)[new_terms]])
+
+    num_terms = max(len(terms), 1)
+    keys = np.concatenate([
+        base.pair_category * num_terms + base.pair_term,
+        category_map[delta.pair_category] * num_terms + term_map[delta.pair_term],
+    ])
+    pair_codes, pair_keys = pd.factorize(keys)
+    pair_category, pair_term = np.divmod(np.asarray(pair_keys, dtype=np.int64), num_terms)
+    pair_count = np.bincount(
+        pair_codes, weights=np.concatenate([base.pair_count, delta.pair_count]), minlength=len(pair_keys)
+    )
 
-    df = df.copy()
-    df["category"] = df["category"].str.strip().str.title()
-    df["tokens"] = df["description"].fillna("").astype(str).apply(tokenize)
-    category_counts = df["category"].value_counts().to_dict()
-    valid_categories = {cat for cat, count in category_counts.items() if count >= 25}
-    total = sum(category_counts.values())
-    priors = {cat: count / total for cat, count in category_counts.items() if cat in valid_categories}
-
-    token_counts: Dict[str, Dict[str, int]] = {}
-    amount_stats: Dict[str, List[float]] = {}
-    for _, row in df.iterrows():
-        category = row["category"]
-        if category not in valid_categories:
-            continue
-        amount = float(abs(row["amount"]))
-        amount_stats.setdefault(category, []).append(amount)
-        token_counts.setdefault(category, {})
-        tokens = row["tokens"]
-        for token in tokens + add_ngrams(tokens):
-            token_counts[category][token] = token_counts[category].get(token, 0) + 1
-
-    keywords = {}
-    weights = {}
-    token_weights = build_token_weights(token_counts, min_count=2, top_n=120)
-    keywords = select_top_tokens(token_weights, top_n=50)
+    amount_sums = np.zeros(len(categories))
+    amount_counts = np.zeros(len(categories), dtype=np.int64)
+    amount_sums[: len(base.categories)] += base.amount_sums
+    amount_counts[: len(base.categories)] += base.amount_counts
+    np.add.at(amount_sums, category_map, delta.amount_sums)
+    np.add.at(amount_counts, category_map, delta.amount_counts)
+
+    counts = dict(base.category_counts)
+    for cat, count in delta.category_counts.items():
+        counts[cat] = counts.get(cat, 0) + count
+    # Same order as value_counts(): by count descending, ties in first-seen order
+    category_counts = dict(sorted(counts.items(), key=lambda item: -item[1]))
+    return CategorizerStats(
+        category_counts=category_counts,
+        categories=categories,
+        terms=terms,
+        pair_category=pair_category,
+        pair_term=pair_term,
+        pair_count=pair_count.astype(np.int64),
+        amount_sums=amount_sums,
+        amount_counts=amount_counts,
+    )
+
+
+def save_categorizer_state(stats: CategorizerStats, path: Path = CATEGORIZER_STATE_PATH) -> None:
+    """Persist categorizer sufficient statistics for later incremental training."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    num_categories = len(stats.categories)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("wb") as handle:
+        np.savez_compressed(
+            handle,
+            version=np.array(CATEGORIZER_STATE_VERSION),
+            categories=np.array(stats.categories, dtype=str),
+            terms=np.array(stats.terms, dtype=str),
+            pair_category=stats.pair_category,
+            pair_term=stats.pair_term,
+            pair_count=stats.pair_count,
+            count_categories=np.array(list(stats.category_counts.keys()), dtype=str),
+            count_values=np.array(list(stats.category_counts.values()), dtype=np.int64),
+            amount_sums=stats.amount_sums,
+            amount_counts=stats.amount_counts,
+            # Derived totals, stored for inspection; merging recomputes them from the pairs
+            document_frequencies=np.bincount(stats.pair_term, minlength=len(stats.terms)),
+            category_token_totals=np.bincount(
+                stats.pair_category, weights=stats.pair_count, minlength=num_categories
+            ).astype(np.int64),
+        )
+    tmp_path.replace(path)
 
-    for category, tokens in token_counts.items():
 
-        amounts = amount_stats.get(category, [])
-        if amounts:
-            avg_amount = float(np.mean(amounts))
+def load_categorizer_state(path: Path = CATEGORIZER_STATE_PATH) -> Optional[CategorizerStats]:
+    if not path.exists():
+        return None
+    with np.load(path, allow_pickle=False) as state:
+        if int(state["version"]) != CATEGORIZER_STATE_VERSION:
+            return None
+        return CategorizerStats(
+            category_counts={
+                str(cat): int(count) for cat, count in zip(state["count_categories"], state["count_values"])
+            },
+            categories=[str(cat) for cat in state["categories"]],
+            terms=state["terms"].astype(object),
+            pair_category=state["pair_category"].astype(np.int64),
+            pair_term=state["pair_term"].astype(np.int64),
+            pair_count=state["pair_count"].astype(np.int64),
+            amount_sums=state["amount_sums"].astype(np.float64),
+            amount_counts=state["amount_counts"].astype(np.int64),
+        )
+
+
+def derive_categorizer_model(
+    stats: CategorizerStats,
+    min_category_rows: int = 25,
+) -> tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, float]], Dict[str, float]]:
+    """Token weights, amount weights and priors from categorizer sufficient statistics."""
+    stats = stats.subset([stats.category_counts.get(cat, 0) >= min_category_rows for cat in stats.categories])
+    valid_categories = set(stats.categories)
+    total = sum(stats.category_counts.values())
+    priors = {cat: count / total for cat, count in stats.category_counts.items() if cat in valid_categories}
+    token_weights = build_token_weights(stats, min_count=2, top_n=120)
+
+    weights: Dict[str, Dict[str, float]] = {}
+    for category, amount_sum, amount_count in zip(stats.categories, stats.amount_sums, stats.amount_counts):
+        if amount_count:
+            avg_amount = float(amount_sum / amount_count)
             amount_weight = min(max(avg_amount / 100000, 0.1), 0.7)
             weights[category] = {
                 "amount": round(amount_weight, 3),
@@ -644,6 +1447,19 @@ def train_transaction_categorizer(df: pd.DataFrame) -> str:
                 "isSmall": 0.6 if avg_amount < 1000 else 0.2,
                 "isMedium": 0.4,
             }
+    return token_weights, weights, priors
+
+
+CategorizerArtifact = tuple[Dict[str, List[str]], Dict[str, Dict[str, float]], Dict[str, Dict[str, float]], Dict[str, float]]
+
+
+def categorizer_artifact(df: pd.DataFrame, stats: Optional[CategorizerStats] = None) -> CategorizerArtifact:
+    """Keywords, token weights, feature weights and priors exported for the frontend categorizer."""
+    if stats is None and df.empty:
+        return {}, {}, {}, {}
+
+    token_weights, weights, priors = derive_categorizer_model(stats if stats is not None else fit_categorizer_stats(df))
+    keywords = select_top_tokens(token_weights, top_n=50)
 
     # Merge curated extra keywords and token weights so categorizer has more vocabulary
     for cat, extra_tokens in CURATED_EXTRA_KEYWORDS.items():
@@ -674,7 +1490,7 @@ def train_transaction_categorizer(df: pd.DataFrame) -> str:
     # Ensure every category that has keywords/token_weights also has weights and priors
     # so the frontend scores them and words reflect their respective categories
     default_weight = {"amount": 0.1, "isLarge": 0.2, "isSmall": 0.6, "isMedium": 0.4}
-    all_categories = set(keywords.keys()) | set(token_weights.keys())
+    all_categories = sorted(set(keywords.keys()) | set(token_weights.keys()))
     for cat in all_categories:
         if cat not in weights:
             weights[cat] = default_weight.copy()
@@ -689,6 +1505,11 @@ def train_transaction_categorizer(df: pd.DataFrame) -> str:
     if total_prior > 0:
         priors = {k: round(v / total_prior, 10) for k, v in priors.items()}
 
+    return keywords, token_weights, weights, priors
+
+
+def categorizer_ts_module(artifact: CategorizerArtifact, compact_file: Optional[str] = None) -> str:
+    keywords, token_weights, weights, priors = artifact
     content = (
         "export const trainedCategoryKeywords = "
         + repr(keywords)
@@ -702,53 +1523,93 @@ def train_transaction_categorizer(df: pd.DataFrame) -> str:
         + "export const trainedCategoryPriors = "
         + repr(priors)
         + " as const;\n"
+        + "export const trainedCategoryCompactArtifact: string | null = "
+        + json.dumps(compact_file)
+        + ";\n"
     )
     return content
 
 
+def encode_uint16(values: Sequence[int]) -> str:
+    return base64.b64encode(np.asarray(values, dtype="<u2").tobytes()).decode("ascii")
+
+
+def compact_categorizer_payload(artifact: CategorizerArtifact) -> Dict:
+    """Categorizer artifact over a shared vocabulary with uint16 token ids and quantized weights.
+
+    Token weights are stored per category as ``round(w / scale)`` with
+    ``scale = max|w| / 65535``, so the absolute error is at most ``scale / 2``.
+    Arrays are little-endian base64; category ``i`` owns ``offsets[i]:offsets[i + 1]``.
+    """
+    keywords, token_weights, weights, priors = artifact
+    vocabulary = sorted(
+        {token for tokens in token_weights.values() for token in tokens}
+        | {token for tokens in keywords.values() for token in tokens}
+    )
+    if len(vocabulary) > 65536:
+        raise ValueError(f"Compact artifacts hold at most 65536 tokens, got {len(vocabulary)}")
+    token_ids = {token: index for index, token in enumerate(vocabulary)}
+    categories = sorted(set(keywords) | set(token_weights) | set(weights) | set(priors))
+
+    weight_ids: List[int] = []
+    weight_values: List[int] = []
+    weight_offsets = [0]
+    scales: List[float] = []
+    keyword_ids: List[int] = []
+    keyword_offsets = [0]
+    for category in categories:
+        category_weights = token_weights.get(category, {})
+        ids = np.array([token_ids[token] for token in category_weights], dtype=np.int64)
+        values = np.array(list(category_weights.values()), dtype=np.float64)
+        order = np.argsort(ids, kind="stable")
+        scale = float(np.abs(values).max()) / 65535 if len(values) else 0.0
+        quantized = np.rint(values[order] / scale) if scale > 0 else np.zeros(len(values))
+        weight_ids.extend(ids[order].tolist())
+        # Token weights are non-negative; clip so a stray negative cannot wrap around
+        weight_values.extend(np.clip(quantized, 0, 65535).astype(np.int64).tolist())
+        weight_offsets.append(len(weight_ids))
+        scales.append(scale)
+        keyword_ids.extend(token_ids[token] for token in keywords.get(category, []))
+        keyword_offsets.append(len(keyword_ids))
+
+    return {
+        "format": "transaction_categorizer",
+        "version": COMPACT_ARTIFACT_VERSION,
+        "vocabulary": vocabulary,
+        "categories": categories,
+        "tokenIds": encode_uint16(weight_ids),
+        "tokenWeights": encode_uint16(weight_values),
+        "tokenOffsets": weight_offsets,
+        "tokenScales": scales,
+        "keywordIds": encode_uint16(keyword_ids),
+        "keywordOffsets": keyword_offsets,
+        "weights": [weights.get(category, {}) for category in categories],
+        "priors": [priors.get(category) for category in categories],
+    }
+
+
+def compact_stub_module(model: str) -> str:
+    """TS module left in the bundle when a model's artifact is fetched from the public models dir."""
+    if model == "transaction_categorizer":
+        return categorizer_ts_module(({}, {}, {}, {}), COMPACT_ARTIFACT_FILES[model])
+    raise ValueError(f"No compact format for model: {model}")
+
+
+def train_transaction_categorizer(df: pd.DataFrame, stats: Optional[CategorizerStats] = None) -> str:
+    """TS module, or the compact JSON payload when ARTIFACT_FORMAT is "compact" (see write_model_artifact)."""
+    artifact = categorizer_artifact(df, stats)
+    if ARTIFACT_FORMAT == "compact":
+        return json.dumps(compact_categorizer_payload(artifact), separators=(",", ":"))
+    return categorizer_ts_module(artifact)
+
+
 def build_categorizer_model(
     df: pd.DataFrame,
+    tokens: Optional[TermCodes] = None,
 ) -> tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, float]], Dict[str, float]]:
     if df.empty:
         return {}, {}, {}
-    df = df.copy()
-    df["category"] = df["category"].str.strip().str.title()
-    df["tokens"] = df["description"].fillna("").astype(str).apply(tokenize)
-    category_counts = df["category"].value_counts().to_dict()
-    valid_categories = {cat for cat, count in category_counts.items() if count >= 25}
-    total = sum(category_counts.values())
-    priors = {cat: count / total for cat, count in category_counts.items() if cat in valid_categories}
-
-    token_counts: Dict[str, Dict[str, int]] = {}
-    amount_stats: Dict[str, List[float]] = {}
-    for _, row in df.iterrows():
-        category = row["category"]
-        if category not in valid_categories:
-            continue
-        amount = float(abs(row["amount"]))
-        amount_stats.setdefault(category, []).append(amount)
-        token_counts.setdefault(category, {})
-        tokens = row["tokens"]
-        for token in tokens + add_ngrams(tokens):
-            token_counts[category][token] = token_counts[category].get(token, 0) + 1
-
-    keywords = {}
-    weights = {}
-    token_weights = build_token_weights(token_counts, min_count=2, top_n=120)
-    keywords = select_top_tokens(token_weights, top_n=50)
-
-    for category, tokens in token_counts.items():
-
-        amounts = amount_stats.get(category, [])
-        if amounts:
-            avg_amount = float(np.mean(amounts))
-            amount_weight = min(max(avg_amount / 100000, 0.1), 0.7)
-            weights[category] = {
-                "amount": round(amount_weight, 3),
-                "isLarge": 0.6 if avg_amount > 10000 else 0.2,
-                "isSmall": 0.6 if avg_amount < 1000 else 0.2,
-                "isMedium": 0.4,
-            }
+    token_weights, weights, priors = derive_categorizer_model(fit_categorizer_stats(df, tokens))
 
     # Merge curated extra keywords/weights for build_categorizer_model (e.g. evaluation)
     for cat, extra_tokens in CURATED_EXTRA_KEYWORDS.items():
@@ -840,9 +1701,133 @@ def top_k_categories(
     return [cat for cat, _ in sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]]
 
 
-def build_spending_dataset() -> pd.DataFrame:
-    records = []
-    sources = [
+@dataclass(frozen=True)
+class CompiledCategorizer:
+    """Categorizer weights laid out as arrays over a fixed, sorted category axis."""
+
+    categories: List[str]
+    vocabulary: Dict[str, int]
+    token_matrix: np.ndarray
+    log_priors: np.ndarray
+    amount_weights: np.ndarray
+    large_weights: np.ndarray
+    small_weights: np.ndarray
+    medium_weights: np.ndarray
+
+
+def compile_categorizer(
+    token_weights: Dict[str, Dict[str, float]],
+    weights: Dict[str, Dict[str, float]],
+    priors: Dict[str, float],
+) -> CompiledCategorizer:
+    categories = sorted(set(token_weights.keys()) | set(priors.keys()))
+    vocabulary: Dict[str, int] = {}
+    for category in categories:
+        for token in token_weights.get(category, {}):
+            vocabulary.setdefault(token, len(vocabulary))
+
+    token_matrix = np.zeros((len(vocabulary), len(categories)), dtype=np.float64)
+    for col, category in enumerate(categories):
+        for token, weight in token_weights.get(category, {}).items():
+            token_matrix[vocabulary[token], col] = weight
+
+    def weight_vector(key: str) -> np.ndarray:
+        return np.array([weights.get(cat, {}).get(key, 0.0) for cat in categories], dtype=np.float64)
+
+    return CompiledCategorizer(
+        categories=categories,
+        vocabulary=vocabulary,
+        token_matrix=token_matrix,
+        log_priors=np.array([math.log(priors.get(cat, 1e-6)) for cat in categories], dtype=np.float64),
+        amount_weights=weight_vector("amount"),
+        large_weights=weight_vector("isLarge"),
+        small_weights=weight_vector("isSmall"),
+        medium_weights=weight_vector("isMedium"),
+    )
+
+
+def categorizer_scores(
+    descriptions: Sequence[str],
+    amounts: np.ndarray,
+    model: CompiledCategorizer,
+    tokens: Optional[TermCodes] = None,
+) -> np.ndarray:
+    """Score every description against every category; returns an (n, categories) array.
+
+    Matches ``predict_category`` term for term: the token part is the product of a
+    sparse description×token count matrix (held as CSR row/column index arrays) with
+    ``model.token_matrix``, summed per row with ``np.add.reduceat``.
+    """
+    amounts = np.abs(np.asarray(amounts, dtype=np.float64))
+    num_rows = len(amounts)
+    scores = np.tile(model.log_priors, (num_rows, 1))
+
+    if tokens is None:
+        rows, token_ids = encode_terms(pd.Series(list(descriptions), dtype=object), model.vocabulary)
+    else:
+        rows, token_ids = vocabulary_ids(tokens, model.vocabulary)
+    if len(token_ids):
+        present, starts = np.unique(rows, return_index=True)
+        contributions = model.token_matrix[token_ids]
+        scores[present] += np.add.reduceat(contributions, starts, axis=0)
+
+    is_large = amounts > 10000
+    is_small = amounts < 1000
+    is_medium = ~is_large & ~is_small
+    scores += np.minimum(amounts / 100000, 1)[:, None] * model.amount_weights
+    scores += is_large[:, None] * model.large_weights
+    scores += is_small[:, None] * model.small_weights
+    scores += is_medium[:, None] * model.medium_weights
+    return scores
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the k highest scores per row, best first."""
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.int64)
+    if k < scores.shape[1]:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def score_batch(
+    descriptions: Sequence[str],
+    amounts: Sequence[float],
+    model: CompiledCategorizer,
+    k: int = 3,
+    chunk_size: int = 65536,
+    tokens: Optional[TermCodes] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Batch equivalent of ``predict_category`` and ``top_k_categories``.
+
+    Returns the best category per row and an (n, k) array of the top-k categories.
+    Rows are scored in chunks so memory stays bounded for very large inputs.
+    ``tokens`` is optional precomputed ``term_codes`` output for ``descriptions``.
+    """
+    descriptions = list(descriptions)
+    amounts = np.asarray(amounts, dtype=np.float64)
+    num_rows = len(descriptions)
+    if not model.categories:
+        return np.full(num_rows, "Miscellaneous", dtype=object), np.empty((num_rows, 0), dtype=object)
+    labels = np.asarray(model.categories, dtype=object)
+    best = np.empty(num_rows, dtype=np.int64)
+    top = np.empty((num_rows, min(k, len(labels))), dtype=np.int64)
+    for start in range(0, num_rows, chunk_size):
+        stop = min(start + chunk_size, num_rows)
+        chunk_tokens = slice_term_codes(tokens, start, stop) if tokens is not None else None
+        scores = categorizer_scores(descriptions[start:stop], amounts[start:stop], model, chunk_tokens)
+        best[start:stop] = scores.argmax(axis=1)
+        top[start:stop] = top_k_indices(scores, k)
+    return labels[best], labels[top]
+
+
+def spending_source_files() -> List[Dict]:
+    return [
         {
             "path": DATASET_PATHS["ismetsemedov/personal-budget-transactions-dataset"] / "budget_data.csv",
             "map": {"date": "date", "category": "category", "amount": "amount"},
@@ -869,30 +1854,70 @@ def build_spending_dataset() -> pd.DataFrame:
         },
     ]
 
-    for source in sources:
-        df = safe_read_csv(source["path"])
-        if df is None:
-            continue
-        mapping = source["map"]
-        if not all(mapping[k] in df.columns for k in ["date", "category", "amount"]):
-            continue
-        subset = df[[mapping["date"], mapping["category"], mapping["amount"]]].rename(
-            columns={mapping["date"]: "date", mapping["category"]: "category", mapping["amount"]: "amount"}
-        )
-        subset["date"] = pd.to_datetime(subset["date"], errors="coerce")
-        subset["amount"] = pd.to_numeric(subset["amount"], errors="coerce")
-        subset["category"] = subset["category"].astype(str).str.strip()
-        subset = subset.loc[subset["category"].str.len() > 0]
-        subset["category"] = subset["category"].apply(normalize_category)
-        # Reject rows that fail required schema (do not coerce)
-        subset = subset.dropna(subset=["date", "amount"])
-        subset = subset.loc[subset["amount"].abs().map(is_valid_amount)]
-        subset = subset.loc[subset["category"].isin(ALLOWED_CATEGORIES)]
-        records.append(subset)
+
+def build_spending_dataset() -> "SpendingData":
+    """Cleaned spending rows, or per-period totals folded from chunks when STREAM_CHUNK_ROWS is set."""
+    sources = spending_source_files()
+    with stage("spending.load") as rows:
+        if STREAM_CHUNK_ROWS:
+            df = aggregate_spending_chunks(stream_spending_sources(sources))
+        elif DATASET_CACHE_ENABLED:
+            df = load_cached_dataset("spending", sources, clean_spending_sources)
+        else:
+            df = clean_spending_sources(sources)
+        rows["rows_out"] = len(df)
+    return df
+
+
+def clean_spending_source(source: Dict) -> Optional[pd.DataFrame]:
+    """Read one spending source and keep only rows that pass the schema filters."""
+    mapping = source["map"]
+    df = safe_read_csv(
+        source["path"],
+        usecols=list(mapping.values()),
+        dtype={mapping["date"]: str, mapping["category"]: str},
+    )
+    if df is None:
+        return None
+    return clean_spending_frame(df, mapping)
+
+
+def clean_spending_frame(df: pd.DataFrame, mapping: Dict[str, str]) -> Optional[pd.DataFrame]:
+    if not all(mapping[k] in df.columns for k in ["date", "category", "amount"]):
+        return None
+    subset = df[[mapping["date"], mapping["category"], mapping["amount"]]].rename(
+        columns={mapping["date"]: "date", mapping["category"]: "category", mapping["amount"]: "amount"}
+    )
+    subset["date"] = pd.to_datetime(subset["date"], errors="coerce")
+    subset["amount"] = pd.to_numeric(subset["amount"], errors="coerce")
+    subset["category"] = subset["category"].astype(str).str.strip()
+    subset = subset.loc[subset["category"].str.len() > 0]
+    subset["category"] = normalize_category_column(subset["category"])
+    # Reject rows that fail required schema (do not coerce)
+    subset = subset.dropna(subset=["date", "amount"])
+    subset = subset.loc[subset["amount"].abs().map(is_valid_amount)]
+    subset = subset.loc[subset["category"].isin(ALLOWED_CATEGORIES)]
+    return subset
+
+
+def clean_spending_sources(sources: List[Dict]) -> pd.DataFrame:
+    with stage("spending.read_clean") as rows:
+        records = [subset for subset in map_sources(clean_spending_source, sources) if subset is not None]
+        rows["rows_in"] = source_rows_read(sources)
+        rows["rows_out"] = sum(len(subset) for subset in records)
 
     if not records:
         return pd.DataFrame(columns=["date", "category", "amount"])
-    df = pd.concat(records, ignore_index=True)
+    with stage("spending.filter") as rows:
+        df = pd.concat(records, ignore_index=True)
+        rows["rows_in"] = len(df)
+        df = filter_spending_rows(df)
+        rows["rows_out"] = len(df)
+    return df
+
+
+def filter_spending_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse dates, clip outliers and drop sparse categories from the combined spending rows."""
     df["date"] = pd.to_datetime(df["date"], errors="coerce")
     df = df.dropna(subset=["date"])
     df["amount"] = df["amount"].abs()
@@ -902,29 +1927,175 @@ def build_spending_dataset() -> pd.DataFrame:
     df = df[df["category"].isin(keep_categories)]
     if df.empty:
         return df
-    df["month"] = df["date"].dt.to_period("M").astype(str)
+    df["month"] = df["date"].dt.year * 12 + df["date"].dt.month
     month_counts = df.groupby("category")["month"].nunique()
     keep_categories = month_counts[month_counts >= MIN_SPENDING_MONTHS].index.tolist()
     df = df[df["category"].isin(keep_categories)]
     return df.drop(columns=["month"])
 
 
-def train_spending_forecaster(df: pd.DataFrame) -> str:
+def iter_spending_source_chunks(sources: List[Dict], chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """Cleaned spending chunks, in source then row order."""
+    for source in sources:
+        mapping = source["map"]
+        chunks = iter_csv_chunks(
+            source["path"],
+            chunk_rows,
+            usecols=list(mapping.values()),
+            dtype={mapping["date"]: str, mapping["category"]: str},
+        )
+        for chunk in chunks:
+            subset = clean_spending_frame(chunk, mapping)
+            if subset is None:
+                break
+            if not subset.empty:
+                yield subset
+
+
+@dataclass
+class SpendingStreamState:
+    """Pass-one state for streaming spending ingestion."""
+
+    category_counts: Dict[str, int] = field(default_factory=dict)
+    category_months: Dict[str, set] = field(default_factory=dict)
+    amounts: QuantileSketch = field(default_factory=QuantileSketch)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.amounts.update(chunk["amount"].abs().to_numpy(dtype=np.float64))
+        for category, count in chunk["category"].value_counts().items():
+            self.category_counts[category] = self.category_counts.get(category, 0) + int(count)
+        months = chunk["date"].dt.year * 12 + chunk["date"].dt.month
+        for category, group in months.groupby(chunk["category"]):
+            self.category_months.setdefault(category, set()).update(group.unique().tolist())
+
+    def merge(self, other: "SpendingStreamState") -> None:
+        self.amounts.merge(other.amounts)
+        for category, count in other.category_counts.items():
+            self.category_counts[category] = self.category_counts.get(category, 0) + count
+        for category, months in other.category_months.items():
+            self.category_months.setdefault(category, set()).update(months)
+
+
+def scan_spending_sources(sources: List[Dict], chunk_rows: int) -> tuple[SpendingStreamState, List[Dict]]:
+    """Pass-one state over every readable source, and those sources.
+
+    A source that fails partway through is skipped whole, as ``safe_read_csv``
+    skips it, so none of its rows reach the statistics or the second pass.
+    """
+    state = SpendingStreamState()
+    readable = []
+    for source in sources:
+        source_state = SpendingStreamState()
+        try:
+            for chunk in iter_spending_source_chunks([source], chunk_rows):
+                source_state.update(chunk)
+        except Exception as exc:
+            print(f"Skipping unreadable spending source {source['path']}:", exc)
+            continue
+        state.merge(source_state)
+        readable.append(source)
+    return state, readable
+
+
+def stream_spending_sources(sources: List[Dict], chunk_rows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """Two-pass, chunked version of ``clean_spending_sources``.
+
+    Pass one keeps category row counts, per-category month sets and a quantile
+    sketch of amounts. Pass two re-reads the sources pass one could read, clips amounts to the
+    sketch's 1%/99% bounds and yields only rows from categories that pass the
+    same count and month thresholds. Each pass holds one chunk at a time.
+    """
+    chunk_rows = chunk_rows or STREAM_CHUNK_ROWS or 100_000
+    state, sources = scan_spending_sources(sources, chunk_rows)
+    lower = state.amounts.quantile(0.01)
+    upper = state.amounts.quantile(0.99)
+    keep_categories = {
+        category
+        for category, count in state.category_counts.items()
+        if count >= MIN_SPENDING_CATEGORY_COUNT and len(state.category_months.get(category, ())) >= MIN_SPENDING_MONTHS
+    }
+    for chunk in iter_spending_source_chunks(sources, chunk_rows):
+        chunk["amount"] = chunk["amount"].abs().clip(lower=lower, upper=upper)
+        chunk = chunk.loc[chunk["category"].isin(keep_categories)]
+        if not chunk.empty:
+            yield chunk
+
+
+def seasonal_period_keys(dates: pd.Series, period: str) -> np.ndarray:
+    """Integer season key per date: month 1-12, ISO week 1-53 or weekday 0-6 (0 = Sunday, as JS getDay)."""
+    if period == "month":
+        return dates.dt.month.to_numpy(dtype=np.int64)
+    if period == "week":
+        return dates.dt.isocalendar().week.to_numpy(dtype=np.int64)
+    if period == "weekday":
+        return ((dates.dt.dayofweek + 1) % 7).to_numpy(dtype=np.int64)
+    raise ValueError(f"Unknown seasonal period: {period}")
+
+
+def fit_seasonal_factors(df: "SpendingData", period: str = "month") -> Dict[str, Dict[int, float]]:
+    """Per-category mean spend in each season divided by the mean of those season means.
+
+    One groupby over integer (category, season) keys replaces a nested groupby per
+    category. Categories whose mean season spend is not positive are left out.
+    """
+    if isinstance(df, SpendingAggregates):
+        return df.seasonal_factors(period)
     if df.empty:
-        return "export const trainedSeasonality = {} as const;\\nexport const trainedAverages = {} as const;\\n"
+        return {}
+    category_codes, categories = pd.factorize(df["category"], sort=True)
+    keys = seasonal_period_keys(df["date"], period)
+    num_keys = int(keys.max()) + 1
+    season_means = df["amount"].groupby(category_codes * num_keys + keys).mean()
+    return seasonal_factors_from_means(season_means, categories, num_keys)
 
-    df = df.dropna(subset=["date"]).copy()
-    df["month"] = df["date"].dt.month
-    df["amount"] = df["amount"].abs()
 
-    seasonal = {}
-    averages = {}
-    for category, group in df.groupby("category"):
-        monthly = group.groupby("month")["amount"].mean()
-        overall = monthly.mean() if not monthly.empty else 0
-        if overall > 0:
-            seasonal[category] = {int(month): round(float(val / overall), 3) for month, val in monthly.items()}
-        averages[category] = round(float(group["amount"].mean() * 30), 2)
+def seasonal_factors_from_means(season_means: pd.Series, categories: Sequence, num_keys: int) -> Dict[str, Dict[int, float]]:
+    """``fit_seasonal_factors`` output from mean spend indexed by ``category code * num_keys + season``."""
+    cells = season_means.index.to_numpy(dtype=np.int64)
+    cell_category = cells // num_keys
+    overall = season_means.groupby(cell_category).mean()
+    factors = season_means.to_numpy() / overall.reindex(cell_category).to_numpy()
+
+    seasonality: Dict[str, Dict[int, float]] = {}
+    positive = set(overall.index[overall.to_numpy() > 0].tolist())
+    for cell_category_code, key, factor in zip(cell_category.tolist(), (cells % num_keys).tolist(), factors.tolist()):
+        if cell_category_code in positive:
+            seasonality.setdefault(str(categories[cell_category_code]), {})[key] = factor
+    return seasonality
+
+
+def round_seasonality(factors: Dict[str, Dict[int, float]]) -> Dict[str, Dict[int, float]]:
+    return {cat: {key: round(val, 3) for key, val in keys.items()} for cat, keys in factors.items()}
+
+
+def fit_category_averages(df: "SpendingData") -> Dict[str, float]:
+    """Mean transaction amount per category, scaled to a 30-day month."""
+    if isinstance(df, SpendingAggregates):
+        return df.category_averages()
+    if df.empty:
+        return {}
+    means = df.groupby("category")["amount"].mean()
+    return {str(category): float(mean * 30) for category, mean in means.items()}
+
+
+def train_spending_forecaster(df: "SpendingData", granularity: Optional[str] = None) -> str:
+    """Month-of-year seasonality and averages, plus finer factors for week/day granularity.
+
+    ``week`` adds ISO week-of-year factors and ``day`` adds those and day-of-week
+    factors. They are exported separately so ``trainedSeasonality`` keeps its
+    month shape; spending-forecaster.ts falls back to the month factor when they are empty.
+    """
+    granularity = granularity or SEASONAL_GRANULARITY
+    if df.empty:
+        seasonal, averages, weekly, daily = {}, {}, {}, {}
+    else:
+        if isinstance(df, pd.DataFrame):
+            df = df.dropna(subset=["date"]).copy()
+            df["amount"] = df["amount"].abs()
+        seasonal = round_seasonality(fit_seasonal_factors(df, "month"))
+        averages = {cat: round(avg, 2) for cat, avg in fit_category_averages(df).items()}
+        weekly = round_seasonality(fit_seasonal_factors(df, "week")) if granularity in ("week", "day") else {}
+        daily = round_seasonality(fit_seasonal_factors(df, "weekday")) if granularity == "day" else {}
 
     content = (
         "export const trainedSeasonality = "
@@ -933,44 +2104,127 @@ def train_spending_forecaster(df: pd.DataFrame) -> str:
         + "export const trainedAverages = "
         + repr(averages)
         + " as const;\n"
+        + "export const trainedWeekOfYearSeasonality = "
+        + repr(weekly)
+        + " as const;\n"
+        + "export const trainedDayOfWeekSeasonality = "
+        + repr(daily)
+        + " as const;\n"
     )
     return content
 
 
-def train_budget_allocator() -> str:
-    shares = {}
+BUDGET_SHARE_FILES = ["rural_budget_allocation_dataset.csv", "urban_budget_allocation_dataset.csv"]
+HABITS_SPEND_COLUMNS = [
+    "Rent", "Loan_Repayment", "Insurance", "Groceries", "Transport", "Eating_Out",
+    "Entertainment", "Utilities", "Healthcare", "Education", "Miscellaneous",
+]
+# Source stat signature -> share matrix, so training, export and evaluation build it once per run
+BUDGET_SHARE_CACHE: Dict[tuple, "BudgetShares"] = {}
+
+
+@dataclass
+class BudgetShares:
+    """Per-row spending shares on a fixed category axis.
+
+    ``present`` marks the categories each row's source reports; the others
+    are absent rather than zero, as in the old list-of-dicts rows.
+    """
+
+    categories: List[str]
+    shares: np.ndarray
+    present: np.ndarray
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(np.where(self.present, self.shares, np.nan), columns=self.categories)
+
+    def average_shares(self) -> Dict[str, float]:
+        return {
+            category: round(float(np.mean(self.shares[self.present[:, idx], idx])), 4)
+            for idx, category in enumerate(self.categories)
+            if self.present[:, idx].any()
+        }
+
 
-    # Budget allocation dataset
-    for name in ["rural_budget_allocation_dataset.csv", "urban_budget_allocation_dataset.csv"]:
-        path = DATASET_PATHS["shrinolo/budget-allocation"] / name
-        df = safe_read_csv(path)
+def budget_share_block(values: np.ndarray, columns: List[str], categories: Dict[str, int]) -> tuple[np.ndarray, np.ndarray]:
+    """Row-normalize one source's spend columns onto the shared category axis."""
+    column_categories = []
+    for col in columns:
+        category = normalize_category(col.replace("Budget", ""))
+        column_categories.append(categories.setdefault(category, len(categories)))
+    # Accumulate column by column so totals match a left-to-right Python sum
+    total = np.zeros(len(values))
+    for idx in range(values.shape[1]):
+        total = total + values[:, idx]
+    keep = ~(total <= 0)
+    shares = values[keep] / total[keep, None]
+    block = np.zeros((len(shares), len(categories)))
+    present = np.zeros(len(categories), dtype=bool)
+    for idx, category_idx in enumerate(column_categories):
+        block[:, category_idx] += shares[:, idx]
+        present[category_idx] = True
+    return block, present
+
+
+def budget_share_paths() -> List[Path]:
+    paths = [DATASET_PATHS["shrinolo/budget-allocation"] / name for name in BUDGET_SHARE_FILES]
+    paths.append(DATASET_PATHS["shriyashjagtap/indian-personal-finance-and-spending-habits"] / "data.csv")
+    return paths
+
+
+def budget_share_signature() -> tuple:
+    signature = []
+    for path in budget_share_paths():
+        try:
+            stat = path.stat()
+            signature.append((str(path), stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+def build_budget_shares() -> BudgetShares:
+    """Share matrix from the rural/urban budget files and the spending-habits table.
+
+    Rows with a non-positive total are dropped. Source columns that normalize to
+    the same category are summed into one share.
+    """
+    signature = budget_share_signature()
+    if signature in BUDGET_SHARE_CACHE:
+        return BUDGET_SHARE_CACHE[signature]
+
+    categories: Dict[str, int] = {}
+    blocks: List[tuple[np.ndarray, np.ndarray]] = []
+    for name in BUDGET_SHARE_FILES:
+        df = safe_read_csv(DATASET_PATHS["shrinolo/budget-allocation"] / name)
         if df is None:
             continue
         budget_cols = [col for col in df.columns if col.endswith("Budget")]
-        for _, row in df.iterrows():
-            total = sum(row.get(col, 0) for col in budget_cols)
-            if total <= 0:
-                continue
-            for col in budget_cols:
-                category = normalize_category(col.replace("Budget", ""))
-                shares.setdefault(category, []).append(float(row.get(col, 0)) / total)
+        blocks.append(budget_share_block(df[budget_cols].to_numpy(dtype=np.float64), budget_cols, categories))
 
-    # Personal finance spending habits dataset
     habits_path = DATASET_PATHS["shriyashjagtap/indian-personal-finance-and-spending-habits"] / "data.csv"
-    habits = safe_read_csv(habits_path)
+    habits = safe_read_csv(habits_path, usecols=HABITS_SPEND_COLUMNS)
     if habits is not None:
-        spend_cols = [
-            "Rent", "Loan_Repayment", "Insurance", "Groceries", "Transport", "Eating_Out",
-            "Entertainment", "Utilities", "Healthcare", "Education", "Miscellaneous",
-        ]
-        for _, row in habits.iterrows():
-            total = sum(float(row.get(col, 0)) for col in spend_cols)
-            if total <= 0:
-                continue
-            for col in spend_cols:
-                shares.setdefault(normalize_category(col), []).append(float(row.get(col, 0)) / total)
+        # Missing spend columns count as zero spend, as before
+        values = habits.reindex(columns=HABITS_SPEND_COLUMNS, fill_value=0).to_numpy(dtype=np.float64)
+        blocks.append(budget_share_block(values, HABITS_SPEND_COLUMNS, categories))
 
-    average_shares = {cat: round(float(np.mean(vals)), 4) for cat, vals in shares.items() if vals}
+    num_categories = len(categories)
+    shares = np.zeros((sum(len(block) for block, _ in blocks), num_categories))
+    present = np.zeros(shares.shape, dtype=bool)
+    offset = 0
+    for block, block_present in blocks:
+        rows = slice(offset, offset + len(block))
+        shares[rows, : block.shape[1]] = block
+        present[rows, : len(block_present)] = block_present
+        offset += len(block)
+    result = BudgetShares(categories=list(categories), shares=shares, present=present)
+    BUDGET_SHARE_CACHE[signature] = result
+    return result
+
+
+def train_budget_allocator() -> str:
+    average_shares = build_budget_shares().average_shares()
     return "export const trainedBudgetShares = " + repr(average_shares) + " as const;\n"
 
 
@@ -997,9 +2251,60 @@ def train_goal_predictor() -> str:
     return "export const trainedSavingsRates = " + repr(rates) + " as const;\n"
 
 
-def train_anomaly_detector(df: pd.DataFrame) -> str:
-    if df.empty:
-        return "export const trainedCategoryStats = {} as const;\n"
+def anomaly_category_stats(median: float, mad: float, percentiles: Dict[str, float], count: int) -> Dict:
+    stats = {"median": round(median, 4), "mad": round(mad, 4)}
+    stats.update({key: round(value, 4) for key, value in percentiles.items()})
+    stats["count"] = int(count)
+    return stats
+
+
+def sketch_category_amounts(df: pd.DataFrame, rank_error: float) -> Dict[str, QuantileSketch]:
+    """One quantile sketch of absolute amounts per category for a shard of rows."""
+    sketches: Dict[str, QuantileSketch] = {}
+    for category, group in df.groupby("category"):
+        sketch = QuantileSketch.for_error(rank_error)
+        sketch.update(group["amount"].abs().to_numpy(dtype=np.float64))
+        sketches[category] = sketch
+    return sketches
+
+
+def merge_category_sketches(shards: Sequence[Dict[str, QuantileSketch]]) -> Dict[str, QuantileSketch]:
+    merged: Dict[str, QuantileSketch] = {}
+    for shard in shards:
+        for category, sketch in shard.items():
+            if category in merged:
+                merged[category].merge(sketch)
+            else:
+                merged[category] = sketch
+    return {category: merged[category] for category in sorted(merged)}
+
+
+def sketch_anomaly_stats(df: pd.DataFrame, rank_error: float, shard_rows: int = ANOMALY_SKETCH_SHARD_ROWS) -> Dict[str, Dict]:
+    """Per-category anomaly statistics from per-shard sketches merged into one per category."""
+    shards = [df.iloc[start:start + shard_rows] for start in range(0, len(df), max(shard_rows, 1))]
+    if INGEST_WORKERS > 1 and len(shards) > 1:
+        with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as pool:
+            sketches = list(pool.map(lambda shard: sketch_category_amounts(shard, rank_error), shards))
+    else:
+        sketches = [sketch_category_amounts(shard, rank_error) for shard in shards]
+
+    stats = {}
+    for category, sketch in merge_category_sketches(sketches).items():
+        if sketch.count < 5:
+            continue
+        stats[category] = anomaly_category_stats(
+            sketch.quantile(0.5),
+            sketch.median_absolute_deviation(),
+            {key: sketch.percentile(p) for key, p in ANOMALY_PERCENTILES.items()},
+            sketch.count,
+        )
+    return stats
+
+
+def fit_anomaly_stats(df: pd.DataFrame) -> Dict[str, Dict]:
+    """The ``trainedCategoryStats`` mapping, exact or sketched per ``ANOMALY_SKETCH_ERROR``."""
+    if ANOMALY_SKETCH_ERROR is not None:
+        return sketch_anomaly_stats(df, ANOMALY_SKETCH_ERROR)
 
     stats = {}
     for category, group in df.groupby("category"):
@@ -1008,25 +2313,15 @@ def train_anomaly_detector(df: pd.DataFrame) -> str:
             continue
         median = float(np.median(amounts))
         mad = float(np.median(np.abs(amounts - median)))
-        p90 = float(np.percentile(amounts, 90))
-        p95 = float(np.percentile(amounts, 95))
-        p97 = float(np.percentile(amounts, 97))
-        p98 = float(np.percentile(amounts, 98))
-        p99 = float(np.percentile(amounts, 99))
-        p995 = float(np.percentile(amounts, 99.5))
-        stats[category] = {
-            "median": round(median, 4),
-            "mad": round(mad, 4),
-            "p90": round(p90, 4),
-            "p95": round(p95, 4),
-            "p97": round(p97, 4),
-            "p98": round(p98, 4),
-            "p99": round(p99, 4),
-            "p995": round(p995, 4),
-            "count": int(len(amounts)),
-        }
+        percentiles = {key: float(np.percentile(amounts, p)) for key, p in ANOMALY_PERCENTILES.items()}
+        stats[category] = anomaly_category_stats(median, mad, percentiles, len(amounts))
+    return stats
 
-    return "export const trainedCategoryStats = " + repr(stats) + " as const;\n"
+
+def train_anomaly_detector(df: pd.DataFrame) -> str:
+    if df.empty:
+        return "export const trainedCategoryStats = {} as const;\n"
+    return "export const trainedCategoryStats = " + repr(fit_anomaly_stats(df)) + " as const;\n"
 
 
 def export_clean_datasets(model: str, output_dir: Path) -> None:
@@ -1037,14 +2332,18 @@ def export_clean_datasets(model: str, output_dir: Path) -> None:
             transactions.to_csv(output_dir / "transactions_clean.csv", index=False)
         return
     if model == "spending_forecaster":
+        if STREAM_CHUNK_ROWS:
+            for idx, chunk in enumerate(stream_spending_sources(spending_source_files())):
+                chunk.to_csv(output_dir / "spending_clean.csv", index=False, header=idx == 0, mode="a" if idx else "w")
+            return
         spending = build_spending_dataset()
         if not spending.empty:
             spending.to_csv(output_dir / "spending_clean.csv", index=False)
         return
     if model == "budget_allocator":
-        rows = build_budget_share_rows()
-        if rows:
-            pd.DataFrame(rows).to_csv(output_dir / "budget_shares_clean.csv", index=False)
+        budget = build_budget_shares()
+        if len(budget.shares):
+            budget.to_frame().to_csv(output_dir / "budget_shares_clean.csv", index=False)
         return
     if model == "goal_predictor":
         habits_path = DATASET_PATHS["shriyashjagtap/indian-personal-finance-and-spending-habits"] / "data.csv"
@@ -1061,127 +2360,634 @@ def export_clean_datasets(model: str, output_dir: Path) -> None:
         return
 
 
+def ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise ``safe_div``: 0 where the denominator is 0."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=np.asarray(denominator) != 0)
+
+
+def resample_metrics(model: str, samples: Dict[str, np.ndarray], idx: np.ndarray) -> Dict[str, np.ndarray]:
+    """Every metric of ``model`` for each row of a (resamples x holdout rows) index matrix."""
+    if model == "transaction_categorizer":
+        true, pred = samples["true"][idx], samples["pred"][idx]
+        num_labels = int(max(samples["true"].max(initial=-1), samples["pred"].max(initial=-1))) + 1
+        offsets = np.arange(len(idx))[:, None] * num_labels
+        size = len(idx) * num_labels
+        support = np.bincount((offsets + true).ravel(), minlength=size).reshape(len(idx), num_labels)
+        predicted = np.bincount((offsets + pred).ravel(), minlength=size).reshape(len(idx), num_labels)
+        tp = np.bincount((offsets + true).ravel(), weights=(true == pred).ravel(), minlength=size).reshape(len(idx), num_labels)
+        seen = support + predicted
+        # 2PR / (P + R) == 2TP / (support + predicted); labels absent from a resample are skipped
+        f1 = ratio(2 * tp, seen)
+        return {
+            "macro_f1": ratio(f1.sum(axis=1), (seen > 0).sum(axis=1)),
+            "weighted_f1": (f1 * support).sum(axis=1) / idx.shape[1],
+            "top3_accuracy": samples["top3_hit"][idx].mean(axis=1),
+        }
+    if model == "spending_forecaster":
+        direction = samples["direction"][idx]
+        defined = ~np.isnan(direction)
+        return {
+            "mae": samples["errors"][idx].mean(axis=1),
+            "mape": samples["ape"][idx].mean(axis=1),
+            "directional_accuracy": ratio(np.where(defined, direction, 0).sum(axis=1), defined.sum(axis=1)),
+        }
+    if model == "budget_allocator":
+        return {"rmse": samples["rmse"][idx].mean(axis=1)}
+    if model == "goal_predictor":
+        return {
+            "brier": samples["squared_error"][idx].mean(axis=1),
+            "mae": samples["absolute_error"][idx].mean(axis=1),
+        }
+    if model == "anomaly_detector":
+        label, alert = samples["label"][idx], samples["alert"][idx]
+        tp = (label & alert).sum(axis=1)
+        return {
+            "precision": ratio(tp, alert.sum(axis=1)),
+            "recall": ratio(tp, label.sum(axis=1)),
+            "alert_rate": alert.mean(axis=1),
+        }
+    raise ValueError(f"Unknown model: {model}")
+
+
+def bootstrap_chunk(
+    model: str,
+    samples: Dict[str, np.ndarray],
+    resamples: int,
+    seed: np.random.SeedSequence,
+) -> Dict[str, np.ndarray]:
+    """Metrics for ``resamples`` bootstrap draws, built in blocks of index matrices."""
+    rng = np.random.default_rng(seed)
+    rows = len(next(iter(samples.values())))
+    block = max(1, BOOTSTRAP_BLOCK_CELLS // max(rows, 1))
+    parts: Dict[str, List[np.ndarray]] = {}
+    for start in range(0, resamples, block):
+        idx = rng.integers(0, rows, size=(min(block, resamples - start), rows))
+        for name, values in resample_metrics(model, samples, idx).items():
+            parts.setdefault(name, []).append(values)
+    return {name: np.concatenate(values) for name, values in parts.items()}
+
+
+def bootstrap_intervals(
+    model: str,
+    samples: Dict[str, np.ndarray],
+    resamples: int,
+    seed: int = RANDOM_SEED,
+) -> Dict[str, List[float]]:
+    """95% percentile intervals of every metric over ``resamples`` bootstrap draws.
+
+    Draws are split across a process pool; inside a pool worker (``--jobs``) they
+    run in-process, since the models are already evaluated in parallel.
+    """
+    if not resamples or not samples or not len(next(iter(samples.values()))):
+        return {}
+    # Fixed-size chunks with their own seeds, so intervals do not depend on the worker count
+    sizes = [min(BOOTSTRAP_CHUNK_RESAMPLES, resamples - start) for start in range(0, resamples, BOOTSTRAP_CHUNK_RESAMPLES)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = min(BOOTSTRAP_WORKERS, len(sizes))
+    if workers > 1 and multiprocessing.parent_process() is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(bootstrap_chunk, [model] * len(sizes), [samples] * len(sizes), sizes, seeds))
+    else:
+        chunks = [bootstrap_chunk(model, samples, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    intervals = {}
+    for name in chunks[0]:
+        values = np.concatenate([chunk[name] for chunk in chunks])
+        low, high = np.percentile(values, [2.5, 97.5])
+        intervals[name] = [round(float(low), 4), round(float(high), 4)]
+    return intervals
+
+
+def rolling_origin_folds(num_rows: int, folds: int) -> List[tuple[int, int]]:
+    """(train_stop, test_stop) per fold over date-sorted rows split into ``folds + 1`` blocks.
+
+    Fold i trains on blocks 0..i and tests on block i + 1, so the training window expands.
+    """
+    bounds = np.concatenate([[0], np.cumsum([len(block) for block in np.array_split(np.arange(num_rows), folds + 1)])])
+    return [(int(bounds[i + 1]), int(bounds[i + 2])) for i in range(folds)]
+
+
+def kfold_indices(num_rows: int, folds: int, seed: int = RANDOM_SEED) -> List[tuple[np.ndarray, np.ndarray]]:
+    """(train, test) row positions for shuffled k-fold splits."""
+    permutation = np.random.default_rng(seed).permutation(num_rows)
+    splits = []
+    for test in np.array_split(permutation, folds):
+        train = np.setdiff1d(permutation, test)
+        splits.append((train, np.sort(test)))
+    return splits
+
+
+def fold_metrics(
+    model: str,
+    train_df: pd.DataFrame,
+    test_df: pd.DataFrame,
+    train_tokens: Optional[TermCodes] = None,
+    test_tokens: Optional[TermCodes] = None,
+) -> Dict:
+    if model == "transaction_categorizer":
+        return categorizer_holdout_metrics(train_df, test_df, train_tokens, test_tokens)
+    if model == "spending_forecaster":
+        return spending_holdout_metrics(train_df, test_df)
+    if model == "budget_allocator":
+        return budget_holdout_metrics(train_df, test_df)
+    if model == "goal_predictor":
+        return goal_holdout_metrics(train_df, test_df)
+    if model == "anomaly_detector":
+        return anomaly_holdout_metrics(train_df, test_df)
+    raise ValueError(f"Unknown model: {model}")
+
+
+def cross_validate(model: str, transactions: pd.DataFrame, spending: "SpendingData", folds: int) -> Dict:
+    """Mean and standard deviation of every scalar metric across CV folds.
+
+    Transaction and spending models use rolling-origin folds over date-sorted rows;
+    the budget allocator and goal predictor use shuffled k-fold. The categorizer's
+    descriptions are tokenized once and each fold takes its slice of the codes.
+    Folds run in a process pool (in-process when already inside a pool worker).
+    """
+    if isinstance(spending, SpendingAggregates) and model in SPENDING_MODELS:
+        # Streamed spending keeps only monthly totals, so folds end on month boundaries
+        bounds = rolling_origin_folds(len(spending), folds) if not spending.empty else []
+        results = [
+            aggregate_holdout_metrics(spending, spending.month_boundary(train_stop), spending.month_boundary(test_stop))
+            for train_stop, test_stop in bounds
+        ]
+        return summarize_folds("rolling_origin", results)
+
+    tasks: List[tuple] = []
+    if model in ROLLING_ORIGIN_MODELS:
+        df = transactions if model in TRANSACTION_MODELS else spending
+        df = df.dropna(subset=["date"]).sort_values("date", kind="stable").reset_index(drop=True)
+        tokens = term_codes(df["description"].astype(str)) if model == "transaction_categorizer" else None
+        for train_stop, test_stop in rolling_origin_folds(len(df), folds):
+            tasks.append((
+                model,
+                df.iloc[:train_stop],
+                df.iloc[train_stop:test_stop],
+                slice_term_codes(tokens, 0, train_stop) if tokens is not None else None,
+                slice_term_codes(tokens, train_stop, test_stop) if tokens is not None else None,
+            ))
+        scheme = "rolling_origin"
+    else:
+        df = budget_share_frame() if model == "budget_allocator" else goal_savings_frame()
+        for train, test in kfold_indices(len(df), folds):
+            tasks.append((model, df.iloc[train], df.iloc[test], None, None))
+        scheme = "kfold"
+    if not tasks or df.empty:
+        return {}
+
+    workers = min(CV_WORKERS, len(tasks))
+    if workers > 1 and multiprocessing.parent_process() is None:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=set_dataset_paths,
+            initargs=(DATASET_PATHS, worker_settings()),
+        ) as pool:
+            results = list(pool.map(fold_metrics, *zip(*tasks)))
+    else:
+        results = [fold_metrics(*task) for task in tasks]
+    return summarize_folds(scheme, results)
+
+
+def summarize_folds(scheme: str, results: List[Dict]) -> Dict:
+    if not results:
+        return {}
+    summary = {}
+    for name, value in results[0].items():
+        if name == "samples" or isinstance(value, (bool, dict, list, str)):
+            continue
+        values = np.array([result.get(name, 0.0) for result in results], dtype=np.float64)
+        summary[name] = {
+            "mean": round(float(values.mean()), 4),
+            "std": round(float(values.std(ddof=1)) if len(values) > 1 else 0.0, 4),
+        }
+    return {
+        "scheme": scheme,
+        "folds": len(results),
+        "samples": int(sum(result.get("samples", 0) for result in results)),
+        "metrics": summary,
+    }
+
+
+MODEL_ARTIFACTS = {
+    "transaction_categorizer": "transaction-categorizer.ts",
+    "spending_forecaster": "spending-forecaster.ts",
+    "budget_allocator": "budget-allocator.ts",
+    "goal_predictor": "goal-predictor.ts",
+    "anomaly_detector": "anomaly-detector.ts",
+}
+
+TRANSACTION_MODELS = ("transaction_categorizer", "anomaly_detector")
+SPENDING_MODELS = ("spending_forecaster",)
+
+
+# Module settings that trainers read and pool workers must inherit from the parent
+WORKER_SETTINGS = (
+    "ARTIFACT_FORMAT",
+    "ANOMALY_SKETCH_ERROR",
+    "BOOTSTRAP_RESAMPLES",
+    "CSV_ENGINE",
+    "CV_FOLDS",
+    "DATASET_CACHE_ENABLED",
+    "INGEST_WORKERS",
+    "PROFILE_DIR",
+    "SEASONAL_GRANULARITY",
+    "STAGE_TRACE_MEMORY",
+    "STREAM_CHUNK_ROWS",
+)
+
+
+def worker_settings() -> Dict[str, object]:
+    return {name: globals()[name] for name in WORKER_SETTINGS}
+
+
+def set_dataset_paths(paths: Dict[str, Path], settings: Optional[Dict[str, object]] = None) -> None:
+    """Process-pool initializer so workers resolve sources and settings the same way as the parent."""
+    global DATASET_PATHS
+    DATASET_PATHS = dict(paths)
+    for name, value in (settings or {}).items():
+        if name in WORKER_SETTINGS:
+            globals()[name] = value
+
+
+def train_model(model: str, transactions: pd.DataFrame, spending: "SpendingData") -> str:
+    with stage(f"{model}.train", rows_in=model_rows(model, transactions, spending) or None):
+        return run_trainer(model, transactions, spending)
+
+
+def train_categorizer_with_state(transactions: pd.DataFrame) -> tuple[str, CategorizerStats]:
+    """Categorizer artifact content and the sufficient statistics it was derived from."""
+    with stage("transaction_categorizer.train", rows_in=len(transactions)):
+        stats = fit_categorizer_stats(transactions)
+        return train_transaction_categorizer(transactions, stats), stats
+
+
+def run_trainer(model: str, transactions: pd.DataFrame, spending: "SpendingData") -> str:
+    if model == "transaction_categorizer":
+        return train_transaction_categorizer(transactions)
+    if model == "spending_forecaster":
+        return train_spending_forecaster(spending)
+    if model == "budget_allocator":
+        return train_budget_allocator()
+    if model == "goal_predictor":
+        return train_goal_predictor()
+    if model == "anomaly_detector":
+        return train_anomaly_detector(transactions)
+    raise ValueError(f"Unknown model: {model}")
+
+
+def evaluate_model(model: str, transactions: pd.DataFrame, spending: "SpendingData") -> Dict:
+    EVALUATION_SAMPLES.pop(model, None)
+    with stage(f"{model}.evaluate", rows_in=model_rows(model, transactions, spending) or None):
+        metrics = run_evaluator(model, transactions, spending)
+    if BOOTSTRAP_RESAMPLES > 0 and model in EVALUATION_SAMPLES:
+        with stage(f"{model}.bootstrap"):
+            metrics["ci95"] = bootstrap_intervals(model, EVALUATION_SAMPLES[model], BOOTSTRAP_RESAMPLES)
+    if CV_FOLDS > 1:
+        with stage(f"{model}.cv"):
+            metrics["cv"] = cross_validate(model, transactions, spending, CV_FOLDS)
+    return metrics
+
+
+def run_evaluator(model: str, transactions: pd.DataFrame, spending: "SpendingData") -> Dict:
+    if model == "transaction_categorizer":
+        return evaluate_transaction_categorizer(transactions)
+    if model == "spending_forecaster":
+        return evaluate_spending_forecaster(spending)
+    if model == "budget_allocator":
+        return evaluate_budget_allocator()
+    if model == "goal_predictor":
+        return evaluate_goal_predictor()
+    if model == "anomaly_detector":
+        return evaluate_anomaly_detector(transactions)
+    raise ValueError(f"Unknown model: {model}")
+
+
+def train_and_evaluate(
+    model: str,
+    transactions: pd.DataFrame,
+    spending: "SpendingData",
+    evaluate: bool = True,
+) -> tuple[str, Optional[Dict], Dict[str, Dict], Optional[CategorizerStats]]:
+    """Artifact content, (optionally) holdout metrics, the stage timings they took
+    and, for the categorizer, the statistics to save for --incremental; writes nothing.
+
+    The timings are returned rather than kept so a pool worker's stages can be
+    merged into the parent's report with ``merge_stage_timings``.
+    """
+    outer = dict(STAGE_TIMINGS)
+    STAGE_TIMINGS.clear()
+    stats = None
+    try:
+        if model == "transaction_categorizer":
+            content, stats = train_categorizer_with_state(transactions)
+        else:
+            content = train_model(model, transactions, spending)
+        metrics = evaluate_model(model, transactions, spending) if evaluate else None
+        timings = dict(STAGE_TIMINGS)
+    finally:
+        STAGE_TIMINGS.clear()
+        STAGE_TIMINGS.update(outer)
+    return content, metrics, timings, stats
+
+
+def write_training_report(transactions_rows: int, spending_rows: int, metrics: Dict[str, Dict]) -> None:
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "dataset_sources": {
+            "transactions": TRANSACTION_SOURCES,
+            "spending": SPENDING_SOURCES,
+            "budget_allocator": BUDGET_SOURCES,
+            "goal_predictor": GOAL_SOURCES,
+        },
+        "filters": {
+            "allowed_categories": sorted(ALLOWED_CATEGORIES),
+            "min_amount": MIN_AMOUNT,
+            "max_amount": MAX_AMOUNT,
+            "min_description_tokens": MIN_DESC_TOKENS,
+            "english_like_ratio": 0.9,
+            "min_category_count": MIN_CATEGORY_COUNT,
+            "max_category_count": MAX_CATEGORY_COUNT,
+            "min_spending_category_count": MIN_SPENDING_CATEGORY_COUNT,
+            "min_spending_months": MIN_SPENDING_MONTHS,
+        },
+        "datasets": {
+            "transactions_rows": int(transactions_rows),
+            "spending_rows": int(spending_rows),
+        },
+        "metrics": {model: metrics[model] for model in MODEL_ARTIFACTS if model in metrics},
+        "source_reads": SOURCE_READ_STATS,
+        "timings": [{"stage": name, **record} for name, record in STAGE_TIMINGS.items()],
+    }
+    if CV_FOLDS > 1:
+        report["cross_validation"] = {"folds": CV_FOLDS}
+    if BOOTSTRAP_RESAMPLES > 0:
+        report["bootstrap"] = {"resamples": BOOTSTRAP_RESAMPLES, "interval": "95% percentile"}
+    write_json(REPORTS_DIR / "latest.json", report)
+    print("Report written to:", REPORTS_DIR / "latest.json")
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "report_visuals", REPORTS_DIR.parent / "report_visuals.py"
+        )
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        mod.main()
+    except Exception as e:
+        print("Visual report skipped:", e)
+
+
+# Module settings that change what a trainer writes (and so belong in its build key)
+BUILD_SETTINGS = ("ARTIFACT_FORMAT", "ANOMALY_SKETCH_ERROR", "SEASONAL_GRANULARITY")
+# Module settings that change only the holdout metrics
+EVALUATION_SETTINGS = ("BOOTSTRAP_RESAMPLES", "CV_FOLDS", "BACKTEST_HORIZONS", "BACKTEST_MIN_TRAIN_MONTHS")
+
+
+def model_input_paths(model: str) -> List[Path]:
+    if model in TRANSACTION_MODELS:
+        return [source["path"] for source in transaction_source_files()]
+    if model in SPENDING_MODELS:
+        return [source["path"] for source in spending_source_files()]
+    if model == "budget_allocator":
+        return budget_share_paths()
+    if model == "goal_predictor":
+        return [DATASET_PATHS["shriyashjagtap/indian-personal-finance-and-spending-habits"] / "data.csv"]
+    raise ValueError(f"Unknown model: {model}")
+
+
+def model_build_key(model: str) -> str:
+    """Hash of everything a model's artifact depends on: source contents, filter rules, settings and trainer code."""
+    payload = {
+        "model": model,
+        "trainer_version": TRAINER_VERSION,
+        "trainer_source": hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+        "sources": [
+            {"path": fingerprint["path"], "sha256": fingerprint.get("sha256")}
+            for fingerprint in source_fingerprints(model_input_paths(model))
+        ],
+        "rules": cleaning_rules_fingerprint(),
+        "settings": {name: globals()[name] for name in BUILD_SETTINGS},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def evaluation_key(build_key: str) -> str:
+    payload = {"build": build_key, "settings": {name: globals()[name] for name in EVALUATION_SETTINGS}}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def model_output_path(model: str) -> Path:
+    if ARTIFACT_FORMAT == "compact" and model in COMPACT_ARTIFACT_FILES:
+        return COMPACT_ARTIFACTS_DIR / COMPACT_ARTIFACT_FILES[model]
+    return ARTIFACTS_DIR / MODEL_ARTIFACTS[model]
+
+
+def load_build_cache() -> Dict[str, Dict]:
+    try:
+        return json.loads(MODEL_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_build_cache(cache: Dict[str, Dict]) -> None:
+    MODEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    write_text_if_changed(MODEL_CACHE_PATH, json.dumps(cache, indent=2, sort_keys=True))
+
+
+def cached_build(cache: Dict[str, Dict], model: str, key: str, evaluate: bool) -> Optional[Dict]:
+    """The cache entry for ``model`` if its key matches and its artifact on disk is still the one recorded.
+
+    A hand-edited or incrementally updated artifact no longer matches its
+    recorded hash, so the next full training rebuilds it.
+    """
+    entry = cache.get(model)
+    if not MODEL_CACHE_ENABLED or entry is None or entry.get("key") != key:
+        return None
+    if evaluate and entry.get("evaluation") != evaluation_key(key):
+        return None
+    if model == "transaction_categorizer" and not CATEGORIZER_STATE_PATH.exists():
+        return None
+    try:
+        output = model_output_path(model).read_bytes()
+    except OSError:
+        return None
+    return entry if hashlib.sha256(output).hexdigest() == entry.get("sha256") else None
+
+
+def record_build(
+    cache: Dict[str, Dict],
+    model: str,
+    key: str,
+    content: str,
+    rows: int,
+    metrics: Optional[Dict] = None,
+) -> None:
+    previous = cache.get(model, {})
+    entry = {"key": key, "sha256": hashlib.sha256(content.encode("utf-8")).hexdigest(), "rows": rows}
+    if metrics is not None:
+        entry["metrics"] = metrics
+        entry["evaluation"] = evaluation_key(key)
+    elif previous.get("key") == key and "metrics" in previous:
+        entry["metrics"] = previous["metrics"]
+        entry["evaluation"] = previous["evaluation"]
+    cache[model] = entry
+
+
+def stale_models(models: List[str], evaluate: bool) -> tuple[Dict[str, Dict], Dict[str, str], List[str]]:
+    """Build cache, build keys and the models whose cached artifact (or metrics) cannot be reused."""
+    cache = load_build_cache()
+    keys = {name: model_build_key(name) for name in models}
+    stale = [name for name in models if cached_build(cache, name, keys[name], evaluate) is None]
+    for name in models:
+        if name not in stale:
+            print(f"{name}: up to date, skipped")
+    return cache, keys, stale
+
+
+def model_rows(model: str, transactions: pd.DataFrame, spending: "SpendingData") -> int:
+    if model in TRANSACTION_MODELS:
+        return len(transactions)
+    if model in SPENDING_MODELS:
+        return len(spending)
+    return 0
+
+
+def report_rows(cache: Dict[str, Dict], stale: List[str], group: Sequence[str], frame: pd.DataFrame) -> int:
+    """Row count of a dataset for the report, from the cache when no model in ``group`` reloaded it."""
+    if any(name in stale for name in group):
+        return len(frame)
+    return max((cache[name].get("rows", 0) for name in group if name in cache), default=0)
+
+
 def run_training(model: str) -> None:
-    if model in ("transaction_categorizer", "anomaly_detector", "all"):
+    models = list(MODEL_ARTIFACTS) if model == "all" else [model]
+    evaluate = model == "all"
+    STAGE_TIMINGS.clear()
+    cache, keys, stale = stale_models(models, evaluate)
+    if not stale:
+        print("Artifacts up to date in:", ARTIFACTS_DIR)
+        return
+
+    if any(name in TRANSACTION_MODELS for name in stale):
         transactions = build_transaction_dataset()
     else:
         transactions = pd.DataFrame()
 
-    if model in ("spending_forecaster", "all"):
+    if any(name in SPENDING_MODELS for name in stale):
         spending = build_spending_dataset()
     else:
         spending = pd.DataFrame()
 
-    if model in ("transaction_categorizer", "all"):
-        categorizer_content = train_transaction_categorizer(transactions)
-        write_ts_module(ARTIFACTS_DIR / "transaction-categorizer.ts", categorizer_content)
-
-    if model in ("spending_forecaster", "all"):
-        forecaster_content = train_spending_forecaster(spending)
-        write_ts_module(ARTIFACTS_DIR / "spending-forecaster.ts", forecaster_content)
+    contents = {}
+    for name in stale:
+        if name == "transaction_categorizer":
+            contents[name], stats = train_categorizer_with_state(transactions)
+            save_categorizer_state(stats)
+        else:
+            contents[name] = train_model(name, transactions, spending)
+        write_model_artifact(name, contents[name])
 
-    if model in ("budget_allocator", "all"):
-        allocator_content = train_budget_allocator()
-        write_ts_module(ARTIFACTS_DIR / "budget-allocator.ts", allocator_content)
+    metrics = {name: evaluate_model(name, transactions, spending) for name in stale} if evaluate else {}
+    for name in stale:
+        record_build(cache, name, keys[name], contents[name], model_rows(name, transactions, spending), metrics.get(name))
+    save_build_cache(cache)
 
-    if model in ("goal_predictor", "all"):
-        goal_content = train_goal_predictor()
-        write_ts_module(ARTIFACTS_DIR / "goal-predictor.ts", goal_content)
+    if evaluate:
+        write_training_metadata()
+        metrics = {name: metrics[name] if name in metrics else cache[name]["metrics"] for name in models}
+        write_training_report(
+            report_rows(cache, stale, TRANSACTION_MODELS, transactions),
+            report_rows(cache, stale, SPENDING_MODELS, spending),
+            metrics,
+        )
 
-    if model in ("anomaly_detector", "all"):
-        anomaly_content = train_anomaly_detector(transactions)
-        write_ts_module(ARTIFACTS_DIR / "anomaly-detector.ts", anomaly_content)
+    print("Artifacts written to:", ARTIFACTS_DIR)
 
-    if model == "all":
-        write_training_metadata()
 
-        report = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "dataset_sources": {
-                "transactions": TRANSACTION_SOURCES,
-                "spending": SPENDING_SOURCES,
-                "budget_allocator": BUDGET_SOURCES,
-                "goal_predictor": GOAL_SOURCES,
-            },
-            "filters": {
-                "allowed_categories": sorted(ALLOWED_CATEGORIES),
-                "min_amount": MIN_AMOUNT,
-                "max_amount": MAX_AMOUNT,
-                "min_description_tokens": MIN_DESC_TOKENS,
-                "english_like_ratio": 0.9,
-                "min_category_count": MIN_CATEGORY_COUNT,
-                "max_category_count": MAX_CATEGORY_COUNT,
-                "min_spending_category_count": MIN_SPENDING_CATEGORY_COUNT,
-                "min_spending_months": MIN_SPENDING_MONTHS,
-            },
-            "datasets": {
-                "transactions_rows": int(len(transactions)),
-                "spending_rows": int(len(spending)),
-            },
-            "metrics": {
-                "transaction_categorizer": evaluate_transaction_categorizer(transactions),
-                "spending_forecaster": evaluate_spending_forecaster(spending),
-                "budget_allocator": evaluate_budget_allocator(),
-                "goal_predictor": evaluate_goal_predictor(),
-                "anomaly_detector": evaluate_anomaly_detector(transactions),
-            },
-        }
-        write_json(REPORTS_DIR / "latest.json", report)
-        print("Report written to:", REPORTS_DIR / "latest.json")
-        try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(
-                "report_visuals", REPORTS_DIR.parent / "report_visuals.py"
-            )
-            mod = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(mod)
-            mod.main()
-        except Exception as e:
-            print("Visual report skipped:", e)
+def run_incremental_training(path: Path) -> None:
+    """Fold a CSV of new transactions into the saved categorizer state and re-export.
 
+    The file uses the cleaned transaction columns (date, description, amount,
+    category and optionally type); only the new rows are read and counted.
+    New rows go through the same filters as the sources but are not re-balanced.
+    """
+    state = load_categorizer_state()
+    if state is None:
+        raise SystemExit(
+            f"No categorizer state at {CATEGORIZER_STATE_PATH}; run a full transaction_categorizer training first."
+        )
+    mapping = {key: key for key in ["date", "description", "amount", "category", "type"]}
+    df = safe_read_table(path, usecols=list(mapping.values()), dtype={"date": str, "description": str, "category": str})
+    rows = clean_transaction_frame(df, mapping) if df is not None else None
+    if rows is None:
+        raise SystemExit(f"Could not read date/description/amount/category columns from {path}")
+    stats = merge_categorizer_stats(state, fit_categorizer_stats(rows))
+    write_model_artifact("transaction_categorizer", train_transaction_categorizer(rows, stats))
+    save_categorizer_state(stats)
+    print(f"Folded {len(rows)} new rows into {CATEGORIZER_STATE_PATH}")
     print("Artifacts written to:", ARTIFACTS_DIR)
 
 
 def evaluate_transaction_categorizer(df: pd.DataFrame) -> Dict:
     train_df, test_df = time_split(df, "date", test_frac=0.2)
+    return categorizer_holdout_metrics(train_df, test_df)
+
+
+def categorizer_holdout_metrics(
+    train_df: pd.DataFrame,
+    test_df: pd.DataFrame,
+    train_tokens: Optional[TermCodes] = None,
+    test_tokens: Optional[TermCodes] = None,
+) -> Dict:
     if test_df.empty:
         return {"samples": 0, "macro_f1": 0.0, "weighted_f1": 0.0, "top3_accuracy": 0.0}
-    token_weights, weights, priors = build_categorizer_model(train_df)
+    token_weights, weights, priors = build_categorizer_model(train_df, train_tokens)
+    model = compile_categorizer(token_weights, weights, priors)
     y_true = test_df["category"].astype(str).str.title().tolist()
-    y_pred = [
-        predict_category(desc, amt, token_weights, weights, priors)
-        for desc, amt in zip(test_df["description"].astype(str), test_df["amount"].astype(float))
-    ]
-    top3 = [
-        top_k_categories(desc, amt, token_weights, weights, priors, k=3)
-        for desc, amt in zip(test_df["description"].astype(str), test_df["amount"].astype(float))
-    ]
-    top3_hits = sum(1 for yt, preds in zip(y_true, top3) if yt in preds)
+    best, top3 = score_batch(
+        test_df["description"].astype(str).tolist(),
+        test_df["amount"].astype(float).to_numpy(),
+        model,
+        k=3,
+        tokens=test_tokens,
+    )
+    y_pred = best.tolist()
     metrics = f1_metrics(y_true, y_pred)
+    _, true_codes, pred_codes = encode_labels(y_true, y_pred)
+    EVALUATION_SAMPLES["transaction_categorizer"] = {
+        "true": true_codes,
+        "pred": pred_codes,
+        "top3_hit": top_k_hits(y_true, top3),
+    }
     return {
         "samples": len(y_true),
         "macro_f1": metrics["macro_f1"],
         "weighted_f1": metrics["weighted_f1"],
-        "top3_accuracy": round(safe_div(top3_hits, len(y_true)), 4),
+        "top3_accuracy": round(top_k_accuracy(y_true, top3), 4),
         "confusion_matrix": build_confusion_matrix(y_true, y_pred, top_n=8),
     }
 
 
-def evaluate_spending_forecaster(df: pd.DataFrame) -> Dict:
-    train_df, test_df = time_split(df, "date", test_frac=0.2)
+def evaluate_spending_forecaster(df: "SpendingData") -> Dict:
+    if isinstance(df, SpendingAggregates):
+        num_months = df.months.sums.shape[1]
+        split = min(max(df.month_boundary(int(len(df) * 0.8)), 1), max(num_months - 1, 1))
+        metrics = aggregate_holdout_metrics(df, split, num_months)
+    else:
+        train_df, test_df = time_split(df, "date", test_frac=0.2)
+        metrics = spending_holdout_metrics(train_df, test_df)
+    if metrics["samples"]:
+        matrix = df.months if isinstance(df, SpendingAggregates) else build_spending_matrix(df)
+        metrics["backtest"] = backtest_spending_forecaster(matrix)
+    return metrics
+
+
+def spending_holdout_metrics(train_df: pd.DataFrame, test_df: pd.DataFrame) -> Dict:
     if test_df.empty:
         return {"samples": 0, "mae": 0.0, "mape": 0.0, "directional_accuracy": 0.0}
     train_df = train_df.dropna(subset=["date"]).copy()
-    train_df["month"] = train_df["date"].dt.month
     train_df["amount"] = train_df["amount"].abs()
-    trained_seasonality = {}
-    trained_averages = {}
-    for category, group in train_df.groupby("category"):
-        monthly = group.groupby("month")["amount"].mean()
-        overall = monthly.mean() if not monthly.empty else 0
-        if overall > 0:
-            trained_seasonality[category] = {int(month): float(val / overall) for month, val in monthly.items()}
-        trained_averages[category] = float(group["amount"].mean() * 30)
+    trained_seasonality = fit_seasonal_factors(train_df, "month")
+    trained_averages = fit_category_averages(train_df)
 
     test_df = test_df.dropna(subset=["date"]).copy()
     test_df["month"] = test_df["date"].dt.month
@@ -1189,114 +2995,366 @@ def evaluate_spending_forecaster(df: pd.DataFrame) -> Dict:
     monthly = (
         test_df.groupby(["category", "month"])["amount"].sum().reset_index()
     )
+    return monthly_spending_metrics(monthly, trained_seasonality, trained_averages)
+
+
+def monthly_spending_metrics(
+    monthly: pd.DataFrame,
+    trained_seasonality: Dict[str, Dict[int, float]],
+    trained_averages: Dict[str, float],
+) -> Dict:
+    """Holdout errors for test spend per (category, month of year), ordered by category then month."""
     if monthly.empty:
         return {"samples": 0, "mae": 0.0, "mape": 0.0, "directional_accuracy": 0.0}
 
-    errors = []
-    ape = []
-    directional_hits = []
-    total = 0
-    for category, group in monthly.groupby("category"):
-        group = group.sort_values("month")
-        previous_actual = None
-        for _, row in group.iterrows():
-            month = int(row["month"])
-            actual = float(row["amount"])
-            base = trained_averages.get(category, 0.0)
-            seasonal = trained_seasonality.get(category, {}).get(month, 1.0)
-            prediction = base * seasonal
-            errors.append(abs(actual - prediction))
-            ape.append(abs(actual - prediction) / actual if actual else 0.0)
-            if previous_actual is not None:
-                predicted_delta = prediction - previous_actual
-                actual_delta = actual - previous_actual
-                directional_hits.append(
-                    (predicted_delta >= 0 and actual_delta >= 0) or (predicted_delta < 0 and actual_delta < 0)
-                )
-            previous_actual = actual
-            total += 1
+    # Rows are already ordered by (category, month), so shift(1) is the previous month's actual
+    keys = pd.MultiIndex.from_arrays([monthly["category"], monthly["month"]])
+    seasonal_factors = pd.Series(
+        {(category, month): value for category, months in trained_seasonality.items() for month, value in months.items()},
+        dtype=np.float64,
+    )
+    seasonal = seasonal_factors.reindex(keys).fillna(1.0).to_numpy() if len(seasonal_factors) else np.ones(len(monthly))
+    base = monthly["category"].map(trained_averages).fillna(0.0).to_numpy(dtype=np.float64)
+    actual = monthly["amount"].to_numpy(dtype=np.float64)
+    prediction = base * seasonal
+    errors = np.abs(actual - prediction)
+    ape = np.divide(errors, actual, out=np.zeros_like(errors), where=actual != 0)
+    previous = monthly.groupby("category")["amount"].shift(1).to_numpy(dtype=np.float64)
+    has_previous = ~np.isnan(previous)
+    predicted_delta = prediction - previous
+    actual_delta = actual - previous
+    hits = ((predicted_delta >= 0) & (actual_delta >= 0)) | ((predicted_delta < 0) & (actual_delta < 0))
+    EVALUATION_SAMPLES["spending_forecaster"] = {
+        "errors": errors,
+        "ape": ape,
+        "direction": np.where(has_previous, hits.astype(np.float64), np.nan),
+    }
     return {
-        "samples": total,
-        "mae": round(float(np.mean(errors)) if errors else 0.0, 4),
-        "mape": round(float(np.mean(ape)) if ape else 0.0, 4),
-        "directional_accuracy": round(safe_div(sum(directional_hits), len(directional_hits)), 4),
+        "samples": len(monthly),
+        "mae": round(float(np.mean(errors)) if len(errors) else 0.0, 4),
+        "mape": round(float(np.mean(ape)) if len(ape) else 0.0, 4),
+        "directional_accuracy": round(safe_div(int(hits[has_previous].sum()), int(has_previous.sum())), 4),
     }
 
 
-def build_budget_share_rows() -> List[Dict[str, float]]:
-    rows: List[Dict[str, float]] = []
-    for name in ["rural_budget_allocation_dataset.csv", "urban_budget_allocation_dataset.csv"]:
-        path = DATASET_PATHS["shrinolo/budget-allocation"] / name
-        df = safe_read_csv(path)
-        if df is None:
+@dataclass
+class SpendingMatrix:
+    """Absolute spending pivoted once into dense (category, calendar month) arrays."""
+
+    categories: List[str]
+    first_month: int
+    sums: np.ndarray
+    counts: np.ndarray
+
+    @property
+    def month_of_year(self) -> np.ndarray:
+        return (self.first_month + np.arange(self.sums.shape[1])) % 12
+
+
+def build_spending_matrix(df: pd.DataFrame) -> SpendingMatrix:
+    df = df.dropna(subset=["date"])
+    if df.empty:
+        return SpendingMatrix([], 0, np.zeros((0, 0)), np.zeros((0, 0), dtype=np.int64))
+    month_ids = (df["date"].dt.year * 12 + df["date"].dt.month - 1).to_numpy(dtype=np.int64)
+    first_month = int(month_ids.min())
+    num_months = int(month_ids.max()) - first_month + 1
+    category_codes, categories = pd.factorize(df["category"], sort=True)
+    cells = category_codes * num_months + (month_ids - first_month)
+    size = len(categories) * num_months
+    sums = np.bincount(cells, weights=df["amount"].abs().to_numpy(dtype=np.float64), minlength=size)
+    counts = np.bincount(cells, minlength=size)
+    return SpendingMatrix(
+        categories=[str(category) for category in categories],
+        first_month=first_month,
+        sums=sums.reshape(len(categories), num_months),
+        counts=counts.reshape(len(categories), num_months),
+    )
+
+
+# Season key columns for the week-of-year (ISO 1-53) and day-of-week (0 = Sunday) tables
+NUM_WEEK_KEYS = 54
+NUM_WEEKDAY_KEYS = 7
+
+
+@dataclass
+class SpendingAggregates:
+    """Streamed spending folded into absolute-amount sums and counts per (category, period).
+
+    ``months`` is the calendar-month pivot the backtest reads. The week and
+    weekday tables hold the finer seasons as (category, season key) arrays. The
+    forecaster, its holdout, backtest and CV read only these, so memory is bounded
+    by categories x periods rather than by rows.
+    """
+
+    months: SpendingMatrix
+    week_sums: np.ndarray
+    week_counts: np.ndarray
+    weekday_sums: np.ndarray
+    weekday_counts: np.ndarray
+    rows: int
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def empty(self) -> bool:
+        return self.rows == 0
+
+    @property
+    def categories(self) -> List[str]:
+        return self.months.categories
+
+    def season_totals(self, period: str, months: slice = slice(None)) -> tuple[np.ndarray, np.ndarray]:
+        """(category, season key) sums and counts; ``months`` selects calendar months for the month period."""
+        if period == "week":
+            return self.week_sums, self.week_counts
+        if period == "weekday":
+            return self.weekday_sums, self.weekday_counts
+        if period != "month":
+            raise ValueError(f"Unknown seasonal period: {period}")
+        seasons = np.eye(13, dtype=np.int64)[self.months.month_of_year[months] + 1]
+        return self.months.sums[:, months] @ seasons, self.months.counts[:, months] @ seasons
+
+    def seasonal_factors(self, period: str = "month", months: slice = slice(None)) -> Dict[str, Dict[int, float]]:
+        sums, counts = self.season_totals(period, months)
+        cells = np.flatnonzero(counts.ravel() > 0)
+        season_means = pd.Series(sums.ravel()[cells] / counts.ravel()[cells], index=cells)
+        return seasonal_factors_from_means(season_means, self.categories, sums.shape[1])
+
+    def category_averages(self, months: slice = slice(None)) -> Dict[str, float]:
+        sums = self.months.sums[:, months].sum(axis=1)
+        counts = self.months.counts[:, months].sum(axis=1)
+        return {
+            category: float(total / count * 30)
+            for category, total, count in zip(self.categories, sums.tolist(), counts.tolist())
+            if count
+        }
+
+    def monthly_totals(self, months: slice) -> pd.DataFrame:
+        """Spend per (category, month of year) over ``months``, ordered by category then month."""
+        sums, counts = self.season_totals("month", months)
+        category_idx, month = np.nonzero(counts > 0)
+        return pd.DataFrame({
+            "category": [self.categories[idx] for idx in category_idx.tolist()],
+            "month": month,
+            "amount": sums[category_idx, month],
+        })
+
+    def month_boundary(self, row: int) -> int:
+        """Number of leading calendar months that lie wholly within the first ``row`` date-ordered rows."""
+        return int(np.searchsorted(np.cumsum(self.months.counts.sum(axis=0)), row, side="right"))
+
+
+SpendingData = Union[pd.DataFrame, SpendingAggregates]
+
+
+def dense_cells(cells: pd.DataFrame, categories: List[str], offset: int, width: int) -> tuple[np.ndarray, np.ndarray]:
+    """(category, key - offset) sum and count arrays from a frame indexed by (category, key)."""
+    category_idx = pd.Index(categories).get_indexer(cells.index.get_level_values(0))
+    keys = cells.index.get_level_values(1).to_numpy(dtype=np.int64) - offset
+    sums = np.zeros((len(categories), width))
+    counts = np.zeros((len(categories), width), dtype=np.int64)
+    sums[category_idx, keys] = cells["sum"].to_numpy(dtype=np.float64)
+    counts[category_idx, keys] = cells["count"].to_numpy(dtype=np.int64)
+    return sums, counts
+
+
+def aggregate_spending_chunks(chunks: Iterable[pd.DataFrame]) -> SpendingAggregates:
+    """Fold cleaned spending chunks into ``SpendingAggregates``, keeping only per-cell totals."""
+    totals: Dict[str, Optional[pd.DataFrame]] = {"month": None, "week": None, "weekday": None}
+    rows = 0
+    for chunk in chunks:
+        if chunk.empty:
             continue
-        budget_cols = [col for col in df.columns if col.endswith("Budget")]
-        for _, row in df.iterrows():
-            total = sum(row.get(col, 0) for col in budget_cols)
-            if total <= 0:
-                continue
-            shares = {}
-            for col in budget_cols:
-                category = normalize_category(col.replace("Budget", ""))
-                shares[category] = float(row.get(col, 0)) / total
-            rows.append(shares)
+        rows += len(chunk)
+        amounts = chunk["amount"].abs()
+        keys = {
+            "month": (chunk["date"].dt.year * 12 + chunk["date"].dt.month - 1).to_numpy(dtype=np.int64),
+            "week": seasonal_period_keys(chunk["date"], "week"),
+            "weekday": seasonal_period_keys(chunk["date"], "weekday"),
+        }
+        for period, key in keys.items():
+            cells = amounts.groupby([chunk["category"].to_numpy(dtype=object), key]).agg(["sum", "count"])
+            totals[period] = cells if totals[period] is None else totals[period].add(cells, fill_value=0)
 
-    habits_path = DATASET_PATHS["shriyashjagtap/indian-personal-finance-and-spending-habits"] / "data.csv"
-    habits = safe_read_csv(habits_path)
-    if habits is not None:
-        spend_cols = [
-            "Rent", "Loan_Repayment", "Insurance", "Groceries", "Transport", "Eating_Out",
-            "Entertainment", "Utilities", "Healthcare", "Education", "Miscellaneous",
-        ]
-        for _, row in habits.iterrows():
-            total = sum(float(row.get(col, 0)) for col in spend_cols)
-            if total <= 0:
-                continue
-            shares = {}
-            for col in spend_cols:
-                shares[normalize_category(col)] = float(row.get(col, 0)) / total
-            rows.append(shares)
-    return rows
+    if not rows:
+        return SpendingAggregates(
+            months=SpendingMatrix([], 0, np.zeros((0, 0)), np.zeros((0, 0), dtype=np.int64)),
+            week_sums=np.zeros((0, NUM_WEEK_KEYS)),
+            week_counts=np.zeros((0, NUM_WEEK_KEYS), dtype=np.int64),
+            weekday_sums=np.zeros((0, NUM_WEEKDAY_KEYS)),
+            weekday_counts=np.zeros((0, NUM_WEEKDAY_KEYS), dtype=np.int64),
+            rows=0,
+        )
+    categories = sorted(str(category) for category in totals["month"].index.unique(level=0))
+    month_ids = totals["month"].index.get_level_values(1)
+    first_month = int(month_ids.min())
+    month_sums, month_counts = dense_cells(totals["month"], categories, first_month, int(month_ids.max()) - first_month + 1)
+    week_sums, week_counts = dense_cells(totals["week"], categories, 0, NUM_WEEK_KEYS)
+    weekday_sums, weekday_counts = dense_cells(totals["weekday"], categories, 0, NUM_WEEKDAY_KEYS)
+    return SpendingAggregates(
+        months=SpendingMatrix(categories, first_month, month_sums, month_counts),
+        week_sums=week_sums,
+        week_counts=week_counts,
+        weekday_sums=weekday_sums,
+        weekday_counts=weekday_counts,
+        rows=rows,
+    )
+
+
+def aggregate_holdout_metrics(df: SpendingAggregates, train_stop: int, test_stop: int) -> Dict:
+    """``spending_holdout_metrics`` with train and test split on calendar-month boundaries."""
+    train = slice(0, train_stop)
+    return monthly_spending_metrics(
+        df.monthly_totals(slice(train_stop, test_stop)),
+        df.seasonal_factors("month", train),
+        df.category_averages(train),
+    )
+
+
+def backtest_spending_forecaster(
+    matrix: SpendingMatrix,
+    horizons: int = BACKTEST_HORIZONS,
+    min_train_months: int = BACKTEST_MIN_TRAIN_MONTHS,
+) -> Dict:
+    """Rolling-origin backtest of the seasonal-average forecaster over every origin and horizon.
+
+    For origin o the model is fitted on calendar months before o, the same way
+    ``train_spending_forecaster`` fits it. Month t = o + h - 1 is then predicted
+    as ``average * seasonality[month of year]``. Prefix sums over the pivot give
+    the fit at every origin at once, and errors are computed with broadcasting.
+    Only (category, month) cells with spending are scored.
+    """
+    num_categories, num_months = matrix.sums.shape
+    min_train_months = min(min_train_months, max(num_months - 1, 1))
+    origins = np.arange(min_train_months, num_months)
+    if not num_categories or not len(origins):
+        return {"origins": 0, "horizons": horizons, "by_horizon": [], "by_category": {}}
+
+    # Prefix sums per month and per month of year, indexed by origin - 1
+    month_of_year = matrix.month_of_year
+    seasons = np.eye(12)[month_of_year]
+    total_sum = np.cumsum(matrix.sums, axis=1)[:, origins - 1]
+    total_count = np.cumsum(matrix.counts, axis=1)[:, origins - 1]
+    season_sum = np.cumsum(matrix.sums[:, :, None] * seasons, axis=1)[:, origins - 1]
+    season_count = np.cumsum(matrix.counts[:, :, None] * seasons, axis=1)[:, origins - 1]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        average = np.where(total_count > 0, total_sum / total_count, 0.0) * 30
+        season_mean = np.where(season_count > 0, season_sum / season_count, np.nan)
+        seen = season_count > 0
+        overall = np.where(seen.any(axis=2), np.nansum(season_mean, axis=2) / seen.sum(axis=2), 0.0)
+        factor = np.where(seen & (overall[:, :, None] > 0), season_mean / overall[:, :, None], 1.0)
+
+    steps = np.arange(1, horizons + 1)
+    targets = origins[:, None] + steps[None, :] - 1
+    in_range = targets < num_months
+    targets = np.minimum(targets, num_months - 1)
+    origin_idx = np.arange(len(origins))[:, None]
+    prediction = average[:, :, None] * factor[:, origin_idx, month_of_year[targets]]
+    actual = matrix.sums[:, targets]
+    scored = in_range[None] & (matrix.counts[:, targets] > 0)
+    previous = matrix.sums[:, targets - 1]
+    has_previous = scored & (matrix.counts[:, targets - 1] > 0)
+
+    errors = np.abs(actual - prediction)
+    ape = np.divide(errors, actual, out=np.zeros_like(errors), where=actual != 0)
+    predicted_delta = prediction - previous
+    actual_delta = actual - previous
+    hits = ((predicted_delta >= 0) & (actual_delta >= 0)) | ((predicted_delta < 0) & (actual_delta < 0))
+
+    def error_table(axis: tuple) -> tuple[np.ndarray, ...]:
+        samples = scored.sum(axis=axis)
+        directional = has_previous.sum(axis=axis)
+        return (
+            samples,
+            ratio(np.where(scored, errors, 0).sum(axis=axis), samples),
+            ratio(np.where(scored, ape, 0).sum(axis=axis), samples),
+            ratio((hits & has_previous).sum(axis=axis), directional),
+        )
+
+    by_horizon = []
+    for step, samples, mae, mape, directional in zip(steps.tolist(), *error_table((0, 1))):
+        by_horizon.append({
+            "horizon": step,
+            "samples": int(samples),
+            "mae": round(float(mae), 4),
+            "mape": round(float(mape), 4),
+            "directional_accuracy": round(float(directional), 4),
+        })
+    by_category = {}
+    for category, samples, mae, mape, directional in zip(matrix.categories, *error_table((1, 2))):
+        if samples:
+            by_category[category] = {
+                "samples": int(samples),
+                "mae": round(float(mae), 4),
+                "mape": round(float(mape), 4),
+                "directional_accuracy": round(float(directional), 4),
+            }
+    return {"origins": len(origins), "horizons": horizons, "by_horizon": by_horizon, "by_category": by_category}
+
+
+def budget_share_frame() -> pd.DataFrame:
+    """Share matrix as a frame with absent categories counted as a zero share."""
+    return build_budget_shares().to_frame().fillna(0)
 
 
 def evaluate_budget_allocator() -> Dict:
-    rows = build_budget_share_rows()
-    if not rows:
+    df = budget_share_frame()
+    if df.empty:
         return {"samples": 0, "rmse": 0.0}
-    df = pd.DataFrame(rows).fillna(0)
     train_df, test_df = random_split(df, test_frac=0.2, seed=42)
+    return budget_holdout_metrics(train_df, test_df)
+
+
+def budget_holdout_metrics(train_df: pd.DataFrame, test_df: pd.DataFrame) -> Dict:
     if test_df.empty:
         return {"samples": 0, "rmse": 0.0}
-    train_avg = train_df.mean().to_dict()
-    rmses = []
-    for _, row in test_df.iterrows():
-        diffs = []
-        for category in train_avg.keys():
-            pred = train_avg.get(category, 0.0)
-            actual = row.get(category, 0.0)
-            diffs.append((pred - actual) ** 2)
-        rmses.append(math.sqrt(sum(diffs) / len(diffs)) if diffs else 0.0)
+    train_avg = train_df.mean().to_numpy()
+    squared = (train_avg[None, :] - test_df.to_numpy()) ** 2
+    # Column-by-column sum keeps the per-row totals identical to the scalar version
+    total = np.zeros(len(squared))
+    for idx in range(squared.shape[1]):
+        total = total + squared[:, idx]
+    rmses = np.sqrt(total / squared.shape[1]) if squared.shape[1] else np.zeros(len(squared))
+    EVALUATION_SAMPLES["budget_allocator"] = {"rmse": rmses}
     return {
         "samples": len(test_df),
-        "rmse": round(float(np.mean(rmses)) if rmses else 0.0, 4),
+        "rmse": round(float(np.mean(rmses)) if len(rmses) else 0.0, 4),
     }
 
 
-def evaluate_goal_predictor() -> Dict:
+def goal_savings_frame() -> pd.DataFrame:
+    """Habits rows with numeric income, desired savings and an income bracket."""
     habits_path = DATASET_PATHS["shriyashjagtap/indian-personal-finance-and-spending-habits"] / "data.csv"
     habits = safe_read_csv(habits_path)
     if habits is None or habits.empty:
-        return {"samples": 0, "brier": 0.0, "mae": 0.0}
+        return pd.DataFrame()
     habits["Income"] = pd.to_numeric(habits["Income"], errors="coerce")
     habits["Desired_Savings_Percentage"] = pd.to_numeric(habits.get("Desired_Savings_Percentage"), errors="coerce")
     habits = habits.dropna(subset=["Income", "Desired_Savings_Percentage"])
     if habits.empty:
-        return {"samples": 0, "brier": 0.0, "mae": 0.0}
+        return habits
+    return with_income_brackets(habits)
+
 
+def with_income_brackets(habits: pd.DataFrame) -> pd.DataFrame:
+    """Add the ``income_bracket`` the goal predictor groups by to numeric Income rows."""
     bins = [0, 20000, 50000, 100000, 200000, 500000, 1e9]
     labels = ["<20k", "20-50k", "50-100k", "100-200k", "200-500k", "500k+"]
     habits["income_bracket"] = pd.cut(habits["Income"], bins=bins, labels=labels, include_lowest=True)
+    return habits
+
+
+def evaluate_goal_predictor() -> Dict:
+    habits = goal_savings_frame()
+    if habits.empty:
+        return {"samples": 0, "brier": 0.0, "mae": 0.0}
     train_df, test_df = random_split(habits, test_frac=0.2, seed=42)
+    return goal_holdout_metrics(train_df, test_df)
+
+
+def goal_holdout_metrics(train_df: pd.DataFrame, test_df: pd.DataFrame) -> Dict:
     rates = {}
     for bracket, group in train_df.groupby("income_bracket", observed=True):
         if group.empty:
@@ -1312,6 +3370,8 @@ def evaluate_goal_predictor() -> Dict:
         actuals.append(actual)
     mse = np.mean([(p - a) ** 2 for p, a in zip(predictions, actuals)]) if predictions else 0.0
     mae = np.mean([abs(p - a) for p, a in zip(predictions, actuals)]) if predictions else 0.0
+    residuals = np.asarray(predictions, dtype=np.float64) - np.asarray(actuals, dtype=np.float64)
+    EVALUATION_SAMPLES["goal_predictor"] = {"squared_error": residuals ** 2, "absolute_error": np.abs(residuals)}
     return {
         "samples": len(test_df),
         "brier": round(float(mse), 4),
@@ -1319,64 +3379,220 @@ def evaluate_goal_predictor() -> Dict:
     }
 
 
+def anomaly_thresholds(stats: Dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Upper bound, lower bound and inclusiveness of every sweep candidate for one category.
+
+    Percentile candidates flag ``amount >= pXX`` and MAD candidates flag a robust
+    z-score above k, mirroring the checks in the frontend anomaly detector.
+    """
+    median, mad = stats["median"], stats["mad"]
+    scale = mad / ROBUST_Z_SCALE if mad > 0 else median
+    upper = [stats[key] for key in ANOMALY_PERCENTILES]
+    lower = [-np.inf] * len(ANOMALY_PERCENTILES)
+    for k in ANOMALY_MAD_MULTIPLES:
+        upper.append(median + k * scale if scale > 0 else np.inf)
+        lower.append(median - k * scale if scale > 0 else -np.inf)
+    inclusive = np.arange(len(upper)) < len(ANOMALY_PERCENTILES)
+    return np.asarray(upper, dtype=np.float64), np.asarray(lower, dtype=np.float64), inclusive
+
+
+def anomaly_sweep_names() -> List[str]:
+    return list(ANOMALY_PERCENTILES) + [f"mad_z{k:g}" for k in ANOMALY_MAD_MULTIPLES]
+
+
 def evaluate_anomaly_detector(df: pd.DataFrame) -> Dict:
+    """Holdout precision/recall plus a threshold sweep over every trained candidate.
+
+    Each category's holdout amounts are sorted once; flagged and true-positive
+    counts for all candidates then come from ``np.searchsorted``. Labels are
+    amounts above the category's holdout p95.
+    """
     train_df, test_df = time_split(df, "date", test_frac=0.2)
+    return anomaly_holdout_metrics(train_df, test_df)
+
+
+def anomaly_holdout_metrics(train_df: pd.DataFrame, test_df: pd.DataFrame) -> Dict:
     if test_df.empty or train_df.empty:
         return {"samples": 0, "precision": 0.0, "recall": 0.0, "alert_rate": 0.0}
-    stats = {}
-    for category, group in train_df.groupby("category"):
-        amounts = group["amount"].abs().dropna().values
-        if len(amounts) < 5:
-            continue
-        median = float(np.median(amounts))
-        mad = float(np.median(np.abs(amounts - median)))
-        p90 = float(np.percentile(amounts, 90))
-        p95 = float(np.percentile(amounts, 95))
-        p97 = float(np.percentile(amounts, 97))
-        p98 = float(np.percentile(amounts, 98))
-        p99 = float(np.percentile(amounts, 99))
-        p995 = float(np.percentile(amounts, 99.5))
-        stats[category] = {
-            "median": median,
-            "mad": mad,
-            "p90": p90,
-            "p95": p95,
-            "p97": p97,
-            "p98": p98,
-            "p99": p99,
-            "p995": p995,
-        }
-
-    labels = []
-    predictions = []
+    stats = fit_anomaly_stats(train_df)
+
+    names = anomaly_sweep_names()
+    swept_flagged = np.zeros(len(names), dtype=np.int64)
+    swept_tp = np.zeros(len(names), dtype=np.int64)
+    samples = positives = flagged = flagged_tp = 0
+    labels: List[np.ndarray] = []
+    alerts: List[np.ndarray] = []
     for category, group in test_df.groupby("category"):
-        amounts = group["amount"].abs().dropna().values
-        if len(amounts) == 0:
+        amounts = np.sort(group["amount"].abs().dropna().to_numpy(dtype=np.float64))
+        n = len(amounts)
+        if n == 0:
             continue
-        threshold = np.percentile(amounts, 95)
-        for amount in amounts:
-            label = amount > threshold
-            labels.append(label)
-            threshold_pred = np.percentile(amounts, 90)
-            predictions.append(amount > threshold_pred)
-
-    if not labels:
+        label_threshold = np.percentile(amounts, 95)
+        above_label = n - int(np.searchsorted(amounts, label_threshold, side="right"))
+        samples += n
+        positives += above_label
+        # Headline metrics keep the historical rule: flag amounts above the holdout p90
+        alert_threshold = np.percentile(amounts, 90)
+        flagged += n - int(np.searchsorted(amounts, alert_threshold, side="right"))
+        flagged_tp += n - int(np.searchsorted(amounts, max(alert_threshold, label_threshold), side="right"))
+        labels.append(amounts > label_threshold)
+        alerts.append(amounts > alert_threshold)
+        if category not in stats:
+            continue
+
+        upper, lower, inclusive = anomaly_thresholds(stats[category])
+        start_upper = np.where(
+            inclusive,
+            np.searchsorted(amounts, upper, side="left"),
+            np.searchsorted(amounts, upper, side="right"),
+        )
+        below_lower = np.searchsorted(amounts, lower, side="left")
+        label_start = n - above_label
+        swept_flagged += (n - start_upper) + below_lower
+        swept_tp += np.where(upper > label_threshold, n - start_upper, above_label)
+        swept_tp += np.maximum(below_lower - label_start, 0)
+
+    if not samples:
         return {"samples": 0, "precision": 0.0, "recall": 0.0, "alert_rate": 0.0}
-    tp = sum(1 for l, p in zip(labels, predictions) if l and p)
-    fp = sum(1 for l, p in zip(labels, predictions) if not l and p)
-    fn = sum(1 for l, p in zip(labels, predictions) if l and not p)
-    precision = safe_div(tp, tp + fp)
-    recall = safe_div(tp, tp + fn)
-    alert_rate = safe_div(sum(1 for p in predictions if p), len(predictions))
+    EVALUATION_SAMPLES["anomaly_detector"] = {"label": np.concatenate(labels), "alert": np.concatenate(alerts)}
+    pr_curve = []
+    for name, tp, count in zip(names, swept_tp.tolist(), swept_flagged.tolist()):
+        precision, recall = safe_div(tp, count), safe_div(tp, positives)
+        pr_curve.append({
+            "threshold": name,
+            "precision": round(precision, 4),
+            "recall": round(recall, 4),
+            "alert_rate": round(safe_div(count, samples), 4),
+            "f1": round(safe_div(2 * precision * recall, precision + recall), 4),
+        })
     return {
-        "samples": len(labels),
-        "precision": round(precision, 4),
-        "recall": round(recall, 4),
-        "alert_rate": round(alert_rate, 4),
+        "samples": samples,
+        "precision": round(safe_div(flagged_tp, flagged), 4),
+        "recall": round(safe_div(flagged_tp, positives), 4),
+        "alert_rate": round(safe_div(flagged, samples), 4),
+        "pr_curve": pr_curve,
+        "best_threshold": max(pr_curve, key=lambda point: point["f1"])["threshold"],
     }
 
 
+def parse_row_count(text: str) -> int:
+    """Row count from a CLI value such as ``50000``, ``200k``, ``1.5m`` or ``1_000_000``; usable as an argparse ``type``."""
+    value = text.strip().lower().replace("_", "")
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    try:
+        rows = int(float(value[:-1] if multiplier > 1 else value) * multiplier)
+    except (ValueError, OverflowError):
+        raise argparse.ArgumentTypeError(f"invalid row count: {text!r} (use e.g. 50000, 200k or 1.5m)") from None
+    if rows < 1:
+        raise argparse.ArgumentTypeError(f"row count must be at least 1: {text!r}")
+    return rows
+
+
+def add_training_arguments(parser: argparse.ArgumentParser) -> None:
+    """Dataset, training and evaluation flags shared by this script and pipeline.py."""
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rebuild cleaned datasets from the raw sources instead of using the Parquet cache.",
+    )
+    parser.add_argument(
+        "--ingest-workers",
+        type=int,
+        default=INGEST_WORKERS,
+        help="Threads used to read and clean dataset sources concurrently (1 = sequential).",
+    )
+    parser.add_argument(
+        "--csv-engine",
+        default=CSV_ENGINE,
+        choices=["c", "pyarrow"],
+        help="pandas CSV parser used for dataset sources.",
+    )
+    parser.add_argument(
+        "--stream-chunk-rows",
+        type=int,
+        default=STREAM_CHUNK_ROWS,
+        help="Stream spending sources in chunks of this many rows and fit the forecaster from per-period totals (bounded memory, approximate clipping).",
+    )
+    parser.add_argument(
+        "--incremental",
+        type=Path,
+        help="Fold new transactions from this CSV into the saved categorizer state instead of retraining.",
+    )
+    parser.add_argument(
+        "--anomaly-sketch-error",
+        type=float,
+        default=ANOMALY_SKETCH_ERROR,
+        help="Build anomaly-detector statistics from mergeable quantile sketches with this rank error (e.g. 0.001).",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=BOOTSTRAP_RESAMPLES,
+        help="Bootstrap each holdout this many times and report 95%% intervals for every metric.",
+    )
+    parser.add_argument(
+        "--cv",
+        type=int,
+        default=CV_FOLDS,
+        help="Also report mean/std over this many cross-validation folds (rolling-origin or k-fold).",
+    )
+    parser.add_argument(
+        "--granularity",
+        default=SEASONAL_GRANULARITY,
+        choices=["month", "week", "day"],
+        help="Spending seasonality: month-of-year only, plus week-of-year (week), plus day-of-week (day).",
+    )
+    parser.add_argument(
+        "--artifact-format",
+        default=ARTIFACT_FORMAT,
+        choices=["ts", "compact"],
+        help="compact: quantized categorizer JSON under frontend/public/models, fetched lazily by the app.",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Retrain every selected model even when its build cache entry is current.",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Record per-stage peak memory with tracemalloc in the report timings (slower).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write a cProfile dump per training stage to backend/training/reports/profiles.",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=DATASET_MANIFEST,
+        help="Dataset manifest mapping Kaggle dataset names to local directories (written by pipeline download or synthetic_data.py).",
+    )
+
+
+def apply_training_arguments(args: argparse.Namespace) -> None:
+    """Copy the ``add_training_arguments`` flags into the module settings."""
+    global ANOMALY_SKETCH_ERROR, ARTIFACT_FORMAT, BOOTSTRAP_RESAMPLES, CSV_ENGINE, CV_FOLDS, DATASET_CACHE_ENABLED
+    global DATASET_MANIFEST, INGEST_WORKERS, MODEL_CACHE_ENABLED, PROFILE_DIR, SEASONAL_GRANULARITY
+    global STAGE_TRACE_MEMORY, STREAM_CHUNK_ROWS
+    DATASET_MANIFEST = args.manifest
+    STAGE_TRACE_MEMORY = args.trace_memory
+    PROFILE_DIR = REPORTS_DIR / "profiles" if args.profile else None
+    ARTIFACT_FORMAT = args.artifact_format
+    MODEL_CACHE_ENABLED = not args.rebuild
+    SEASONAL_GRANULARITY = args.granularity
+    ANOMALY_SKETCH_ERROR = args.anomaly_sketch_error
+    BOOTSTRAP_RESAMPLES = max(0, args.bootstrap)
+    CV_FOLDS = max(0, args.cv)
+    CSV_ENGINE = args.csv_engine
+    STREAM_CHUNK_ROWS = args.stream_chunk_rows
+    DATASET_CACHE_ENABLED = not args.no_cache
+    INGEST_WORKERS = max(1, args.ingest_workers)
+
+
 def main() -> None:
+    global DATASET_PATHS
     parser = argparse.ArgumentParser(description="Train UniGuard AI models.")
     parser.add_argument(
         "--model",
@@ -1396,8 +3612,12 @@ def main() -> None:
         action="store_true",
         help="Export cleaned datasets for the selected model.",
     )
+    add_training_arguments(parser)
     args = parser.parse_args()
 
+    apply_training_arguments(args)
+    DATASET_PATHS = resolve_dataset_paths()
+
     ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -1407,6 +3627,10 @@ def main() -> None:
         print("Cleaned data written to:", export_dir)
         return
 
+    if args.incremental is not None:
+        run_incremental_training(args.incremental)
+        return
+
     run_training(args.model)
 
 
@@ -1,2 +1,4 @@
 export const trainedSeasonality = {'Communication': {1: 1.015, 2: 0.733, 3: 0.872, 4: 0.816, 5: 1.049, 6: 0.609, 7: 0.909, 8: 1.251, 9: 1.099, 10: 1.081, 11: 1.017, 12: 1.549}, 'Eating Out': {1: 1.079, 2: 0.879, 3: 1.124, 4: 1.489, 5: 1.094, 6: 1.043, 7: 1.011, 8: 0.597, 9: 1.155, 10: 0.717, 11: 0.631, 12: 1.181}, 'Food': {1: 0.941, 2: 0.974, 3: 1.131, 4: 1.228, 5: 0.915, 6: 0.88, 7: 0.942, 8: 0.918, 9: 1.045, 10: 0.895, 11: 0.958, 12: 1.173}, 'Health': {1: 1.773, 2: 0.348, 3: 0.865, 4: 0.713, 5: 1.417, 6: 0.076, 7: 1.895, 9: 0.293, 10: 1.952, 11: 1.154, 12: 0.516}, 'Miscellaneous': {1: 0.67, 2: 1.257, 3: 0.724, 4: 0.617, 5: 1.19, 6: 0.491, 7: 0.913, 8: 1.352, 9: 1.525, 10: 1.137, 11: 1.162, 12: 0.96}, 'Shopping': {1: 0.749, 2: 0.296, 3: 1.206, 4: 1.182, 5: 0.669, 6: 1.268, 7: 1.327, 8: 0.586, 9: 2.254, 10: 1.491, 11: 0.06, 12: 0.912}, 'Transport': {1: 0.626, 2: 1.152, 3: 1.386, 4: 1.139, 5: 0.836, 6: 1.288, 7: 2.02, 8: 0.607, 9: 0.806, 10: 0.83, 11: 0.745, 12: 0.564}} as const;
 export const trainedAverages = {'Communication': 182.57, 'Eating Out': 698.38, 'Food': 226.2, 'Health': 940.97, 'Miscellaneous': 417.48, 'Shopping': 2209.04, 'Transport': 122.95} as const;
+export const trainedWeekOfYearSeasonality = {} as const;
+export const trainedDayOfWeekSeasonality = {} as const;
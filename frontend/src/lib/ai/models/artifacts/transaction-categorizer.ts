@@ -2,3 +2,4 @@ export const trainedCategoryKeywords = {'Communication': ['phone', 'phone_compan
 export const trainedCategoryTokenWeights = {'Communication': {'phone': 0.3381, 'phone_company': 0.3381, 'internet': 0.3381, 'service': 0.3381, 'provider': 0.3381, 'internet_service': 0.3381, 'service_provider': 0.3381, 'airtime': 0.15, 'data': 0.145, 'bundle': 0.14, 'mtn': 0.135, 'airtel': 0.13, 'africell': 0.125, 'lycamobile': 0.12, 'topup': 0.115, 'top_up': 0.11, 'mobile': 0.105, 'sim': 0.1, 'broadband': 0.095, 'wifi': 0.09, 'calling': 0.085}, 'Debt Payments': {'loan': 0.15, 'repayment': 0.145, 'debt': 0.14, 'emi': 0.135, 'installment': 0.13, 'credit_card': 0.125, 'overdraft': 0.12, 'borrow': 0.115, 'lending': 0.11, 'saccos': 0.105, 'mobile_money_loan': 0.1}, 'Eating Out': {'restaurant': 0.3069, 'starbucks': 0.2344, 'brewing': 0.1643, 'brewing_company': 0.1643, 'american': 0.1328, 'tavern': 0.1328, 'american_tavern': 0.1328, 'brunch': 0.0727, 'brunch_restaurant': 0.0727, 'thai': 0.0673, 'thai_restaurant': 0.0673, 'fancy': 0.0485, 'fancy_restaurant': 0.0485, 'place': 0.0485, 'greek': 0.0458, 'greek_restaurant': 0.0458, 'pizza': 0.0431, 'pizza_place': 0.0431, 'chick': 0.0296, 'fil': 0.0296, 'chick_fil': 0.0296, 'mexican': 0.0269, 'mexican_restaurant': 0.0269, 'italian': 0.0162, 'italian_restaurant': 0.0162, 'irish': 0.0162, 'deli': 0.0135, 'roadside': 0.0135, 'diner': 0.0135, 'roadside_diner': 0.0135, 'bbq': 0.0135, 'bbq_restaurant': 0.0135, 'bojangles': 0.0135, 'tiny': 0.0081, 'tiny_deli': 0.0081, 'belgian': 0.0081, 'belgian_restaurant': 0.0081, 'liquor': 0.0081, 'liquor_store': 0.0081, 'wendy': 0.0081, 'sushi': 0.0081, 'sushi_restaurant': 0.0081, 'irish_restaurant': 0.0081, 'pub': 0.0081, 'irish_pub': 0.0081, 'japanese': 0.0081, 'japanese_restaurant': 0.0081, 'mediterranean': 0.0081, 'mediterranean_restaurant': 0.0081, 'latin': 0.0081, 'latin_restaurant': 0.0081, 'chili': 0.0081, 'vietnamese': 0.0081, 'vietnamese_restaurant': 0.0081, 'seafood': 0.0069, 'seafood_restaurant': 0.0069, 'german': 0.0054, 'german_restaurant': 0.0054, 'bakery': 0.0054, 'bakery_place': 0.0054, 'hawaiian': 0.0054, 'grill': 0.0054, 'hawaiian_grill': 0.0054, 'new': 0.0054, 'york': 0.0054, 'new_york': 0.0054, 'york_deli': 0.0054, 'steakhouse': 0.0054, 'cafe': 0.15, 'kfc': 0.145, 'mcdonald': 0.14, 'burger': 0.135, 'takeaway': 0.13, 'delivery': 0.125, 'dining': 0.12, 'lunch': 0.115, 'dinner': 0.11, 'breakfast': 0.105, 'chicken': 0.1, 'chips': 0.095, 'junk': 0.09, 'canteen': 0.085, 'hotel_meal': 0.08, 'catering': 0.075}, 'Entertainment': {'spotify': 0.9161, 'netflix': 0.8725, 'movie': 0.2181, 'theater': 0.2181, 'movie_theater': 0.2181, 'video': 0.0872, 'amazon_video': 0.0872, 'amazon': 0.0742, 'cinema': 0.15, 'concert': 0.145, 'game': 0.14, 'gaming': 0.135, 'streaming': 0.13, 'showmax': 0.125, 'youtube': 0.12, 'disney': 0.115, 'prime_video': 0.11, 'music': 0.105}, 'Food': {'grocery': 0.8625, 'grocery_store': 0.8625, 'blue': 0.0084, 'sky': 0.0084, 'market': 0.0084, 'blue_sky': 0.0084, 'sky_market': 0.0084, 'food': 0.0084, 'truck': 0.0084, 'food_truck': 0.0084, 'seafood': 0.0071, 'restaurant': 0.0071, 'seafood_restaurant': 0.0071, 'american': 0.0071, 'tavern': 0.0071, 'american_tavern': 0.0071, 'supermarket': 0.15, 'beans': 0.145, 'rice': 0.14, 'maize': 0.135, 'flour': 0.13, 'oil': 0.125, 'sugar': 0.12, 'vegetables': 0.115, 'fruits': 0.11, 'walmart': 0.105, 'tesco': 0.1, 'nakumatt': 0.095, 'shoprite': 0.09, 'tuskys': 0.085}, 'Income': {'biweekly': 0.9016, 'paycheck': 0.9016, 'biweekly_paycheck': 0.9016, 'salary': 0.15, 'wage': 0.145, 'bonus': 0.14, 'freelance': 0.135, 'dividend': 0.13, 'interest': 0.125, 'stipend': 0.12, 'allowance': 0.115, 'payment_received': 0.11, 'deposit_income': 0.105, 'payroll': 0.1}, 'Rent': {'mortgage': 2.7047, 'rent': 0.15, 'landlord': 0.145, 'lease': 0.14, 'apartment': 0.135, 'accommodation': 0.13, 'housing': 0.125, 'room': 0.12, 'premises': 0.115}, 'Shopping': {'amazon': 0.7537, 'hardware': 0.5109, 'hardware_store': 0.5109, 'best': 0.0601, 'buy': 0.0601, 'best_buy': 0.0601, 'mike': 0.0301, 'construction': 0.0301, 'mike_construction': 0.0301, 'target': 0.015, 'ebay': 0.15, 'mall': 0.145, 'store': 0.14, 'retail': 0.135, 'clothing': 0.13, 'shoes': 0.125, 'electronics': 0.12, 'jumia': 0.115, 'konga': 0.11, 'alibaba': 0.105}, 'Transport': {'shell': 1.4319, 'quiktrip': 0.3978, 'valero': 0.1591, 'station': 0.0796, 'gas_station': 0.0796, 'chevron': 0.0796, 'mart': 0.0796, 'circle': 0.0796, 'conoco': 0.0796, 'exxon': 0.0796, 'sheetz': 0.0796, 'gas': 0.0676, 'uber': 0.15, 'bolt': 0.145, 'taxi': 0.14, 'boda': 0.135, 'bodaboda': 0.13, 'safeboda': 0.125, 'matatu': 0.12, 'farasi': 0.115, 'fuel': 0.11, 'petrol': 0.105, 'total': 0.1, 'parking': 0.095, 'toll': 0.09, 'bus': 0.085, 'train': 0.08, 'airline': 0.075, 'flight': 0.07, 'booking': 0.065}, 'Utilities': {'gas_company': 0.2459, 'city': 0.2459, 'water': 0.2459, 'city_water': 0.2459, 'water_charges': 0.2459, 'power': 0.2459, 'power_company': 0.2459, 'gas': 0.209, 'umeme': 0.15, 'nwsc': 0.145, 'yaka': 0.14, 'electricity': 0.135, 'utility': 0.13, 'prepaid': 0.125, 'postpaid': 0.12, 'meter': 0.115}, 'Coffee': {'coffee': 0.15, 'cafe': 0.145, 'espresso': 0.14, 'latte': 0.135, 'cappuccino': 0.13, 'starbucks': 0.125, 'java': 0.12, 'barista': 0.115, 'tea': 0.11, 'brew': 0.105}, 'Health': {'pharmacy': 0.15, 'clinic': 0.145, 'hospital': 0.14, 'doctor': 0.135, 'medicine': 0.13, 'drugs': 0.125, 'lab': 0.12, 'checkup': 0.115, 'gym': 0.11, 'fitness': 0.105, 'medical': 0.1, 'health': 0.095, 'insurance_health': 0.09, 'diagnosis': 0.085}, 'Education': {'school': 0.15, 'fees': 0.145, 'tuition': 0.14, 'university': 0.135, 'college': 0.13, 'books': 0.125, 'stationery': 0.12, 'exam': 0.115, 'registration': 0.11, 'semester': 0.105, 'course': 0.1, 'training': 0.095, 'workshop': 0.09}, 'Insurance': {'insurance': 0.15, 'premium': 0.145, 'policy': 0.14, 'claim': 0.135, 'auto_insurance': 0.13, 'health_insurance': 0.125, 'life_insurance': 0.12}, 'Savings': {'savings': 0.15, 'deposit': 0.145, 'fixed': 0.14, 'investment': 0.135, 'village_savings': 0.13, 'vsla': 0.125, 'piggy': 0.12, 'emergency_fund': 0.115}, 'Gifts / Donations': {'donation': 0.15, 'charity': 0.145, 'church': 0.14, 'tithe': 0.135, 'offering': 0.13, 'gift': 0.125, 'send_money': 0.12, 'remittance': 0.115, 'mpesa': 0.11, 'mobile_money': 0.105, 'send': 0.1, 'received_money': 0.095}, 'Personal Care': {'salon': 0.15, 'barber': 0.145, 'haircut': 0.14, 'spa': 0.135, 'cosmetics': 0.13, 'toiletries': 0.125, 'skincare': 0.12, 'grooming': 0.115, 'beauty': 0.11}, 'Travel': {'flight': 0.15, 'airline': 0.145, 'hotel': 0.14, 'airbnb': 0.135, 'booking': 0.13, 'vacation': 0.125, 'trip': 0.12, 'tourism': 0.115, 'visa': 0.11, 'passport': 0.105, 'lodging': 0.1}, 'Tech': {'software': 0.15, 'subscription': 0.145, 'saas': 0.14, 'app': 0.135, 'apple': 0.13, 'microsoft': 0.125, 'google_play': 0.12, 'antivirus': 0.115, 'cloud': 0.11, 'hosting': 0.105, 'domain': 0.1}, 'Miscellaneous': {'other': 0.15, 'miscellaneous': 0.145, 'unknown': 0.14, 'cash': 0.135, 'withdrawal': 0.13, 'atm': 0.125}} as const;
 export const trainedCategoryWeights = {'Communication': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Debt Payments': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Eating Out': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Entertainment': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Food': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Income': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.2, 'isMedium': 0.4}, 'Rent': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.2, 'isMedium': 0.4}, 'Shopping': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Transport': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Utilities': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Travel': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Personal Care': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Health': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Tech': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Gifts / Donations': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Insurance': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Coffee': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Miscellaneous': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Education': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}, 'Savings': {'amount': 0.1, 'isLarge': 0.2, 'isSmall': 0.6, 'isMedium': 0.4}} as const;
 export const trainedCategoryPriors = {'Debt Payments': 0.1625553704, 'Eating Out': 0.1625553704, 'Food': 0.1304506848, 'Shopping': 0.1219165278, 'Utilities': 0.0768074125, 'Transport': 0.0633965945, 'Entertainment': 0.0585199334, 'Income': 0.0560816028, 'Communication': 0.0512049417, 'Rent': 0.0256024708, 'Travel': 0.0090909091, 'Personal Care': 0.0090909091, 'Health': 0.0090909091, 'Tech': 0.0090909091, 'Gifts / Donations': 0.0090909091, 'Insurance': 0.0090909091, 'Coffee': 0.0090909091, 'Miscellaneous': 0.0090909091, 'Education': 0.0090909091, 'Savings': 0.0090909091} as const;
+export const trainedCategoryCompactArtifact: string | null = null;
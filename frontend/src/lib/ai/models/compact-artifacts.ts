@@ -0,0 +1,86 @@
+/**
+ * Compact Model Artifacts
+ * Lazily fetches quantized artifacts written by `train_models.py --artifact-format compact`
+ */
+
+export interface CategorizerArtifact {
+  keywords: Record<string, string[]>;
+  tokenWeights: Record<string, Record<string, number>>;
+  weights: Record<string, Record<string, number>>;
+  priors: Record<string, number>;
+}
+
+interface CompactManifest {
+  version: number;
+  models: Record<string, { file: string; bytes: number; sha256: string }>;
+}
+
+interface CompactCategorizerPayload {
+  format: "transaction_categorizer";
+  version: number;
+  vocabulary: string[];
+  categories: string[];
+  tokenIds: string;
+  tokenWeights: string;
+  tokenOffsets: number[];
+  tokenScales: number[];
+  keywordIds: string;
+  keywordOffsets: number[];
+  weights: Array<Record<string, number>>;
+  priors: Array<number | null>;
+}
+
+const COMPACT_ARTIFACT_VERSION = 1;
+const MODELS_BASE_URL = `${import.meta.env.BASE_URL}models/`;
+
+/** Decode a base64 little-endian uint16 array. */
+function decodeUint16(encoded: string): Uint16Array {
+  const binary = atob(encoded);
+  const values = new Uint16Array(binary.length >> 1);
+  for (let i = 0; i < values.length; i += 1) {
+    values[i] = binary.charCodeAt(2 * i) | (binary.charCodeAt(2 * i + 1) << 8);
+  }
+  return values;
+}
+
+async function fetchJson<T>(url: string): Promise<T | null> {
+  const response = await fetch(url);
+  return response.ok ? ((await response.json()) as T) : null;
+}
+
+/**
+ * Fetch and expand the compact categorizer artifact into the shapes of the
+ * bundled `trainedCategory*` exports. Resolves to null when it is unavailable.
+ */
+export async function loadCategorizerArtifact(baseUrl = MODELS_BASE_URL): Promise<CategorizerArtifact | null> {
+  const manifest = await fetchJson<CompactManifest>(`${baseUrl}manifest.json`);
+  const entry = manifest?.models?.transaction_categorizer;
+  if (!entry || manifest.version !== COMPACT_ARTIFACT_VERSION) return null;
+  const payload = await fetchJson<CompactCategorizerPayload>(`${baseUrl}${entry.file}`);
+  if (!payload || payload.version !== COMPACT_ARTIFACT_VERSION) return null;
+
+  const tokenIds = decodeUint16(payload.tokenIds);
+  const tokenWeights = decodeUint16(payload.tokenWeights);
+  const keywordIds = decodeUint16(payload.keywordIds);
+  const artifact: CategorizerArtifact = { keywords: {}, tokenWeights: {}, weights: {}, priors: {} };
+
+  payload.categories.forEach((category, index) => {
+    const scale = payload.tokenScales[index];
+    const categoryWeights: Record<string, number> = {};
+    for (let i = payload.tokenOffsets[index]; i < payload.tokenOffsets[index + 1]; i += 1) {
+      categoryWeights[payload.vocabulary[tokenIds[i]]] = tokenWeights[i] * scale;
+    }
+    if (payload.tokenOffsets[index + 1] > payload.tokenOffsets[index]) {
+      artifact.tokenWeights[category] = categoryWeights;
+    }
+    const keywords: string[] = [];
+    for (let i = payload.keywordOffsets[index]; i < payload.keywordOffsets[index + 1]; i += 1) {
+      keywords.push(payload.vocabulary[keywordIds[i]]);
+    }
+    if (keywords.length > 0) artifact.keywords[category] = keywords;
+    if (Object.keys(payload.weights[index]).length > 0) artifact.weights[category] = payload.weights[index];
+    const prior = payload.priors[index];
+    if (prior !== null && prior !== undefined) artifact.priors[category] = prior;
+  });
+  return artifact;
+}
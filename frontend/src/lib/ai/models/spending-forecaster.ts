@@ -4,7 +4,12 @@
  */
 
 import type { TrainingTransaction } from "../training-data";
-import { trainedAverages, trainedSeasonality } from "./artifacts/spending-forecaster";
+import {
+  trainedAverages,
+  trainedDayOfWeekSeasonality,
+  trainedSeasonality,
+  trainedWeekOfYearSeasonality,
+} from "./artifacts/spending-forecaster";
 
 export interface SpendingForecast {
   predictedAmount: number;
@@ -18,6 +23,13 @@ export interface SpendingForecast {
   dataQuality?: "low" | "medium" | "high";
 }
 
+// Trained with --granularity week/day; empty tables fall back to the month factor
+const weekOfYearSeasonality: Record<string, Record<number, number>> = trainedWeekOfYearSeasonality;
+const dayOfWeekSeasonality: Record<string, Record<number, number>> = trainedDayOfWeekSeasonality;
+// Horizons shorter than a month use week-of-year factors, shorter than a week also day-of-week factors
+const SHORT_HORIZON_DAYS = 28;
+const DAY_HORIZON_DAYS = 7;
+
 function clamp(value: number, min: number, max: number) {
   return Math.min(Math.max(value, min), max);
 }
@@ -32,6 +44,38 @@ function winsorize(values: number[], lowerPct = 0.05, upperPct = 0.95) {
   return values.map((value) => Math.min(Math.max(value, lower), upper));
 }
 
+/** ISO 8601 week number (1-53), as pandas isocalendar() in the trainer */
+function isoWeek(date: Date) {
+  const day = new Date(Date.UTC(date.getFullYear(), date.getMonth(), date.getDate()));
+  const weekday = day.getUTCDay() || 7;
+  day.setUTCDate(day.getUTCDate() + 4 - weekday);
+  const yearStart = new Date(Date.UTC(day.getUTCFullYear(), 0, 1));
+  return Math.ceil(((day.getTime() - yearStart.getTime()) / (24 * 60 * 60 * 1000) + 1) / 7);
+}
+
+/**
+ * Trained seasonal factor for the next `daysInPeriod` days.
+ * Month-of-year by default; short horizons use the week-of-year factor and,
+ * under a week, the mean day-of-week factor of the days covered.
+ */
+function trainedSeasonalFactor(category: string, daysInPeriod: number, now: Date = new Date()) {
+  const monthly = trainedSeasonality[category]?.[now.getMonth() + 1];
+  let factor = monthly;
+  if (daysInPeriod < SHORT_HORIZON_DAYS) {
+    factor = weekOfYearSeasonality[category]?.[isoWeek(now)] ?? monthly;
+  }
+  const daily = dayOfWeekSeasonality[category];
+  if (daysInPeriod < DAY_HORIZON_DAYS && daily) {
+    const days = Math.max(1, Math.round(daysInPeriod));
+    let total = 0;
+    for (let offset = 0; offset < days; offset++) {
+      total += daily[(now.getDay() + offset) % 7] ?? 1.0;
+    }
+    factor = (factor ?? 1.0) * (total / days);
+  }
+  return factor;
+}
+
 /**
  * Simulated trained LSTM model for spending forecasting
  * Uses historical patterns to predict future spending
@@ -58,9 +102,7 @@ export function forecastSpending(
     const remaining = safeAllocated - safeSpent;
     const daysUntilDepletion = dailySpending > 0 ? remaining / dailySpending : daysInPeriod;
     const safeDays = Math.max(0, Math.round(daysUntilDepletion));
-    const month = new Date().getMonth() + 1;
-    const trainedSeason = trainedSeasonality[category]?.[month];
-    const seasonalFactor = trainedSeason ?? 1.0;
+    const seasonalFactor = trainedSeasonalFactor(category, daysInPeriod) ?? 1.0;
     return {
       predictedAmount: Math.max(fallbackMonthly, 0),
       confidenceInterval: {
@@ -130,7 +172,7 @@ export function forecastSpending(
     0: 1.1,  // January - new year
     9: 1.05, // October - pre-holiday
   };
-  const trainedSeason = trainedSeasonality[category]?.[currentMonth + 1];
+  const trainedSeason = trainedSeasonalFactor(category, daysInPeriod);
   const seasonalFactor = trainedSeason ?? (seasonalMultipliers[currentMonth] || 1.0);
   predictedAmount *= seasonalFactor;
 
@@ -5,11 +5,13 @@
 
 import { extractTransactionFeatures, type TrainingTransaction } from "../training-data";
 import {
+  trainedCategoryCompactArtifact,
   trainedCategoryKeywords,
   trainedCategoryPriors,
   trainedCategoryTokenWeights,
   trainedCategoryWeights,
 } from "./artifacts/transaction-categorizer";
+import { loadCategorizerArtifact } from "./compact-artifacts";
 
 export interface CategorizationResult {
   category: string;
@@ -315,6 +317,37 @@ const mergedCategoryTokenWeights: Record<string, Record<string, number>> = {
   ...trainedCategoryTokenWeights,
 };
 
+const mergedCategoryPriors: Record<string, number> = {
+  ...trainedCategoryPriors,
+};
+
+let compactArtifactLoad: Promise<boolean> | null = null;
+
+/**
+ * Merge the lazily fetched compact artifact (if the build emitted one) into the
+ * trained tables. Until it resolves, scoring uses the built-in keyword lexicon.
+ */
+export function loadCompactCategorizerArtifact(): Promise<boolean> {
+  if (!trainedCategoryCompactArtifact) return Promise.resolve(false);
+  if (!compactArtifactLoad) {
+    compactArtifactLoad = loadCategorizerArtifact()
+      .then((artifact) => {
+        if (!artifact) return false;
+        Object.assign(mergedKeywordSets, mergeKeywordSets(categoryKeywords, artifact.keywords));
+        Object.assign(mergedCategoryWeights, artifact.weights);
+        Object.assign(mergedCategoryTokenWeights, artifact.tokenWeights);
+        Object.assign(mergedCategoryPriors, artifact.priors);
+        return true;
+      })
+      .catch(() => false);
+  }
+  return compactArtifactLoad;
+}
+
+if (typeof window !== "undefined") {
+  void loadCompactCategorizerArtifact();
+}
+
 function extractTokens(text: string) {
   return normalizeText(text)
     .split(" ")
@@ -494,8 +527,8 @@ export function categorizeTransaction(
       score += Math.log(prior) * priorWeight;
     }
 
-    if (userSignals.totalCount < MIN_HISTORY && trainedCategoryPriors[category]) {
-      const trainedPrior = Math.max(trainedCategoryPriors[category], 0.0001);
+    if (userSignals.totalCount < MIN_HISTORY && mergedCategoryPriors[category]) {
+      const trainedPrior = Math.max(mergedCategoryPriors[category], 0.0001);
       score += Math.log(trainedPrior) * 0.12;
     }
 